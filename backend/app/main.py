@@ -8,6 +8,7 @@ from observability import (TracingMiddleware, initialize_metrics,
 
 from .api import api_router
 from .core.config import get_settings
+from .services.crawlers import BaseCrawler
 from .services.scheduler import scheduler
 
 # 설정 가져오기
@@ -172,8 +173,9 @@ async def startup_event() -> None:
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
-    """애플리케이션 종료 시 스케줄러 중지"""
+    """애플리케이션 종료 시 스케줄러 중지 및 공유 HTTP 클라이언트 정리"""
     scheduler.stop()
+    await BaseCrawler.close_client()
     logger.info("show-me-the-money API stopped")
 
 
@@ -1,14 +1,23 @@
 """기본 크롤러 인터페이스"""
+import asyncio
+import logging
 from abc import ABC, abstractmethod
 from inspect import isawaitable
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
+import httpx
 from app.models.etf import ETF
 
+logger = logging.getLogger(__name__)
+
 
 class BaseCrawler(ABC):
     """모든 ETF 크롤러의 기본 인터페이스"""
     
+    # 모든 크롤러가 공유하는 HTTP 클라이언트 (커넥션 풀/TLS 세션 재사용)
+    _client: Optional[httpx.AsyncClient] = None
+    _client_loop: Optional[asyncio.AbstractEventLoop] = None
+    
     def __init__(self):
         self.provider_name: str = self.__class__.__name__.replace("Crawler", "")
     
@@ -51,3 +60,89 @@ class BaseCrawler(ABC):
     def get_provider_name(self) -> str:
         """운용사 이름을 반환합니다."""
         return self.provider_name
+    
+    @classmethod
+    async def _get_client(cls) -> httpx.AsyncClient:
+        """
+        크롤러 간에 공유하는 httpx.AsyncClient를 반환합니다.
+        
+        최초 호출 시 생성하며, 닫혔거나 다른 이벤트 루프에서 생성된 경우 새로 만듭니다.
+        
+        Returns:
+            공유 httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        client = BaseCrawler._client
+        if client is None or client.is_closed or BaseCrawler._client_loop is not loop:
+            stale = client if client is not None and not client.is_closed else None
+            client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+                timeout=httpx.Timeout(30.0),
+                follow_redirects=True,
+            )
+            # 새 클라이언트를 먼저 등록해야 정리(await) 중 동시 호출이 클라이언트를 또 만들지 않음
+            BaseCrawler._client = client
+            BaseCrawler._client_loop = loop
+            if stale is not None:
+                # 이전 루프에서 만든 클라이언트의 커넥션 풀 정리
+                await cls._close_stale_client(stale)
+        return client
+    
+    @staticmethod
+    async def _close_stale_client(client: httpx.AsyncClient) -> None:
+        """
+        다른 이벤트 루프에서 만든 클라이언트를 닫습니다.
+
+        이전 루프가 이미 닫혔으면 소켓 정리 중 RuntimeError가 날 수 있으나,
+        aclose()는 먼저 클라이언트를 닫힘 상태로 바꾸므로 커넥션 풀은 더 이상 사용되지 않습니다.
+        """
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug(f"Failed to close stale HTTP client cleanly: {e}")
+
+    async def _fetch_urls(
+        self,
+        urls: List[str],
+        max_concurrency: int = 32,
+        headers: Optional[Dict[str, str]] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> List[Any]:
+        """
+        여러 URL을 동시에 가져옵니다.
+
+        Args:
+            urls: 가져올 URL 리스트
+            max_concurrency: 동시에 진행할 최대 요청 수
+            headers: 요청마다 보낼 추가 헤더
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
+
+        Returns:
+            URL 순서대로 응답 본문(str) 또는 발생한 예외
+        """
+        if client is None:
+            client = await self._get_client()
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def one(url: str) -> str:
+            async with sem:
+                response = await client.get(url, headers=headers)
+                response.raise_for_status()
+                return response.text
+
+        return await asyncio.gather(*[one(url) for url in urls], return_exceptions=True)
+
+    @classmethod
+    async def close_client(cls) -> None:
+        """공유 httpx.AsyncClient를 닫습니다. (애플리케이션 종료 시 호출)"""
+        client = BaseCrawler._client
+        client_loop = BaseCrawler._client_loop
+        BaseCrawler._client = None
+        BaseCrawler._client_loop = None
+        if client is None or client.is_closed:
+            return
+        if client_loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            await cls._close_stale_client(client)
@@ -1,22 +1,89 @@
 """FirstTrust ETF Crawler"""
 import logging
+import re
 from datetime import date, datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from io import BytesIO
 from typing import Any, List, Optional
 
-import httpx
 from app.models.etf import ETF, DistributionFrequency
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .base import BaseCrawler
 from .yfinance_enricher import enrich_etf_with_yfinance
 
 logger = logging.getLogger(__name__)
 
+# 값이 없음을 나타내는 셀 텍스트
+_INVALID = frozenset({"", "-------", "--", "N/A"})
+_PRICE_STRIP = re.compile(r"[\$,]")
+_PCT_STRIP = re.compile(r"%")
+_DATE_FMT = "%m/%d/%y"
+
+# 헤더에서 찾을 컬럼 키 (Fund Name, Ticker, Inception, NAV, 30-Day SEC Yield 순)
+_COLUMN_KEYS = ("fund", "ticker", "inception", "nav", "yield")
+_DEFAULT_COLUMNS = (0, 1, 2, 3, 4)
+
+
+# 셀 문자열 파서: 같은 값이 여러 행에 반복되므로 결과를 캐시 (Decimal/date는 불변)
+@lru_cache(maxsize=8192)
+def _parse_date(date_str: str) -> Optional[date]:
+    """Parse date string in MM/DD/YY format"""
+    if not date_str or date_str in _INVALID:
+        return None
+
+    try:
+        # Format: 05/18/16 (고정 폭이면 strptime 없이 슬라이싱으로 처리)
+        if len(date_str) == 8 and date_str[2] == "/" and date_str[5] == "/":
+            year = int(date_str[6:8])
+            # strptime %y 규칙과 동일: 00-68 → 20xx, 69-99 → 19xx
+            year += 2000 if year < 69 else 1900
+            return date(year, int(date_str[:2]), int(date_str[3:5]))
+        return datetime.strptime(date_str, _DATE_FMT).date()
+    except (ValueError, AttributeError):
+        logger.warning(f"Failed to parse date: {date_str}")
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _parse_price(price_str: str) -> Optional[Decimal]:
+    """Parse price string like '$30.12'"""
+    if not price_str or price_str in _INVALID:
+        return None
+
+    try:
+        # Remove $ and , and convert to Decimal
+        return Decimal(_PRICE_STRIP.sub("", price_str))
+    except (InvalidOperation, ValueError, TypeError):
+        logger.warning(f"Failed to parse price: {price_str}")
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _parse_percentage(pct_str: str) -> Optional[Decimal]:
+    """Parse percentage string like '2.31%'"""
+    if not pct_str or pct_str in _INVALID:
+        return None
+
+    try:
+        # Remove % and convert to Decimal
+        value = Decimal(_PCT_STRIP.sub("", pct_str))
+        return round(value, 2)
+    except (InvalidOperation, ValueError, TypeError):
+        logger.warning(f"Failed to parse percentage: {pct_str}")
+        return None
+
 
 class FirstTrustCrawler(BaseCrawler):
     """Crawler for First Trust ETFs"""
 
+    # 행/셀 탐색용 XPath (클래스 로드 시 한 번만 컴파일)
+    _CELL_XPATH = etree.XPath("./td")
+    _HEADER_CELL_XPATH = etree.XPath("./th|./td")
+    _LINK_XPATH = etree.XPath(".//a[1]")
+    _TEXT_XPATH = etree.XPath("string()", smart_strings=False)
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.ftportfolios.com"
@@ -25,12 +92,10 @@ class FirstTrustCrawler(BaseCrawler):
     async def fetch_data(self) -> Optional[str]:
         """Fetch HTML page containing ETF data"""
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True, timeout=30.0
-            ) as client:
-                response = await client.get(self.etf_list_url)
-                response.raise_for_status()
-                return response.text
+            client = await self._get_client()
+            response = await client.get(self.etf_list_url)
+            response.raise_for_status()
+            return response.text
         except Exception as e:
             logger.error(f"Failed to fetch First Trust ETF data: {e}")
             return None
@@ -40,21 +105,55 @@ class FirstTrustCrawler(BaseCrawler):
         if not html_content:
             return []
 
-        soup = BeautifulSoup(html_content, "html.parser")
-        etfs = []
+        # 1단계: searchResults 테이블의 행을 스트리밍으로 읽어 셀 텍스트만 추출
+        # (처리한 행은 바로 해제하여 전체 DOM을 메모리에 유지하지 않음)
+        raw_rows = []
+        tables = []  # 열린 table마다 [searchResults 여부, 지금까지 본 행 수, 컬럼 인덱스]
+        table_count = 0
+        context = etree.iterparse(
+            BytesIO(html_content.encode("utf-8")),
+            events=("start", "end"),
+            tag=("table", "tr"),
+            html=True,
+            encoding="utf-8",
+        )
+        for event, elem in context:
+            if elem.tag == "table":
+                if event == "start":
+                    is_results = "searchResults" in (elem.get("class") or "").split()
+                    table_count += is_results
+                    tables.append([is_results, 0, _DEFAULT_COLUMNS])
+                else:
+                    tables.pop()
+                continue
 
-        # Find ETF data tables by class name
-        tables = soup.find_all("table", class_="searchResults")
-        logger.info(f"Found {len(tables)} ETF tables")
+            if event != "end":
+                continue
 
-        for table in tables:
-            # Get all rows (skip the header row)
-            rows = table.find_all("tr")[1:]  # Skip header row
-            
-            for row in rows:
-                etf = self._extract_etf_from_row(row)
-                if etf:
-                    etfs.append(etf)
+            # 가장 안쪽의 searchResults 테이블 기준으로 첫 행(헤더)에서 컬럼 위치를 한 번만 계산
+            table = next((t for t in reversed(tables) if t[0]), None)
+            if table is not None:
+                table[1] += 1
+                if table[1] == 1:
+                    headers = [self._TEXT_XPATH(cell).strip() for cell in self._HEADER_CELL_XPATH(elem)]
+                    table[2] = self._column_indices(headers)
+                else:
+                    raw = self._extract_row_cells(elem, table[2])
+                    if raw:
+                        raw_rows.append(raw)
+
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        logger.info(f"Found {table_count} ETF tables")
+
+        # 2단계: 문자열 튜플을 ETF 모델로 변환
+        etfs = []
+        for raw in raw_rows:
+            etf = self._build_etf(raw)
+            if etf:
+                etfs.append(etf)
 
         logger.info(f"Parsed {len(etfs)} ETFs from First Trust")
         return etfs
@@ -67,10 +166,27 @@ class FirstTrustCrawler(BaseCrawler):
 
         return all(field in header_text for field in required_fields)
 
-    def _extract_etf_from_row(self, row) -> Optional[ETF]:
-        """Extract ETF data from a table row
+    def _column_indices(self, headers: list[str]) -> tuple[Optional[int], ...]:
+        """Map header texts to (name, ticker, inception, nav, yield) column indices
+        
+        Falls back to the default First Trust column order when the headers
+        don't look like an ETF table or a required column is missing.
+        The yield index is None when the table has no yield column.
+        """
+        if not self._is_etf_table(headers):
+            return _DEFAULT_COLUMNS
+
+        indices = tuple(self._find_column_index(headers, key) for key in _COLUMN_KEYS)
+        if None in indices[:4]:
+            return _DEFAULT_COLUMNS
+        return indices
+
+    def _extract_row_cells(
+        self, row, columns: tuple[Optional[int], ...] = _DEFAULT_COLUMNS
+    ) -> Optional[tuple[str, str, str, str, str, str]]:
+        """Extract raw cell text from a table row
         
-        Expected column order:
+        Default column order (see _column_indices):
         0: Fund Name (with link)
         1: Ticker Symbol
         2: Inception Date
@@ -80,39 +196,45 @@ class FirstTrustCrawler(BaseCrawler):
         6: Index Yield
         7: Yield As Of Date
         8: Fact Sheet
+        
+        Returns:
+            (name, ticker, inception, nav, yield, href) 튜플 또는 None
         """
-        cells = row.find_all("td")
-        if len(cells) < 4:  # Need at least Name, Ticker, Inception, NAV
+        name_idx, ticker_idx, inception_idx, nav_idx, yield_idx = columns
+        cells = self._CELL_XPATH(row)
+        # Need at least Name, Ticker, Inception, NAV
+        if len(cells) <= max(name_idx, ticker_idx, inception_idx, nav_idx):
+            return None
+
+        # Fund Name (with link)
+        name_links = self._LINK_XPATH(cells[name_idx])
+        if not name_links:
+            return None
+        name_link = name_links[0]
+
+        text = self._TEXT_XPATH
+        return (
+            text(name_link).strip(),
+            text(cells[ticker_idx]).strip(),
+            text(cells[inception_idx]).strip(),
+            text(cells[nav_idx]).strip(),
+            text(cells[yield_idx]).strip() if yield_idx is not None and len(cells) > yield_idx else "",
+            name_link.get("href", ""),
+        )
+
+    def _build_etf(self, raw: tuple[str, str, str, str, str, str]) -> Optional[ETF]:
+        """Build an ETF model from raw cell text extracted by _extract_row_cells"""
+        name, ticker, inception_str, nav_str, yield_str, href = raw
+
+        # Skip if ticker is empty or invalid
+        if not ticker or len(ticker) > 10:
             return None
 
         try:
-            # Extract data from cells based on column position
-            # Column 0: Fund Name (with link)
-            name_cell = cells[0]
-            name_link = name_cell.find("a")
-            if not name_link:
-                return None
-            
-            name = name_link.get_text(strip=True)
-            detail_url = self.base_url + name_link.get("href", "")
-            
-            # Column 1: Ticker
-            ticker = cells[1].get_text(strip=True) if len(cells) > 1 else ""
-            
-            # Skip if ticker is empty or invalid
-            if not ticker or len(ticker) > 10:
-                return None
-            
-            # Column 2: Inception Date
-            inception_str = cells[2].get_text(strip=True) if len(cells) > 2 else ""
+            detail_url = self.base_url + href
             inception_date = self._parse_date(inception_str)
-            
-            # Column 3: Close NAV
-            nav_str = cells[3].get_text(strip=True) if len(cells) > 3 else ""
             nav = self._parse_price(nav_str)
-            
-            # Column 4: 30-Day SEC Yield (can use as distribution yield)
-            yield_str = cells[4].get_text(strip=True) if len(cells) > 4 else ""
+            # 30-Day SEC Yield (can use as distribution yield)
             distribution_yield = self._parse_percentage(yield_str)
 
             # yfinance로 NAV 및 기타 데이터 보강
@@ -166,42 +288,12 @@ class FirstTrustCrawler(BaseCrawler):
 
     def _parse_date(self, date_str: str) -> Optional[date]:
         """Parse date string in MM/DD/YY format"""
-        if not date_str or date_str == "-------":
-            return None
-
-        try:
-            # Format: 05/18/16
-            from datetime import datetime
-
-            dt = datetime.strptime(date_str, "%m/%d/%y")
-            return dt.date()
-        except (ValueError, AttributeError):
-            logger.warning(f"Failed to parse date: {date_str}")
-            return None
+        return _parse_date(date_str)
 
     def _parse_price(self, price_str: str) -> Optional[Decimal]:
         """Parse price string like '$30.12'"""
-        if not price_str or price_str == "-------":
-            return None
-
-        try:
-            # Remove $ and convert to Decimal
-            price_str = price_str.replace("$", "").replace(",", "")
-            return Decimal(price_str)
-        except (ValueError, AttributeError, Exception):
-            logger.warning(f"Failed to parse price: {price_str}")
-            return None
+        return _parse_price(price_str)
 
     def _parse_percentage(self, pct_str: str) -> Optional[Decimal]:
         """Parse percentage string like '2.31%'"""
-        if not pct_str or pct_str == "-------":
-            return None
-
-        try:
-            # Remove % and convert to Decimal
-            pct_str = pct_str.replace("%", "")
-            value = Decimal(pct_str)
-            return round(value, 2)
-        except (ValueError, AttributeError, Exception):
-            logger.warning(f"Failed to parse percentage: {pct_str}")
-            return None
+        return _parse_percentage(pct_str)
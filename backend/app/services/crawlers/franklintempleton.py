@@ -5,27 +5,20 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import List
 
-import httpx
+import orjson
 
 from ...models.etf import ETF
 from .base import BaseCrawler
 from .yfinance_enricher import enrich_etf_with_yfinance
 
+# 유효한 티커: 대문자 알파벳 1-5자
+_TICKER_RE = re.compile(r"[A-Z]{1,5}")
 
-class FranklinTempletonCrawler(BaseCrawler):
-    """Franklin Templeton ETF 크롤러 클래스"""
-
-    def __init__(self):
-        super().__init__()
-        self.provider_name = "Franklin Templeton"
+_API_URL = "https://www.franklintempleton.com/api/pds/price-and-performance?op=UsPpss&pt=etf&id=1"
 
-    async def fetch_data(self) -> dict:
-        """Franklin Templeton GraphQL API에서 ETF 데이터를 가져옵니다."""
-        url = "https://www.franklintempleton.com/api/pds/price-and-performance?op=UsPpss&pt=etf&id=1"
-
-        # GraphQL query
-        graphql_query = {
-            "query": """
+# GraphQL 요청 본문은 고정값이므로 모듈 로드 시 한 번만 직렬화
+_POST_BODY = orjson.dumps({
+    "query": """
   query UsPpss(
     $countrycode: String!
     $languagecode: String!
@@ -46,27 +39,37 @@ class FranklinTempletonCrawler(BaseCrawler):
     }
   }
 """,
-            "variables": {
-                "countrycode": "US",
-                "productType": "etf",
-                "languagecode": "en_US",
-                "fetchPolicy": "no-cache",
-            },
-            "operationName": "UsPpss",
-        }
+    "variables": {
+        "countrycode": "US",
+        "productType": "etf",
+        "languagecode": "en_US",
+        "fetchPolicy": "no-cache",
+    },
+    "operationName": "UsPpss",
+})
+
+_POST_HEADERS = {
+    "accept": "application/json, text/plain, */*",
+    "content-type": "application/json",
+    "origin": "https://www.franklintempleton.com",
+    "referer": "https://www.franklintempleton.com/investments/options/exchange-traded-funds",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+}
 
-        headers = {
-            "accept": "application/json, text/plain, */*",
-            "content-type": "application/json",
-            "origin": "https://www.franklintempleton.com",
-            "referer": "https://www.franklintempleton.com/investments/options/exchange-traded-funds",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        }
 
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.post(url, json=graphql_query, headers=headers)
-            response.raise_for_status()
-            return response.json()
+class FranklinTempletonCrawler(BaseCrawler):
+    """Franklin Templeton ETF 크롤러 클래스"""
+
+    def __init__(self):
+        super().__init__()
+        self.provider_name = "Franklin Templeton"
+
+    async def fetch_data(self) -> dict:
+        """Franklin Templeton GraphQL API에서 ETF 데이터를 가져옵니다."""
+        client = await self._get_client()
+        response = await client.post(_API_URL, content=_POST_BODY, headers=_POST_HEADERS)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     def parse_data(self, data: dict) -> List[ETF]:
         """GraphQL 응답 데이터를 ETF 객체 리스트로 변환합니다."""
@@ -102,7 +105,7 @@ class FranklinTempletonCrawler(BaseCrawler):
                         continue
 
                     # 티커가 유효한지 확인 (알파벳만 포함, 1-5자)
-                    if not re.match(r"^[A-Z]{1,5}$", ticker):
+                    if not _TICKER_RE.fullmatch(ticker):
                         continue
 
                     # yfinance로 데이터 보강
@@ -7,7 +7,8 @@ from typing import Any, List, Optional
 
 import httpx
 from app.models.etf import ETF, DistributionFrequency
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from .base import BaseCrawler
 from .yfinance_enricher import enrich_etf_with_yfinance
@@ -18,6 +19,15 @@ logger = logging.getLogger(__name__)
 class GlobalXCrawler(BaseCrawler):
     """Crawler for Global X ETFs"""
 
+    # ETF 상세 페이지 링크 (/funds/<ticker>) - 클래스 로드 시 한 번만 컴파일
+    _LINK_XPATH = etree.XPath(
+        r"//a[re:test(@href, '/funds/[a-z]+/?$', 'i')]",
+        namespaces={"re": "http://exslt.org/regular-expressions"},
+    )
+    _TICKER_RE = re.compile(r"/funds/([a-z]+)", re.IGNORECASE)
+    # str 응답을 UTF-8 바이트로 넘기므로 인코딩을 고정 (XML 선언이 있는 문서도 파싱 가능)
+    _PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.globalxetfs.com"
@@ -38,24 +48,28 @@ class GlobalXCrawler(BaseCrawler):
 
     def parse_data(self, html_content: str) -> List[ETF]:
         """Parse HTML content to extract ETF data"""
-        if not html_content:
+        if not html_content or not html_content.strip():
             return []
 
-        soup = BeautifulSoup(html_content, "html.parser")
+        try:
+            tree = lxml_html.fromstring(html_content.encode("utf-8"), parser=self._PARSER)
+        except etree.ParserError as e:
+            logger.warning(f"Failed to parse Global X HTML: {e}")
+            return []
         etfs = []
 
         # Look for ETF links in the page
-        etf_links = soup.find_all("a", href=re.compile(r'/funds/[a-z]+/?$', re.IGNORECASE))
+        etf_links = self._LINK_XPATH(tree)
 
         for link in etf_links:
             href = link.get("href")
-            if not href or not isinstance(href, str):
+            if not href:
                 continue
 
-            ticker_match = re.search(r'/funds/([a-z]+)', href, re.IGNORECASE)
+            ticker_match = self._TICKER_RE.search(href)
             if ticker_match:
                 ticker = ticker_match.group(1).upper()
-                name = link.get_text(strip=True)
+                name = "".join(text.strip() for text in link.itertext())
 
                 if ticker and name:
                     detail_url = href if href.startswith("http") else self.base_url + href
@@ -2,12 +2,71 @@
 import re
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional
+
+import ijson
+import orjson
 
-import httpx
 from app.models.etf import ETF, DistributionFrequency
 from app.services.crawlers.base import BaseCrawler
 
+# 배당 빈도 문자열(대문자) → DistributionFrequency 정확 일치 매핑
+_FREQ_MAP: Dict[str, DistributionFrequency] = {
+    **{freq.name: freq for freq in DistributionFrequency},
+    **{freq.value.upper(): freq for freq in DistributionFrequency},
+    "SEMIANNUAL": DistributionFrequency.SEMI_ANNUAL,
+    "YEARLY": DistributionFrequency.ANNUAL,
+}
+
+
+# 같은 값(0, 기준일 등)이 여러 share class에 반복되므로 변환 결과를 캐시 (Decimal/date는 불변)
+@lru_cache(maxsize=8192)
+def _parse_date(date_str: Optional[str]) -> Optional[date]:
+    """날짜 문자열을 date 객체로 변환"""
+    if not date_str:
+        return None
+    
+    try:
+        # ISO 8601 형식: "2022-02-15"
+        return datetime.fromisoformat(date_str).date()
+    except (ValueError, AttributeError):
+        return None
+
+
+@lru_cache(maxsize=8192, typed=True)
+def _parse_decimal(value: Any) -> Optional[Decimal]:
+    """숫자 값을 Decimal로 변환"""
+    if value is None:
+        return None
+    
+    # 문자열 변환 및 검증
+    str_value = str(value).strip()
+    
+    # '--', 'N/A', 빈 문자열 등은 None 반환
+    if not str_value or str_value in ('--', 'N/A', 'n/a'):
+        return None
+    
+    try:
+        return Decimal(str_value)
+    except (ValueError, TypeError, Exception):
+        return None
+
+
+class _AsyncByteReader:
+    """비동기 바이트 청크 이터러블을 ijson이 요구하는 async read() 인터페이스로 감싸는 어댑터"""
+
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
 
 class GoldmanSachsCrawler(BaseCrawler):
     """Goldman Sachs ETF 데이터 크롤러 (GraphQL API)"""
@@ -54,39 +113,66 @@ class GoldmanSachsCrawler(BaseCrawler):
     }
     """
 
+    # 요청 헤더와 GraphQL 페이로드는 고정값이므로 클래스 로드 시 한 번만 직렬화
+    POST_HEADERS = {
+        "accept": "*/*",
+        "content-type": "application/json",
+        "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+    POST_BODY = orjson.dumps({
+        "operationName": "getFunds",
+        "variables": {
+            "fundRequest": {
+                "country": "us",
+                "language": "en",
+                "audience": "institutions",
+                "disabledFunds": [],
+                "limit": 500,  # 전체 펀드를 가져오기 위해 충분히 큰 값 설정
+                "offset": 0,
+                "sortBy": "FN",
+                "sortOrder": "ASC",
+                "filterParam": {
+                    "searchText": ""
+                }
+            }
+        },
+        "query": GRAPHQL_QUERY
+    })
+
     async def fetch_data(self) -> Dict[str, Any]:
         """Goldman Sachs GraphQL API에서 ETF 데이터 가져오기"""
-        headers = {
-            "accept": "*/*",
-            "content-type": "application/json",
-            "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        
-        # GraphQL 요청 페이로드
-        payload = {
-            "operationName": "getFunds",
-            "variables": {
-                "fundRequest": {
-                    "country": "us",
-                    "language": "en",
-                    "audience": "institutions",
-                    "disabledFunds": [],
-                    "limit": 500,  # 전체 펀드를 가져오기 위해 충분히 큰 값 설정
-                    "offset": 0,
-                    "sortBy": "FN",
-                    "sortOrder": "ASC",
-                    "filterParam": {
-                        "searchText": ""
-                    }
-                }
-            },
-            "query": self.GRAPHQL_QUERY
-        }
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(self.BASE_URL, headers=headers, json=payload)
+        client = await self._get_client()
+        response = await client.post(self.BASE_URL, headers=self.POST_HEADERS, content=self.POST_BODY)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def crawl(self) -> List[ETF]:
+        """
+        GraphQL 응답을 스트리밍으로 파싱하여 ETF 리스트를 반환합니다.
+
+        전체 응답(bytes + dict)을 메모리에 올리지 않고 펀드 단위로 처리합니다.
+        """
+        client = await self._get_client()
+        async with client.stream(
+            "POST", self.BASE_URL, headers=self.POST_HEADERS, content=self.POST_BODY
+        ) as response:
             response.raise_for_status()
-            return response.json()
+            return [etf async for etf in self.iter_etfs(response.aiter_bytes())]
+
+    async def iter_etfs(self, chunks: AsyncIterable[bytes]) -> AsyncIterator[ETF]:
+        """
+        GraphQL 응답 바이트 스트림에서 펀드를 하나씩 읽어 ETF를 생성합니다.
+
+        Args:
+            chunks: 응답 본문 바이트 청크 (예: response.aiter_bytes())
+
+        Yields:
+            ETF 모델
+        """
+        funds = ijson.items_async(_AsyncByteReader(chunks), "data.fundData.funds.item")
+        async for fund in funds:
+            for etf in self._parse_fund(fund):
+                yield etf
 
     async def parse_data(self, raw_data: Dict[str, Any]) -> List[ETF]:
         """GraphQL 응답을 ETF 모델 리스트로 변환"""
@@ -98,140 +184,137 @@ class GoldmanSachsCrawler(BaseCrawler):
             return etf_list
         
         for fund in funds:
-            # ETF만 처리
-            if fund.get("fundType") != "ETF":
-                continue
-            
-            fund_name = fund.get("fundName", "")
-            pv_number = fund.get("pvNumber", "")
-            share_classes = fund.get("shareClasses", [])
-            
-            # 각 share class는 별도 ticker를 가질 수 있음
-            for share_class in share_classes:
-                try:
-                    ticker = share_class.get("ticker")
-                    if not ticker:
-                        continue
-                    
-                    # Inception date 파싱
-                    inception_date = self._parse_date(share_class.get("shareClassInceptionDate"))
-                    
-                    # NAV 정보
-                    daily_perf = share_class.get("dailyPerformance", {})
-                    nav_data = daily_perf.get("nav", {})
-                    nav_amount = self._parse_decimal(nav_data.get("value"))
-                    nav_as_of = self._parse_date(nav_data.get("asAtDate"))
-                    
-                    # AUM (shareClassNetAssets를 millions로 변환)
-                    aum_data = daily_perf.get("shareClassNetAssets", {})
-                    aum_value = aum_data.get("value")
-                    aum_millions = None
-                    if aum_value:
-                        try:
-                            aum_millions = float(aum_value) / 1_000_000  # millions로 변환
-                        except (ValueError, TypeError):
-                            pass
-                    
-                    # 수익률 정보
-                    monthly_perf = share_class.get("monthlyPerformance", {})
-                    ytd_return = self._parse_decimal(monthly_perf.get("annualisedReturns1yr"))
-                    one_year = self._parse_decimal(monthly_perf.get("annualisedReturns1yr"))
-                    three_year = self._parse_decimal(monthly_perf.get("annualisedReturns3yr"))
-                    five_year = self._parse_decimal(monthly_perf.get("annualisedReturns5yr"))
-                    ten_year = self._parse_decimal(monthly_perf.get("annualisedReturns10yr"))
-                    since_incept = self._parse_decimal(monthly_perf.get("annualisedReturnsSinceIncept"))
-                    
-                    # Distribution frequency 매핑
-                    dist_freq_str = share_class.get("distributionFrequency", "")
-                    distribution_frequency = self._map_distribution_frequency(dist_freq_str)
-                    
-                    # 상세 페이지 URL 생성
-                    # pvNumber와 shareClassId를 사용하여 정확한 detail URL 구성
-                    share_class_id = share_class.get("shareClassId", "")
-                    if pv_number and share_class_id:
-                        # fund_name을 URL slug로 변환
-                        name_slug = fund_name.lower().replace(" ", "-").replace("&", "and")
-                        # 특수문자 제거
-                        import re
-                        name_slug = re.sub(r'[^a-z0-9-]', '', name_slug)
-                        detail_url = f"https://am.gs.com/en-us/institutions/funds/detail/{pv_number}/{share_class_id}/{name_slug}"
-                    else:
-                        # fallback to products URL
-                        detail_url = f"https://am.gs.com/en-us/institutions/products/{ticker}"
-                    
-                    # ISIN과 CUSIP 가져오기 (GraphQL API에서 직접 제공)
-                    isin = share_class.get("isin", "N/A")
-                    cusip = share_class.get("cusip", "N/A")
-                    
-                    # NAV는 ETF의 순자산가치로, 실질적으로 ETF의 가격 역할을 함
-                    # detail_page_url을 통해 추가 정보를 수집할 수 있지만,
-                    # GraphQL API에서 이미 대부분의 핵심 데이터를 제공함
-                    etf = ETF(
-                        ticker=ticker,
-                        fund_name=fund_name,
-                        isin=isin,
-                        cusip=cusip,
-                        inception_date=inception_date or date.today(),
-                        nav_amount=nav_amount or Decimal("0.00"),  # ETF의 실질 가격
-                        nav_as_of=nav_as_of or date.today(),
-                        expense_ratio=Decimal("0.00"),  # API 응답에 없음
-                        ytd_return=ytd_return,
-                        one_year_return=one_year,
-                        three_year_return=three_year,
-                        five_year_return=five_year,
-                        ten_year_return=ten_year,
-                        since_inception_return=since_incept,
-                        asset_class="Unknown",  # 추가 매핑 필요
-                        region="US",
-                        market_type="ETF",
-                        distribution_yield=None,
-                        product_page_url=detail_url,
-                        distribution_frequency=distribution_frequency,
-                        detail_page_url=detail_url,
-                    )
-                    etf_list.append(etf)
-                    
-                except Exception as e:
-                    # 개별 ETF 파싱 실패는 건너뛰기
+            etf_list.extend(self._parse_fund(fund))
+        
+        return etf_list
+
+    def _parse_fund(self, fund: Dict[str, Any]) -> List[ETF]:
+        """펀드 하나의 share class들을 ETF 모델 리스트로 변환"""
+        etf_list: List[ETF] = []
+
+        # ETF만 처리
+        if fund.get("fundType") != "ETF":
+            return etf_list
+        
+        fund_name = fund.get("fundName", "")
+        pv_number = fund.get("pvNumber", "")
+        share_classes = fund.get("shareClasses", [])
+        
+        # 각 share class는 별도 ticker를 가질 수 있음
+        for share_class in share_classes:
+            try:
+                ticker = share_class.get("ticker")
+                if not ticker:
                     continue
+                
+                # Inception date 파싱
+                inception_date = self._parse_date(share_class.get("shareClassInceptionDate"))
+                
+                # NAV 정보
+                daily_perf = share_class.get("dailyPerformance", {})
+                nav_data = daily_perf.get("nav", {})
+                nav_amount = self._parse_decimal(nav_data.get("value"))
+                nav_as_of = self._parse_date(nav_data.get("asAtDate"))
+                
+                # AUM (shareClassNetAssets를 millions로 변환)
+                aum_data = daily_perf.get("shareClassNetAssets", {})
+                aum_value = aum_data.get("value")
+                aum_millions = None
+                if aum_value:
+                    try:
+                        aum_millions = float(aum_value) / 1_000_000  # millions로 변환
+                    except (ValueError, TypeError):
+                        pass
+                
+                # 수익률 정보
+                monthly_perf = share_class.get("monthlyPerformance", {})
+                ytd_return = self._parse_decimal(monthly_perf.get("annualisedReturns1yr"))
+                one_year = self._parse_decimal(monthly_perf.get("annualisedReturns1yr"))
+                three_year = self._parse_decimal(monthly_perf.get("annualisedReturns3yr"))
+                five_year = self._parse_decimal(monthly_perf.get("annualisedReturns5yr"))
+                ten_year = self._parse_decimal(monthly_perf.get("annualisedReturns10yr"))
+                since_incept = self._parse_decimal(monthly_perf.get("annualisedReturnsSinceIncept"))
+                
+                # Distribution frequency 매핑
+                dist_freq_str = share_class.get("distributionFrequency", "")
+                distribution_frequency = self._map_distribution_frequency(dist_freq_str)
+                
+                # 상세 페이지 URL 생성
+                # pvNumber와 shareClassId를 사용하여 정확한 detail URL 구성
+                share_class_id = share_class.get("shareClassId", "")
+                if pv_number and share_class_id:
+                    # fund_name을 URL slug로 변환
+                    name_slug = fund_name.lower().replace(" ", "-").replace("&", "and")
+                    # 특수문자 제거
+                    import re
+                    name_slug = re.sub(r'[^a-z0-9-]', '', name_slug)
+                    detail_url = f"https://am.gs.com/en-us/institutions/funds/detail/{pv_number}/{share_class_id}/{name_slug}"
+                else:
+                    # fallback to products URL
+                    detail_url = f"https://am.gs.com/en-us/institutions/products/{ticker}"
+                
+                # ISIN과 CUSIP 가져오기 (GraphQL API에서 직접 제공)
+                isin = share_class.get("isin", "N/A")
+                cusip = share_class.get("cusip", "N/A")
+                
+                # NAV는 ETF의 순자산가치로, 실질적으로 ETF의 가격 역할을 함
+                # detail_page_url을 통해 추가 정보를 수집할 수 있지만,
+                # GraphQL API에서 이미 대부분의 핵심 데이터를 제공함
+                etf = ETF(
+                    ticker=ticker,
+                    fund_name=fund_name,
+                    isin=isin,
+                    cusip=cusip,
+                    inception_date=inception_date or date.today(),
+                    nav_amount=nav_amount or Decimal("0.00"),  # ETF의 실질 가격
+                    nav_as_of=nav_as_of or date.today(),
+                    expense_ratio=Decimal("0.00"),  # API 응답에 없음
+                    ytd_return=ytd_return,
+                    one_year_return=one_year,
+                    three_year_return=three_year,
+                    five_year_return=five_year,
+                    ten_year_return=ten_year,
+                    since_inception_return=since_incept,
+                    asset_class="Unknown",  # 추가 매핑 필요
+                    region="US",
+                    market_type="ETF",
+                    distribution_yield=None,
+                    product_page_url=detail_url,
+                    distribution_frequency=distribution_frequency,
+                    detail_page_url=detail_url,
+                )
+                etf_list.append(etf)
+                
+            except Exception as e:
+                # 개별 ETF 파싱 실패는 건너뛰기
+                continue
         
         return etf_list
 
     def _parse_date(self, date_str: Optional[str]) -> Optional[date]:
         """날짜 문자열을 date 객체로 변환"""
-        if not date_str:
-            return None
-        
-        try:
-            # ISO 8601 형식: "2022-02-15"
-            return datetime.fromisoformat(date_str).date()
-        except (ValueError, AttributeError):
-            return None
+        return _parse_date(date_str)
 
     def _parse_decimal(self, value: Any) -> Optional[Decimal]:
         """숫자 값을 Decimal로 변환"""
-        if value is None:
-            return None
-        
-        # 문자열 변환 및 검증
-        str_value = str(value).strip()
-        
-        # '--', 'N/A', 빈 문자열 등은 None 반환
-        if not str_value or str_value in ('--', 'N/A', 'n/a'):
-            return None
-        
-        try:
-            return Decimal(str_value)
-        except (ValueError, TypeError, Exception):
+        # dict/list 등 해시 불가능한 값은 숫자가 아님
+        if isinstance(value, (dict, list)):
             return None
+        return _parse_decimal(value)
 
     def _map_distribution_frequency(self, freq_str: str) -> DistributionFrequency:
         """배당 빈도 문자열을 DistributionFrequency enum으로 매핑"""
         if not freq_str:
             return DistributionFrequency.UNKNOWN
         
-        freq_upper = freq_str.upper()
+        freq_upper = freq_str.upper().strip()
+        
+        # 정확히 일치하는 값은 해시 조회 한 번으로 처리
+        freq = _FREQ_MAP.get(freq_upper)
+        if freq is not None:
+            return freq
         
+        # 그 외 표현("Paid Quarterly" 등)은 부분 문자열로 매핑
         if "MONTHLY" in freq_upper:
             return DistributionFrequency.MONTHLY
         elif "QUARTERLY" in freq_upper or "QUARTER" in freq_upper:
@@ -1,10 +1,13 @@
 """Invesco ETF 크롤러"""
 import logging
+import re
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 from app.models.etf import ETF
 
 from .base import BaseCrawler
@@ -12,6 +15,28 @@ from .yfinance_enricher import enrich_etf_with_yfinance
 
 logger = logging.getLogger(__name__)
 
+# 기본값으로 반복 사용하는 Decimal 상수 (불변 객체이므로 공유 가능)
+_DEC_ZERO_00 = Decimal("0.00")
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}\Z")
+
+
+@lru_cache(maxsize=2048)
+def _parse_date(date_str: Optional[str]) -> Optional[date]:
+    """날짜 문자열을 date 객체로 변환 (같은 날짜가 여러 ETF에 반복되므로 캐싱)"""
+    if not date_str:
+        return None
+    
+    try:
+        # 빠른 경로: 0으로 채워진 YYYY-MM-DD
+        if isinstance(date_str, str) and _ISO_DATE_RE.match(date_str):
+            return date.fromisoformat(date_str)
+        # 그 외 ("2017-9-5" 등)는 기존과 같이 strptime으로 처리
+        return datetime.strptime(date_str, '%Y-%m-%d').date()
+    except (ValueError, AttributeError, TypeError):
+        logger.warning(f"Failed to parse date: {date_str}")
+        return None
+
 
 class InvescoCrawler(BaseCrawler):
     """Invesco ETF 데이터 크롤러"""
@@ -40,27 +65,30 @@ class InvescoCrawler(BaseCrawler):
         'sort': 'shareClassFullName asc'
     }
     
-    async def fetch_data(self) -> Any:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    
+    async def fetch_data(self, client: Optional[httpx.AsyncClient] = None) -> Any:
         """
         Invesco API에서 JSON 데이터를 가져옵니다.
         
+        Args:
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
+        
         Returns:
             JSON 응답 데이터
         """
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        ) as client:
-            response = await client.get(self.BASE_URL, params=self.PARAMS)
-            response.raise_for_status()
-            
-            data = response.json()
-            num_found = data.get('response', {}).get('numFound', 0)
-            logger.info(f"Fetched {num_found} Invesco ETFs")
-            return data
+        if client is None:
+            client = await self._get_client()
+        
+        response = await client.get(self.BASE_URL, params=self.PARAMS, headers=self.HEADERS)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        num_found = data.get('response', {}).get('numFound', 0)
+        logger.info(f"Fetched {num_found} Invesco ETFs")
+        return data
     
     def _parse_date(self, date_str: Optional[str]) -> Optional[date]:
         """
@@ -72,15 +100,7 @@ class InvescoCrawler(BaseCrawler):
         Returns:
             date 객체 또는 None
         """
-        if not date_str:
-            return None
-        
-        try:
-            # ISO 형식 (YYYY-MM-DD)
-            return datetime.strptime(date_str, '%Y-%m-%d').date()
-        except (ValueError, AttributeError):
-            logger.warning(f"Failed to parse date: {date_str}")
-            return None
+        return _parse_date(date_str)
     
     def _extract_etf_data(self, doc: Dict) -> Optional[ETF]:
         """
@@ -110,7 +130,7 @@ class InvescoCrawler(BaseCrawler):
             expense_ratio = Decimal(expense_ratio_str)
         except (ValueError, TypeError, Exception):
             logger.warning(f"Invalid expense ratio for {ticker}: {expense_ratio_str}")
-            expense_ratio = Decimal("0.00")
+            expense_ratio = _DEC_ZERO_00
         
         # 자산 분류
         asset_class = doc.get('assetClass', 'Unknown')
@@ -125,7 +145,7 @@ class InvescoCrawler(BaseCrawler):
         product_page_url = f"https://www.invesco.com{url_path}" if url_path else f"https://www.invesco.com/us/en/financial-products/etfs/{ticker.lower()}"
         
         # yfinance로 NAV 및 기타 데이터 보강
-        nav_amount = Decimal("0.00")
+        nav_amount = _DEC_ZERO_00
         nav_amount, expense_ratio, inception_date = enrich_etf_with_yfinance(
             ticker, nav_amount, expense_ratio, inception_date
         )
@@ -1,15 +1,31 @@
 """iShares ETF 크롤러"""
 import csv
 import io
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, List, Optional
 
 import httpx
+import orjson
 from app.models.etf import ETF
 
 from .base import BaseCrawler
 
+# 기본값으로 반복 사용하는 Decimal 상수 (불변 객체이므로 공유 가능)
+_DEC_ZERO = Decimal("0")
+
+
+@lru_cache(maxsize=2048)
+def _parse_date(date_str: Optional[str]) -> Optional[date]:
+    """'Nov 28, 2025' 형식 날짜 문자열을 date 객체로 변환 (navAmountAsOf 등 반복 값이 많아 캐싱)"""
+    if not date_str:
+        return None
+    try:
+        return datetime.strptime(date_str, "%b %d, %Y").date()
+    except (ValueError, TypeError):
+        return None
+
 
 class ISharesCrawler(BaseCrawler):
     """iShares ETF 데이터 크롤러"""
@@ -21,17 +37,22 @@ class ISharesCrawler(BaseCrawler):
         "siteEntryPassthrough": "true"
     }
     
-    async def fetch_data(self) -> Any:
+    async def fetch_data(self, client: Optional[httpx.AsyncClient] = None) -> Any:
         """
         iShares API에서 JSON 데이터를 가져옵니다.
         
+        Args:
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
+        
         Returns:
             JSON 응답 데이터
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(self.BASE_URL, params=self.PARAMS)
-            response.raise_for_status()
-            return response.json()
+        if client is None:
+            client = await self._get_client()
+        
+        response = await client.get(self.BASE_URL, params=self.PARAMS)
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
     async def parse_data(self, raw_data: Any) -> List[ETF]:
         """
@@ -49,13 +70,7 @@ class ISharesCrawler(BaseCrawler):
         def parse_date(date_obj):
             if not date_obj or not isinstance(date_obj, dict):
                 return None
-            date_str = date_obj.get("d")
-            if not date_str:
-                return None
-            try:
-                return datetime.strptime(date_str, "%b %d, %Y").date()
-            except:
-                return None
+            return _parse_date(date_obj.get("d"))
         
         # Decimal 값 파싱 (r 키 값 사용)
         def parse_decimal(value_obj):
@@ -94,9 +109,9 @@ class ISharesCrawler(BaseCrawler):
                         isin=etf_data.get("isin", ""),
                         cusip=etf_data.get("cusip", ""),
                         inception_date=parse_date(etf_data.get("inceptionDate")) or datetime.now().date(),
-                        nav_amount=parse_decimal(etf_data.get("navAmount")) or Decimal("0"),
+                        nav_amount=parse_decimal(etf_data.get("navAmount")) or _DEC_ZERO,
                         nav_as_of=parse_date(etf_data.get("navAmountAsOf")) or datetime.now().date(),
-                        expense_ratio=parse_decimal(etf_data.get("fees")) or Decimal("0"),
+                        expense_ratio=parse_decimal(etf_data.get("fees")) or _DEC_ZERO,
                         
                         # Quarterly 데이터 우선 사용 (실제 데이터 구조에 맞춤)
                         ytd_return=parse_decimal(etf_data.get("quarterlyNavYearToDate")) or parse_decimal(etf_data.get("priceYearToDate")),
@@ -5,6 +5,7 @@ from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 from app.models.etf import ETF
 from app.services.crawlers.base import BaseCrawler
 
@@ -190,7 +191,7 @@ class JPMorganCrawler(BaseCrawler):
         async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
             response = await client.get(self.BASE_URL, params=self.PARAMS)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             logger.info(f"Fetched {len(data) if isinstance(data, list) else 'unknown'} ETFs from JPMorgan")
             return data
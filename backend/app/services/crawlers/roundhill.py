@@ -1,13 +1,15 @@
 """Roundhill ETF 크롤러"""
+import asyncio
 import logging
 import re
 from datetime import date
 from decimal import Decimal
-from typing import Any, List, Set
+from typing import Any, List, Optional, Set
 
 import httpx
 from app.models.etf import ETF
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from .base import BaseCrawler
 from .yfinance_enricher import enrich_etf_with_yfinance
@@ -21,48 +23,52 @@ class RoundhillCrawler(BaseCrawler):
     # Roundhill ETF 리스트 페이지
     BASE_URL = "https://www.roundhillinvestments.com/etf"
     DETAIL_URL_TEMPLATE = "https://www.roundhillinvestments.com/etf/{ticker}/"
+    # 상세 페이지 동시 요청 수
+    MAX_CONCURRENCY = 8
     
-    async def fetch_data(self) -> Any:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    
+    async def fetch_data(self, client: Optional[httpx.AsyncClient] = None) -> Any:
         """
         Roundhill 웹사이트에서 HTML 데이터를 가져옵니다.
         
+        Args:
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
+        
         Returns:
             ETF 티커 목록
         """
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,  # 301/302 리다이렉트 자동 따라가기
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        ) as client:
-            response = await client.get(self.BASE_URL)
-            response.raise_for_status()
-            
-            # 메인 페이지에서 모든 ETF 티커 추출
-            soup = BeautifulSoup(response.text, 'html.parser')
-            tickers = self._extract_tickers(soup)
-            
-            logger.info(f"Found {len(tickers)} Roundhill ETF tickers")
-            return tickers
+        if client is None:
+            client = await self._get_client()
+        
+        response = await client.get(self.BASE_URL, headers=self.HEADERS)
+        response.raise_for_status()
+        
+        # 메인 페이지에서 모든 ETF 티커 추출 (링크만 훑으면 되므로 C 파서인 selectolax 사용)
+        tree = LexborHTMLParser(response.text)
+        tickers = self._extract_tickers(tree)
+        
+        logger.info(f"Found {len(tickers)} Roundhill ETF tickers")
+        return tickers
     
-    def _extract_tickers(self, soup: BeautifulSoup) -> Set[str]:
+    def _extract_tickers(self, tree: LexborHTMLParser) -> Set[str]:
         """
         메인 페이지에서 모든 ETF 티커를 추출합니다.
         
         Args:
-            soup: BeautifulSoup 객체
+            tree: selectolax LexborHTMLParser 객체
             
         Returns:
             티커 집합
         """
         tickers = set()
-        links = soup.find_all('a', href=True)
         
-        for link in links:
-            href = link.get('href', '')
-            # href가 None이거나 리스트인 경우 스킵
-            if not isinstance(href, str):
+        for link in tree.css('a[href]'):
+            href = link.attributes.get('href')
+            # 값 없는 href 속성(<a href>)은 None으로 반환됨
+            if not href:
                 continue
                 
             # ../etf/TICKER/ 또는 /etf/TICKER/ 패턴 찾기
@@ -80,112 +86,111 @@ class RoundhillCrawler(BaseCrawler):
         
         return tickers
     
-    async def parse_data(self, raw_data: Any) -> List[ETF]:
+    async def parse_data(
+        self, raw_data: Any, client: Optional[httpx.AsyncClient] = None
+    ) -> List[ETF]:
         """
         Roundhill ETF 티커 목록을 받아 각 ETF의 상세 정보를 수집합니다.
         
         Args:
             raw_data: ETF 티커 집합
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
             
         Returns:
             ETF 모델 리스트
         """
-        tickers = raw_data
-        etf_list = []
+        tickers = list(raw_data)
+        urls = [self.DETAIL_URL_TEMPLATE.format(ticker=ticker.lower()) for ticker in tickers]
         
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        ) as client:
-            for ticker in tickers:
-                try:
-                    etf = await self._fetch_etf_details(client, ticker)
-                    if etf:
-                        etf_list.append(etf)
-                        logger.info(f"Successfully parsed {ticker}")
-                except Exception as e:
-                    logger.error(f"Failed to parse {ticker}: {e}")
-                    continue
+        # 상세 페이지를 동시에 요청 (순차 요청 시 티커 수만큼 왕복 시간이 누적됨)
+        pages = await self._fetch_urls(
+            urls, max_concurrency=self.MAX_CONCURRENCY, headers=self.HEADERS, client=client
+        )
+        
+        fetched = []
+        for ticker, url, page in zip(tickers, urls, pages):
+            if isinstance(page, httpx.HTTPStatusError):
+                logger.error(f"HTTP error for {ticker}: {page.response.status_code}")
+            elif isinstance(page, Exception):
+                logger.error(f"Error fetching details for {ticker}: {page}")
+            else:
+                fetched.append((ticker, url, page))
+        
+        results = await asyncio.gather(
+            *(self._parse_etf_page(ticker, url, page) for ticker, url, page in fetched),
+            return_exceptions=True,
+        )
+        
+        etf_list = []
+        for (ticker, _, _), result in zip(fetched, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to parse {ticker}: {result}")
+            elif result:
+                etf_list.append(result)
+                logger.info(f"Successfully parsed {ticker}")
         
         logger.info(f"Successfully parsed {len(etf_list)} Roundhill ETFs")
         return etf_list
     
-    async def _fetch_etf_details(self, client: httpx.AsyncClient, ticker: str) -> ETF | None:
+    async def _parse_etf_page(self, ticker: str, url: str, html: str) -> ETF | None:
         """
-        개별 ETF의 상세 정보를 가져옵니다.
+        개별 ETF 상세 페이지 HTML에서 ETF 정보를 추출합니다.
         
         Args:
-            client: HTTP 클라이언트
             ticker: ETF 티커
+            url: 상세 페이지 URL
+            html: 상세 페이지 HTML
             
         Returns:
             ETF 모델 또는 None
         """
-        url = self.DETAIL_URL_TEMPLATE.format(ticker=ticker.lower())
+        soup = BeautifulSoup(html, 'lxml')
         
-        try:
-            response = await client.get(url)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # ETF 이름 추출
-            h1 = soup.find('h1')
-            if not h1:
-                logger.warning(f"No H1 found for {ticker}")
-                return None
-            
-            full_name = h1.text.strip()
-            # 티커를 제거하고 이름만 추출 (예: "METV Metaverse ETF" -> "Metaverse ETF")
-            fund_name = full_name.replace(ticker, '').strip()
-            
-            # 텍스트에서 정보 추출
-            text = soup.get_text()
-            
-            # Expense Ratio 추출
-            expense_ratio = Decimal("0.00")
-            expense_match = re.search(r'(?:Expense Ratio|Net Expense)[:\s]*(\d+\.\d+)%', text, re.IGNORECASE)
-            if expense_match:
-                expense_ratio = Decimal(expense_match.group(1))
-            
-            # yfinance로 NAV 및 기타 데이터 보강
-            nav_amount = Decimal("0.00")
-            inception_date = None
-            
-            nav_amount, expense_ratio, inception_date = enrich_etf_with_yfinance(
-                ticker, nav_amount, expense_ratio, inception_date
-            )
-            
-            # 기본값 설정 (Roundhill은 제한된 정보만 제공)
-            return ETF(
-                ticker=ticker,
-                fund_name=fund_name,
-                isin="N/A",  # Roundhill 웹사이트에서 제공하지 않음
-                cusip="N/A",  # Roundhill 웹사이트에서 제공하지 않음
-                inception_date=inception_date,
-                nav_amount=nav_amount,
-                nav_as_of=date.today(),
-                expense_ratio=expense_ratio,
-                ytd_return=None,
-                one_year_return=None,
-                three_year_return=None,
-                five_year_return=None,
-                ten_year_return=None,
-                since_inception_return=None,
-                asset_class="Unknown",  # 추가 파싱 필요
-                region="Unknown",  # 추가 파싱 필요
-                market_type="Unknown",  # 추가 파싱 필요
-                distribution_yield=None,
-                product_page_url=url,
-                detail_page_url=url
-            )
-            
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error for {ticker}: {e.response.status_code}")
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching details for {ticker}: {e}")
+        # ETF 이름 추출
+        h1 = soup.find('h1')
+        if not h1:
+            logger.warning(f"No H1 found for {ticker}")
             return None
+        
+        full_name = h1.text.strip()
+        # 티커를 제거하고 이름만 추출 (예: "METV Metaverse ETF" -> "Metaverse ETF")
+        fund_name = full_name.replace(ticker, '').strip()
+        
+        # 텍스트에서 정보 추출
+        text = soup.get_text()
+        
+        # Expense Ratio 추출
+        expense_ratio = Decimal("0.00")
+        expense_match = re.search(r'(?:Expense Ratio|Net Expense)[:\s]*(\d+\.\d+)%', text, re.IGNORECASE)
+        if expense_match:
+            expense_ratio = Decimal(expense_match.group(1))
+        
+        # yfinance로 NAV 및 기타 데이터 보강
+        # (동기 네트워크 호출이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+        nav_amount, expense_ratio, inception_date = await asyncio.to_thread(
+            enrich_etf_with_yfinance, ticker, Decimal("0.00"), expense_ratio, None
+        )
+        
+        # 기본값 설정 (Roundhill은 제한된 정보만 제공)
+        return ETF(
+            ticker=ticker,
+            fund_name=fund_name,
+            isin="N/A",  # Roundhill 웹사이트에서 제공하지 않음
+            cusip="N/A",  # Roundhill 웹사이트에서 제공하지 않음
+            inception_date=inception_date,
+            nav_amount=nav_amount,
+            nav_as_of=date.today(),
+            expense_ratio=expense_ratio,
+            ytd_return=None,
+            one_year_return=None,
+            three_year_return=None,
+            five_year_return=None,
+            ten_year_return=None,
+            since_inception_return=None,
+            asset_class="Unknown",  # 추가 파싱 필요
+            region="Unknown",  # 추가 파싱 필요
+            market_type="Unknown",  # 추가 파싱 필요
+            distribution_yield=None,
+            product_page_url=url,
+            detail_page_url=url
+        )
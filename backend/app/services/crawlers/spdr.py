@@ -2,9 +2,11 @@
 import logging
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 from app.models.etf import ETF
 
 from .base import BaseCrawler
@@ -12,6 +14,13 @@ from .base import BaseCrawler
 logger = logging.getLogger(__name__)
 
 
+# 비용/수익률 등 같은 숫자가 펀드마다 반복되므로 변환 결과를 캐시 (Decimal은 불변)
+@lru_cache(maxsize=8192, typed=True)
+def _to_decimal(value: int | float | str) -> Decimal:
+    """숫자 값을 Decimal로 변환 (float는 repr 기준이므로 0.09 -> Decimal("0.09"))"""
+    return Decimal(str(value))
+
+
 class SPDRCrawler(BaseCrawler):
     """SPDR ETF 데이터 크롤러"""
     
@@ -25,26 +34,29 @@ class SPDRCrawler(BaseCrawler):
         "ui": "fund-finder"
     }
     
-    async def fetch_data(self) -> Any:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    
+    async def fetch_data(self, client: Optional[httpx.AsyncClient] = None) -> Any:
         """
         SPDR API에서 JSON 데이터를 가져옵니다.
         
+        Args:
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
+        
         Returns:
             JSON 응답 데이터
         """
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        ) as client:
-            response = await client.get(self.BASE_URL, params=self.PARAMS)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Fetched SPDR fund data")
-            return data
+        if client is None:
+            client = await self._get_client()
+        
+        response = await client.get(self.BASE_URL, params=self.PARAMS, headers=self.HEADERS)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        logger.info(f"Fetched SPDR fund data")
+        return data
     
     def _parse_date(self, date_str: Optional[str]) -> Optional[date]:
         """
@@ -86,10 +98,10 @@ class SPDRCrawler(BaseCrawler):
         try:
             # 리스트 형식인 경우 두 번째 값 (숫자) 사용
             if isinstance(field, list) and len(field) > 1:
-                return Decimal(str(field[1]))
+                return _to_decimal(field[1])
             # 단일 값인 경우
             elif isinstance(field, (int, float, str)):
-                return Decimal(str(field))
+                return _to_decimal(field)
         except (ValueError, TypeError, IndexError):
             logger.warning(f"Failed to extract value from: {field}")
         
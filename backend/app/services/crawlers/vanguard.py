@@ -1,16 +1,32 @@
 """Vanguard ETF 크롤러"""
 import logging
+import re
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 from app.models.etf import ETF
 
 from .base import BaseCrawler
 
 logger = logging.getLogger(__name__)
 
+# 날짜(YYYY-MM-DD) 뒤에 올 수 있는 시각/타임존 접미사 (예: "T00:00:00-05:00")
+_TIME_SUFFIX_RE = re.compile(
+    r"T(?:[01]\d|2[0-3]):[0-5]\d(?::[0-5]\d(?:\.\d{1,6})?)?(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?",
+    re.ASCII,
+)
+
+
+# 보수율("0.0300" 등)과 수익률 문자열이 여러 펀드에 반복되므로 변환 결과를 캐시 (Decimal은 불변)
+@lru_cache(maxsize=4096, typed=True)
+def _to_decimal(value: str) -> Decimal:
+    """API 문자열 값을 Decimal로 변환"""
+    return Decimal(value)
+
 
 class VanguardCrawler(BaseCrawler):
     """Vanguard ETF 데이터 크롤러"""
@@ -18,26 +34,29 @@ class VanguardCrawler(BaseCrawler):
     # Vanguard JSON API URL
     BASE_URL = "https://investor.vanguard.com/investment-products/list/funddetail/all"
     
-    async def fetch_data(self) -> Any:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    
+    async def fetch_data(self, client: Optional[httpx.AsyncClient] = None) -> Any:
         """
         Vanguard API에서 JSON 데이터를 가져옵니다.
         
+        Args:
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
+        
         Returns:
             JSON 응답 데이터
         """
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-        ) as client:
-            response = await client.get(self.BASE_URL)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Fetched {data.get('size', 0)} Vanguard funds")
-            return data
+        if client is None:
+            client = await self._get_client()
+        
+        response = await client.get(self.BASE_URL, headers=self.HEADERS)
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        logger.info(f"Fetched {data.get('size', 0)} Vanguard funds")
+        return data
     
     def _parse_date(self, date_str: Optional[str]) -> Optional[date]:
         """
@@ -52,6 +71,20 @@ class VanguardCrawler(BaseCrawler):
         if not date_str:
             return None
         
+        # 빠른 경로: YYYY-MM-DD(+ 올바른 시각/타임존 접미사)이면 시각/타임존 파싱 없이 바로 변환
+        if (
+            (len(date_str) == 10 or _TIME_SUFFIX_RE.fullmatch(date_str, 10))
+            and date_str[4] == '-'
+            and date_str[7] == '-'
+        ):
+            year, month, day = date_str[:4], date_str[5:7], date_str[8:10]
+            digits = year + month + day
+            if digits.isascii() and digits.isdigit():
+                try:
+                    return date(int(year), int(month), int(day))
+                except ValueError:
+                    pass
+        
         try:
             # ISO 형식 파싱
             dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
@@ -90,22 +123,22 @@ class VanguardCrawler(BaseCrawler):
             
             # 가격 정보
             daily_price = entity.get('dailyPrice', {}).get('regular', {})
-            nav_amount = Decimal(daily_price.get('price', '0.00'))
+            nav_amount = _to_decimal(daily_price.get('price', '0.00'))
             nav_as_of = self._parse_date(daily_price.get('asOfDate'))
             
             # 비용 정보
-            expense_ratio = Decimal(profile.get('expenseRatio', '0.00'))
+            expense_ratio = _to_decimal(profile.get('expenseRatio', '0.00'))
             
             # 수익률 정보
             month_end_return = entity.get('monthEndAvgAnnualRtn', {})
             fund_return = month_end_return.get('fundReturn', {})
             
             ytd_return = None
-            one_year_return = Decimal(fund_return.get('oneYearPct', '0')) if fund_return.get('oneYearPct') else None
-            three_year_return = Decimal(fund_return.get('threeYearPct', '0')) if fund_return.get('threeYearPct') else None
-            five_year_return = Decimal(fund_return.get('fiveYearPct', '0')) if fund_return.get('fiveYearPct') else None
-            ten_year_return = Decimal(fund_return.get('tenYearPct', '0')) if fund_return.get('tenYearPct') else None
-            since_inception_return = Decimal(fund_return.get('sinceInceptionPct', '0')) if fund_return.get('sinceInceptionPct') else None
+            one_year_return = _to_decimal(fund_return.get('oneYearPct', '0')) if fund_return.get('oneYearPct') else None
+            three_year_return = _to_decimal(fund_return.get('threeYearPct', '0')) if fund_return.get('threeYearPct') else None
+            five_year_return = _to_decimal(fund_return.get('fiveYearPct', '0')) if fund_return.get('fiveYearPct') else None
+            ten_year_return = _to_decimal(fund_return.get('tenYearPct', '0')) if fund_return.get('tenYearPct') else None
+            since_inception_return = _to_decimal(fund_return.get('sinceInceptionPct', '0')) if fund_return.get('sinceInceptionPct') else None
             
             # 자산 분류
             asset_class = profile.get('style', 'Unknown')
@@ -114,7 +147,7 @@ class VanguardCrawler(BaseCrawler):
             
             # 배당 수익률
             yield_data = entity.get('yield', {})
-            distribution_yield = Decimal(yield_data.get('yieldPct', '0')) if yield_data.get('yieldPct') else None
+            distribution_yield = _to_decimal(yield_data.get('yieldPct', '0')) if yield_data.get('yieldPct') else None
             
             # URL
             product_page_url = f"https://investor.vanguard.com/investment-products/etfs/profile/{ticker.lower()}"
@@ -161,11 +194,10 @@ class VanguardCrawler(BaseCrawler):
         try:
             entities = raw_data.get('fund', {}).get('entity', [])
             
-            for entity in entities:
-                etf = self._extract_etf_data(entity)
-                if etf:
-                    etf_list.append(etf)
-                    logger.info(f"Successfully parsed {etf.ticker}")
+            etf_list = [
+                etf for entity in entities
+                if (etf := self._extract_etf_data(entity)) is not None
+            ]
             
             logger.info(f"Successfully parsed {len(etf_list)} Vanguard ETFs")
             
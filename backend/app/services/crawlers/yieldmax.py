@@ -2,12 +2,27 @@
 import re
 from datetime import date, datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
 import httpx
 from app.models.etf import ETF, DistributionFrequency
 from app.services.crawlers.base import BaseCrawler
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+# 숫자 파싱 전에 제거할 통화 기호/천 단위 구분자
+_STRIP_CHARS = str.maketrans('', '', '$,')
+_NUMBER_RE = re.compile(r'(\d+\.?\d*)')
+_AUM_RE = re.compile(r'([\d.]+)\s*([BMK])?')
+# AUM 단위 → millions 환산 배수 (K는 1000으로 나눔, 단위 없으면 millions로 가정)
+_AUM_MULTIPLIERS = {'B': 1000.0, 'M': 1.0}
+
+
+# 같은 보수율이 여러 ETF에 반복되므로 변환 결과를 캐시 (Decimal은 불변)
+@lru_cache(maxsize=1024)
+def _to_decimal(value: float) -> Decimal:
+    """파싱한 float 값을 Decimal로 변환 (repr 기준이므로 0.99 -> Decimal("0.99"))"""
+    return Decimal(str(value))
 
 
 class YieldmaxCrawler(BaseCrawler):
@@ -15,15 +30,23 @@ class YieldmaxCrawler(BaseCrawler):
     
     BASE_URL = "https://yieldmaxetfs.com/our-etfs/"
 
-    async def fetch_data(self) -> str:
-        """Yieldmax ETF 목록 페이지에서 HTML 가져오기"""
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = await client.get(self.BASE_URL, headers=headers)
-            response.raise_for_status()
-            return response.text
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    }
+
+    async def fetch_data(self, client: Optional[httpx.AsyncClient] = None) -> str:
+        """
+        Yieldmax ETF 목록 페이지에서 HTML 가져오기
+
+        Args:
+            client: 사용할 httpx.AsyncClient (없으면 크롤러 간 공유 클라이언트 사용)
+        """
+        if client is None:
+            client = await self._get_client()
+
+        response = await client.get(self.BASE_URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.text
 
     async def parse_data(self, html: str) -> list[ETF]:
         """
@@ -39,59 +62,56 @@ class YieldmaxCrawler(BaseCrawler):
         
         현재는 빈 리스트 반환
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # C 기반 HTML5 파서(lexbor)로 파싱
+        tree = LexborHTMLParser(html)
         etfs = []
         
         # TODO: JavaScript 렌더링 필요
         # fundsTableWrap ID를 가진 요소 내부의 table 찾기
-        table_wrap = soup.find(id='fundsTableWrap')
-        if not table_wrap:
+        table = tree.css_first('#fundsTableWrap table')
+        if table is None:
             return etfs
         
-        table = table_wrap.find('table')
-        if not table:
+        tbody = table.css_first('tbody')
+        if tbody is None:
             return etfs
         
-        tbody = table.find('tbody')
-        if not tbody:
-            return etfs
-        
-        rows = tbody.find_all('tr')
+        rows = tbody.css('tr')
         
         for row in rows:
-            cells = row.find_all('td')
+            cells = row.css('td')
             if len(cells) < 2:  # 최소한 ticker, name 필요
                 continue
             
             try:
                 # 실제 데이터 구조에 맞춰 조정 필요
-                ticker = cells[0].get_text(strip=True)
-                name = cells[1].get_text(strip=True)
+                ticker = cells[0].text(strip=True)
+                name = cells[1].text(strip=True)
                 
                 # 상세 페이지 링크 찾기
                 detail_link: Optional[str] = None
-                link_elem = cells[0].find('a') or cells[1].find('a')
-                if link_elem:
-                    href = link_elem.get('href')
-                    if href and isinstance(href, str):
+                link_elem = cells[0].css_first('a') or cells[1].css_first('a')
+                if link_elem is not None:
+                    href = link_elem.attributes.get('href')
+                    if href:
                         detail_link = href if href.startswith('http') else f"https://yieldmaxetfs.com{href}"
                 
                 # Expense ratio 파싱 (있는 경우)
                 expense_ratio = None
                 if len(cells) > 2:
-                    expense_text = cells[2].get_text(strip=True)
+                    expense_text = cells[2].text(strip=True)
                     expense_ratio = self._parse_expense_ratio(expense_text)
                 
                 # AUM 파싱 (있는 경우)
                 aum = None
                 if len(cells) > 3:
-                    aum_text = cells[3].get_text(strip=True)
+                    aum_text = cells[3].text(strip=True)
                     aum = self._parse_aum(aum_text)
                 
                 # Inception date 파싱 (있는 경우)
                 inception_date = None
                 if len(cells) > 4:
-                    date_text = cells[4].get_text(strip=True)
+                    date_text = cells[4].text(strip=True)
                     inception_date = self._parse_inception_date(date_text)
                 
                 etf = ETF(
@@ -102,7 +122,7 @@ class YieldmaxCrawler(BaseCrawler):
                     inception_date=inception_date or date.today(),
                     nav_amount=Decimal("0.00"),
                     nav_as_of=date.today(),
-                    expense_ratio=Decimal(str(expense_ratio)) if expense_ratio else Decimal("0.00"),
+                    expense_ratio=_to_decimal(expense_ratio) if expense_ratio else Decimal("0.00"),
                     ytd_return=None,
                     one_year_return=None,
                     three_year_return=None,
@@ -130,8 +150,8 @@ class YieldmaxCrawler(BaseCrawler):
         if not text:
             return None
         
-        # % 제거하고 숫자만 추출
-        match = re.search(r'(\d+\.?\d*)', text.replace(',', ''))
+        # 쉼표 제거하고 숫자만 추출
+        match = _NUMBER_RE.search(text.translate(_STRIP_CHARS))
         if match:
             try:
                 return float(match.group(1))
@@ -144,28 +164,19 @@ class YieldmaxCrawler(BaseCrawler):
         if not text:
             return None
         
-        # $, 쉼표 제거
-        cleaned = text.replace('$', '').replace(',', '').strip().upper()
-        
-        # 숫자와 단위(B/M/K) 추출
-        match = re.search(r'([\d.]+)\s*([BMK])?', cleaned)
+        # $, 쉼표 제거 후 숫자와 단위(B/M/K) 추출
+        match = _AUM_RE.search(text.translate(_STRIP_CHARS).upper())
         if match:
             try:
                 value = float(match.group(1))
-                unit = match.group(2)
-                
-                # 단위에 따라 millions로 변환
-                if unit == 'B':  # Billions
-                    return value * 1000.0
-                elif unit == 'M':  # Millions
-                    return value
-                elif unit == 'K':  # Thousands
-                    return value / 1000.0
-                else:
-                    # 단위 없으면 그대로 (millions 단위로 가정)
-                    return value
             except ValueError:
                 return None
+            
+            # 단위에 따라 millions로 변환
+            unit = match.group(2)
+            if unit == 'K':  # Thousands
+                return value / 1000.0
+            return value * _AUM_MULTIPLIERS.get(unit, 1.0)
         return None
 
     def _parse_inception_date(self, text: str) -> Optional[datetime]:
@@ -173,6 +184,18 @@ class YieldmaxCrawler(BaseCrawler):
         if not text:
             return None
         
+        text = text.strip()
+        
+        # 빠른 경로: 0으로 채운 MM/DD/YYYY, YYYY-MM-DD는 strptime 없이 바로 변환
+        if len(text) == 10:
+            try:
+                if text[2] == '/' and text[5] == '/':
+                    return datetime(int(text[6:]), int(text[:2]), int(text[3:5]))
+                if text[4] == '-' and text[7] == '-':
+                    return datetime(int(text[:4]), int(text[5:7]), int(text[8:]))
+            except ValueError:
+                pass
+        
         # 일반적인 날짜 형식들 시도
         date_formats = [
             '%m/%d/%Y',  # 01/15/2023
@@ -183,7 +206,7 @@ class YieldmaxCrawler(BaseCrawler):
         
         for fmt in date_formats:
             try:
-                return datetime.strptime(text.strip(), fmt)
+                return datetime.strptime(text, fmt)
             except ValueError:
                 continue
         
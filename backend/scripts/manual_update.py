@@ -7,6 +7,7 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
+from app.services.crawlers import BaseCrawler
 from app.services.etf_updater import ETFUpdater
 
 
@@ -17,7 +18,10 @@ async def main():
     print("Starting manual ETF data update...")
     print("=" * 60)
     
-    result = await updater.update_all_providers()
+    try:
+        result = await updater.update_all_providers()
+    finally:
+        await BaseCrawler.close_client()
     
     print("\n" + "=" * 60)
     print("Update Summary:")
@@ -0,0 +1,78 @@
+"""httpx.AsyncClient 모킹 헬퍼"""
+import orjson
+
+
+class FakeResponse:
+    """httpx.Response 대용 경량 응답 객체 (MagicMock보다 생성 비용이 훨씬 작음)"""
+
+    __slots__ = ("_json", "text")
+
+    def __init__(self, json=None, text=None):
+        self._json = json
+        self.text = text
+
+    @property
+    def content(self) -> bytes:
+        if self._json is not None:
+            return orjson.dumps(self._json)
+        return (self.text or "").encode()
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def async_return(value):
+    """항상 value를 반환하는 비동기 함수 (AsyncMock(return_value=...) 대체)"""
+
+    async def _f(*args, **kwargs):
+        return value
+
+    return _f
+
+
+def async_raise(exc):
+    """항상 exc를 발생시키는 비동기 함수 (AsyncMock(side_effect=...) 대체)"""
+
+    async def _f(*args, **kwargs):
+        raise exc
+
+    return _f
+
+
+class FakeAsyncClient:
+    """`async with` 진입 시 자기 자신을 반환하는 httpx.AsyncClient 대용 객체"""
+
+    __slots__ = ("get", "post")
+
+    def __init__(self, method):
+        self.get = method
+        self.post = method
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+def fake_async_client(*, json=None, text=None, exc=None):
+    """
+    크롤러에 client 인자로 주입할 httpx.AsyncClient 모의 객체를 생성합니다.
+
+    Args:
+        json: response.json() / response.content로 반환할 데이터
+        text: response.text로 반환할 문자열
+        exc: get/post 호출 시 발생시킬 예외
+
+    Returns:
+        get/post가 같은 응답(또는 예외)을 돌려주는 모의 클라이언트
+    """
+    if exc:
+        method = async_raise(exc)
+    else:
+        method = async_return(FakeResponse(json=json, text=text))
+    return FakeAsyncClient(method)
+
@@ -1,7 +1,139 @@
 """pytest 설정 파일"""
+import asyncio
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+import httpx
+import orjson
+import pytest
+
 # backend 디렉토리를 Python path에 추가
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
+
+# 테스트용 샘플 응답 JSON 디렉토리
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@lru_cache(maxsize=None)
+def _load_json(name: str):
+    """data/ 디렉토리의 JSON 파일을 한 번만 읽어 파싱"""
+    return orjson.loads((DATA_DIR / name).read_bytes())
+
+
+@pytest.fixture(scope="session")
+def load_sample_json():
+    """샘플 JSON 로더 (같은 파일은 세션 내에서 같은 객체를 반환하므로 수정하지 말 것)"""
+    return _load_json
+
+
+@pytest.fixture(scope="session")
+async def http_client():
+    """integration 테스트용 HTTP/2 클라이언트 (커넥션 풀/TLS 세션을 세션 동안 재사용)"""
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        follow_redirects=True,
+        headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    ) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """
+    FastAPI 앱에 ASGI로 직접 요청하는 세션 공유 클라이언트
+
+    startup 이벤트(전체 ETF 로드, 스케줄러 시작)는 실행하지 않으므로 라우트 단위 테스트에 사용
+    """
+    from app.main import app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    ) as api_client:
+        yield api_client
+
+
+@pytest.fixture(scope="session")
+async def all_providers_data(http_client):
+    """실제 Invesco/iShares API 데이터를 공유 클라이언트로 동시에 가져옴"""
+    from app.services.crawlers.invesco import InvescoCrawler
+    from app.services.crawlers.ishares import ISharesCrawler
+
+    invesco, ishares = await asyncio.gather(
+        InvescoCrawler().fetch_data(client=http_client),
+        ISharesCrawler().fetch_data(client=http_client),
+    )
+    return {"invesco": invesco, "ishares": ishares}
+
+
+@pytest.fixture(scope="session")
+def invesco_real_api_data(all_providers_data):
+    """실제 Invesco API 데이터 (세션당 한 번만 호출)"""
+    return all_providers_data["invesco"]
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """비동기 테스트에 uvloop 이벤트 루프 사용 (Windows 및 미설치 환경은 기본 루프)"""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            return {"uvloop": uvloop.new_event_loop}
+        except ImportError:
+            pass
+    return {"asyncio": asyncio.new_event_loop}
+
+
+def pytest_runtest_setup(item):
+    """
+    integration 테스트가 아닌 테스트에서는 소켓 생성을 차단하여
+    모킹되지 않은 네트워크 호출이 타임아웃 대신 SocketBlockedError로 즉시 드러나도록 함
+    (pytest-socket 미설치 환경에서는 차단하지 않음)
+    """
+    try:
+        from pytest_socket import disable_socket
+    except ImportError:
+        return
+    if not item.get_closest_marker("integration"):
+        # 이벤트 루프의 self-pipe(socketpair)는 유닉스 소켓이므로 허용
+        disable_socket(allow_unix_socket=True)
+
+
+def pytest_addoption(parser):
+    """명령행 옵션 등록"""
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="실제 외부 API를 호출하는 integration 테스트 실행 (RUN_INTEGRATION_TESTS=1과 동일)",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    integration 테스트는 --run-integration 옵션 또는 RUN_INTEGRATION_TESTS=1 환경 변수가
+    있을 때만 실행하며, 하나의 xdist 워커에 묶어 외부 사이트에 동시 요청이 몰리지 않도록 함
+
+    나머지 테스트는 파일 단위로 같은 워커에 배정(--dist loadfile과 동일)하여
+    모듈 스코프 픽스처가 워커마다 다시 만들어지지 않도록 함
+    """
+    run_integration = (
+        config.getoption("--run-integration")
+        or os.environ.get("RUN_INTEGRATION_TESTS") == "1"
+    )
+    skip_integration = pytest.mark.skip(
+        reason="--run-integration 옵션 또는 RUN_INTEGRATION_TESTS=1 환경 변수가 필요합니다"
+    )
+    for item in items:
+        if item.get_closest_marker("integration"):
+            if run_integration:
+                item.add_marker(pytest.mark.xdist_group("integration"))
+            else:
+                item.add_marker(skip_integration)
+        else:
+            item.add_marker(pytest.mark.xdist_group(item.nodeid.split("::", 1)[0]))
@@ -1,9 +1,10 @@
 """Tests for Global X, Direxion, and PIMCO ETF crawlers"""
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import respx
 
 from backend.app.services.crawlers.direxion import DirexionCrawler
 from backend.app.services.crawlers.globalx import GlobalXCrawler
@@ -20,28 +21,25 @@ class TestGlobalXCrawler:
         assert crawler.provider_name == "GlobalX"
         assert "globalxetfs.com" in crawler.base_url
 
+    @respx.mock
     @pytest.mark.asyncio
     async def test_fetch_data_success(self, crawler):
         """Test successful data fetching"""
-        mock_response = AsyncMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.raise_for_status = AsyncMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            result = await crawler.fetch_data()
+        respx.get(crawler.explore_url).mock(
+            return_value=httpx.Response(200, text="<html><body>Test</body></html>")
+        )
+
+        result = await crawler.fetch_data()
 
         assert result == "<html><body>Test</body></html>"
 
+    @respx.mock
     @pytest.mark.asyncio
     async def test_fetch_data_error(self, crawler):
         """Test data fetching with error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_get = AsyncMock(side_effect=Exception("Network error"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            result = await crawler.fetch_data()
+        respx.get(crawler.explore_url).mock(side_effect=httpx.ConnectError("Network error"))
+
+        result = await crawler.fetch_data()
 
         assert result is None
 
@@ -50,6 +48,48 @@ class TestGlobalXCrawler:
         result = crawler.parse_data("")
         assert result == []
 
+    def test_parse_data_success(self, crawler, monkeypatch):
+        """Test parsing ETF links from HTML"""
+        monkeypatch.setattr(
+            "backend.app.services.crawlers.globalx.enrich_etf_with_yfinance",
+            lambda ticker, nav, expense, inception: (nav, expense, inception),
+        )
+        html = """
+        <html><body>
+            <a href="/funds/qyld/">Global X NASDAQ 100 Covered Call ETF</a>
+            <a href="https://www.globalxetfs.com/funds/BOTZ">Global X Robotics ETF</a>
+            <a href="/funds/qyld/holdings">Holdings</a>
+            <a href="/about">About</a>
+        </body></html>
+        """
+
+        result = crawler.parse_data(html)
+
+        assert [etf.ticker for etf in result] == ["QYLD", "BOTZ"]
+        assert result[0].fund_name == "Global X NASDAQ 100 Covered Call ETF"
+        assert result[0].product_page_url == "https://www.globalxetfs.com/funds/qyld/"
+        assert result[1].product_page_url == "https://www.globalxetfs.com/funds/BOTZ"
+
+    @pytest.mark.parametrize("html", ["   ", "\n"])
+    def test_parse_data_whitespace_only(self, crawler, html):
+        """Test parsing a whitespace-only body"""
+        assert crawler.parse_data(html) == []
+
+    def test_parse_data_xml_declaration(self, crawler, monkeypatch):
+        """Test parsing a str body that starts with an XML encoding declaration"""
+        monkeypatch.setattr(
+            "backend.app.services.crawlers.globalx.enrich_etf_with_yfinance",
+            lambda ticker, nav, expense, inception: (nav, expense, inception),
+        )
+        html = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            '<html><body><a href="/funds/qyld/">Global X NASDAQ 100 Covered Call ETF</a></body></html>'
+        )
+
+        result = crawler.parse_data(html)
+
+        assert [etf.ticker for etf in result] == ["QYLD"]
+
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_fetch_real_data(self, crawler):
@@ -69,30 +109,24 @@ class TestDirexionCrawler:
         assert crawler.provider_name == "Direxion"
         assert "direxion.com" in crawler.base_url
 
+    @respx.mock
     @pytest.mark.asyncio
     async def test_fetch_data_success(self, crawler):
-        """Test successful data fetching"""
-        mock_response = AsyncMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.raise_for_status = AsyncMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            result = await crawler.fetch_data()
+        """Test that the curated ETF list is returned without any HTTP request"""
+        result = await crawler.fetch_data()
 
-        assert result == "<html><body>Test</body></html>"
+        assert result == crawler.etf_list
+        assert not respx.calls
 
     @pytest.mark.asyncio
     async def test_fetch_data_error(self, crawler):
-        """Test data fetching with error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_get = AsyncMock(side_effect=Exception("Network error"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
+        """Test that network errors do not affect the curated ETF list"""
+        with respx.mock(assert_all_called=False) as router:
+            router.route().mock(side_effect=httpx.ConnectError("Network error"))
+
             result = await crawler.fetch_data()
 
-        assert result is None
+        assert result == crawler.etf_list
 
     def test_parse_data_empty(self, crawler):
         """Test parsing empty data"""
@@ -143,28 +177,26 @@ class TestPIMCOCrawler:
         assert crawler.provider_name == "PIMCO"
         assert "pimco.com" in crawler.api_url
 
+    @respx.mock
     @pytest.mark.asyncio
     async def test_fetch_data_success(self, crawler):
         """Test successful data fetching"""
-        mock_response = AsyncMock()
-        mock_response.json = lambda: {"data": []}
-        mock_response.raise_for_status = AsyncMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            result = await crawler.fetch_data()
+        route = respx.get(crawler.api_url).mock(
+            return_value=httpx.Response(200, json={"data": []})
+        )
+
+        result = await crawler.fetch_data()
 
         assert result == {"data": []}
+        assert route.calls.last.request.url.params["selectedViewNav"] == "NAV"
 
+    @respx.mock
     @pytest.mark.asyncio
     async def test_fetch_data_error(self, crawler):
         """Test data fetching with error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_get = AsyncMock(side_effect=Exception("Network error"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            result = await crawler.fetch_data()
+        respx.get(crawler.api_url).mock(side_effect=httpx.ConnectError("Network error"))
+
+        result = await crawler.fetch_data()
 
         assert result is None
 
@@ -0,0 +1,64 @@
+"""BaseCrawler 공유 HTTP 클라이언트 테스트"""
+import asyncio
+
+import pytest
+from app.services.crawlers.base import BaseCrawler
+
+
+@pytest.fixture
+def isolated_client(monkeypatch):
+    """테스트 동안 세션에서 쓰는 공유 클라이언트와 분리된 빈 상태로 시작"""
+    monkeypatch.setattr(BaseCrawler, "_client", None)
+    monkeypatch.setattr(BaseCrawler, "_client_loop", None)
+
+
+class TestSharedClient:
+    """BaseCrawler._get_client / close_client 테스트"""
+
+    def test_same_loop_reuses_client(self, isolated_client):
+        """같은 이벤트 루프에서는 같은 클라이언트를 재사용하는지 테스트"""
+
+        async def get_twice():
+            first = await BaseCrawler._get_client()
+            second = await BaseCrawler._get_client()
+            await BaseCrawler.close_client()
+            return first, second
+
+        first, second = asyncio.run(get_twice())
+
+        assert first is second
+        assert first.is_closed
+
+    def test_loop_switch_closes_previous_client(self, isolated_client):
+        """이벤트 루프가 바뀌면 이전 클라이언트를 닫고 새로 만드는지 테스트"""
+        first = asyncio.run(BaseCrawler._get_client())
+        assert not first.is_closed
+
+        async def get_in_new_loop():
+            client = await BaseCrawler._get_client()
+            return client, first.is_closed
+
+        second, first_closed_on_switch = asyncio.run(get_in_new_loop())
+
+        assert second is not first
+        assert first_closed_on_switch
+        assert not second.is_closed
+
+        asyncio.run(BaseCrawler.close_client())
+        assert second.is_closed
+        assert BaseCrawler._client is None
+
+    def test_loop_switch_concurrent_callers_share_client(self, isolated_client):
+        """루프 전환 직후 동시에 호출해도 새 클라이언트는 하나만 만들어지는지 테스트"""
+        first = asyncio.run(BaseCrawler._get_client())
+
+        async def get_concurrently():
+            clients = await asyncio.gather(*(BaseCrawler._get_client() for _ in range(4)))
+            await BaseCrawler.close_client()
+            return clients
+
+        clients = asyncio.run(get_concurrently())
+
+        assert first.is_closed
+        assert len({id(client) for client in clients}) == 1
+        assert clients[0] is not first
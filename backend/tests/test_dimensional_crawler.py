@@ -1,9 +1,10 @@
 """Dimensional Fund Advisors 크롤러 테스트"""
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+import respx
 from app.models.etf import ETF
 from app.services.crawlers.dimensional import DimensionalCrawler
 
@@ -177,6 +178,15 @@ def sample_dimensional_response():
     }
 
 
+@pytest.fixture
+def mocked_dimensional_api(sample_dimensional_response):
+    """Dimensional API 요청을 샘플 응답으로 대체하는 respx 라우트"""
+    with respx.mock(assert_all_called=False) as router:
+        yield router.get(DimensionalCrawler.BASE_URL).mock(
+            return_value=httpx.Response(200, json=sample_dimensional_response)
+        )
+
+
 @pytest.fixture
 def crawler():
     """DimensionalCrawler 인스턴스"""
@@ -292,19 +302,16 @@ class TestDimensionalCrawler:
         assert etf is None
     
     @pytest.mark.asyncio
-    async def test_fetch_data_mock(self, crawler, sample_dimensional_response):
+    async def test_fetch_data_mock(self, crawler, sample_dimensional_response, mocked_dimensional_api):
         """fetch_data 메서드 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_dimensional_response
-        mock_response.raise_for_status = MagicMock()
+        data = await crawler.fetch_data()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            data = await crawler.fetch_data()
-            
-            assert data == sample_dimensional_response
-            assert len(data['data']['portfolios']) == 3
+        assert data == sample_dimensional_response
+        assert len(data['data']['portfolios']) == 3
+        
+        request = mocked_dimensional_api.calls.last.request
+        assert request.url.params['allowMorningstarFixedIncome'] == 'true'
+        assert request.headers['X-Selected-Country'] == 'US'
     
     @pytest.mark.asyncio
     async def test_parse_data(self, crawler, sample_dimensional_response):
@@ -332,20 +339,13 @@ class TestDimensionalCrawler:
         assert len(etf_list2) == 0
     
     @pytest.mark.asyncio
-    async def test_crawl_integration_mock(self, crawler, sample_dimensional_response):
+    async def test_crawl_integration_mock(self, crawler, mocked_dimensional_api):
         """전체 크롤링 프로세스 통합 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_dimensional_response
-        mock_response.raise_for_status = MagicMock()
+        etf_list = await crawler.crawl()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            etf_list = await crawler.crawl()
-            
-            assert len(etf_list) == 2
-            assert all(isinstance(etf, ETF) for etf in etf_list)
-            assert all(etf.ticker for etf in etf_list)
+        assert len(etf_list) == 2
+        assert all(isinstance(etf, ETF) for etf in etf_list)
+        assert all(etf.ticker for etf in etf_list)
 
 
 class TestDimensionalCrawlerIntegration:
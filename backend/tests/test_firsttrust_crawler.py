@@ -1,15 +1,17 @@
 """Tests for First Trust ETF crawler"""
+import asyncio
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import respx
 
 from backend.app.services.crawlers.firsttrust import FirstTrustCrawler
 
 
 class TestFirstTrustCrawler:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def crawler(self):
         return FirstTrustCrawler()
 
@@ -63,31 +65,53 @@ class TestFirstTrustCrawler:
         assert "ftportfolios.com" in crawler.base_url
         assert "etflist.aspx" in crawler.etf_list_url
 
+    @respx.mock
     @pytest.mark.asyncio
     async def test_fetch_data_success(self, crawler):
         """Test successful data fetching"""
-        mock_response = AsyncMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.raise_for_status = AsyncMock()
+        respx.get(crawler.etf_list_url).mock(
+            return_value=httpx.Response(200, text="<html><body>Test</body></html>")
+        )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            result = await crawler.fetch_data()
+        result = await crawler.fetch_data()
 
         assert result == "<html><body>Test</body></html>"
 
+    @respx.mock
     @pytest.mark.asyncio
     async def test_fetch_data_error(self, crawler):
         """Test data fetching with HTTP error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_get = AsyncMock(side_effect=Exception("Network error"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            result = await crawler.fetch_data()
+        respx.get(crawler.etf_list_url).mock(return_value=httpx.Response(500))
+
+        result = await crawler.fetch_data()
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_fetch_urls_concurrent(self, crawler, monkeypatch):
+        """Test fetching many detail URLs concurrently"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_get(self, url, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            status_code = 500 if url.endswith("/13") else 200
+            return httpx.Response(status_code, text=url, request=httpx.Request("GET", url))
+
+        urls = [f"{crawler.base_url}/etf/{i}" for i in range(100)]
+        monkeypatch.setattr(httpx.AsyncClient, "get", fake_get)
+        results = await crawler._fetch_urls(urls, max_concurrency=8)
+
+        assert len(results) == 100
+        assert results[0] == urls[0]
+        assert results[99] == urls[99]
+        assert isinstance(results[13], Exception)
+        assert 1 < max_in_flight <= 8
+
     def test_parse_data_empty(self, crawler):
         """Test parsing empty data"""
         result = crawler.parse_data("")
@@ -101,9 +125,10 @@ class TestFirstTrustCrawler:
         result = crawler.parse_data(sample_html)
 
         assert len(result) == 3
+        by_ticker = {etf["ticker"]: etf for etf in result}
 
         # Check FAAR
-        faar = next((etf for etf in result if etf["ticker"] == "FAAR"), None)
+        faar = by_ticker.get("FAAR")
         assert faar is not None
         assert faar["name"] == "First Trust Alternative Absolute Return Strategy ETF"
         assert faar["inception_date"] == date(2016, 5, 18)
@@ -112,7 +137,7 @@ class TestFirstTrustCrawler:
         assert "/etfsummary.aspx?Ticker=FAAR" in faar["detail_url"]
 
         # Check SKYY
-        skyy = next((etf for etf in result if etf["ticker"] == "SKYY"), None)
+        skyy = by_ticker.get("SKYY")
         assert skyy is not None
         assert "Cloud Computing" in skyy["name"]
         assert skyy["inception_date"] == date(2011, 7, 5)
@@ -120,7 +145,7 @@ class TestFirstTrustCrawler:
         assert skyy["expense_ratio"] is None  # No SEC yield
 
         # Check FDN
-        fdn = next((etf for etf in result if etf["ticker"] == "FDN"), None)
+        fdn = by_ticker.get("FDN")
         assert fdn is not None
         assert "Internet" in fdn["name"]
         assert fdn["inception_date"] == date(2006, 6, 19)
@@ -145,6 +170,48 @@ class TestFirstTrustCrawler:
         assert crawler._find_column_index(headers, "inception") == 2
         assert crawler._find_column_index(headers, "nonexistent") is None
 
+    def test_column_indices(self, crawler):
+        """Test mapping header texts to row extractor column indices"""
+        headers = [
+            "Fund Name", "Ticker Symbol", "Inception Date", "Close NAV",
+            "30-Day SEC Yield", "Unsubsidized 30-Day SEC Yield", "Fact Sheet",
+        ]
+        assert crawler._column_indices(headers) == (0, 1, 2, 3, 4)
+
+        # Reordered columns
+        headers = ["Ticker Symbol", "Close NAV", "Fund Name", "Inception Date"]
+        assert crawler._column_indices(headers) == (2, 0, 3, 1, None)
+
+        # Not an ETF table: default First Trust column order
+        assert crawler._column_indices(["Column1", "Column2"]) == (0, 1, 2, 3, 4)
+
+    def test_parse_data_reordered_columns(self, crawler, monkeypatch):
+        """Test parsing a results table whose columns are reordered"""
+        monkeypatch.setattr(
+            "backend.app.services.crawlers.firsttrust.enrich_etf_with_yfinance",
+            lambda ticker, nav, expense, inception: (nav, expense, inception),
+        )
+        html = """
+        <table class="searchResults">
+            <tr><th>Ticker Symbol</th><th>Close NAV</th><th>Fund Name</th><th>Inception Date</th></tr>
+            <tr>
+                <td>FDN</td>
+                <td>$266.88</td>
+                <td><a href="/Retail/etf/etfsummary.aspx?Ticker=FDN">First Trust Dow Jones Internet Index Fund</a></td>
+                <td>06/19/06</td>
+            </tr>
+        </table>
+        """
+
+        result = crawler.parse_data(html)
+
+        assert len(result) == 1
+        assert result[0].ticker == "FDN"
+        assert result[0].fund_name == "First Trust Dow Jones Internet Index Fund"
+        assert result[0].nav_amount == Decimal("266.88")
+        assert result[0].inception_date == date(2006, 6, 19)
+        assert result[0].distribution_yield is None
+
     def test_parse_date(self, crawler):
         """Test date parsing"""
         assert crawler._parse_date("05/18/16") == date(2016, 5, 18)
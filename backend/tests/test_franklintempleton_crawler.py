@@ -2,18 +2,21 @@
 
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
+import respx
 
 from backend.app.services.crawlers.franklintempleton import \
     FranklinTempletonCrawler
 
+FRANKLIN_API_URL = "https://www.franklintempleton.com/api/pds/price-and-performance?op=UsPpss&pt=etf&id=1"
+
 
 class TestFranklinTempletonCrawler:
     """Franklin Templeton 크롤러 테스트"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def crawler(self):
         """크롤러 인스턴스 생성"""
         return FranklinTempletonCrawler()
@@ -46,38 +49,22 @@ class TestFranklinTempletonCrawler:
         """크롤러 초기화 테스트"""
         assert crawler.provider_name == "Franklin Templeton"
 
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_success(self, crawler, sample_response, monkeypatch):
+    async def test_fetch_data_success(self, crawler, sample_response):
         """데이터 가져오기 성공 테스트"""
-        mock_response = MagicMock()
-        mock_response.json = lambda: sample_response
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
+        respx.post(FRANKLIN_API_URL).mock(
+            return_value=httpx.Response(200, json=sample_response)
+        )
 
         result = await crawler.fetch_data()
         assert result == sample_response
 
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_error(self, crawler, monkeypatch):
+    async def test_fetch_data_error(self, crawler):
         """데이터 가져오기 실패 테스트"""
-        import httpx
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.post = AsyncMock(
-            side_effect=httpx.HTTPError("Network error")
-        )
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
+        respx.post(FRANKLIN_API_URL).mock(return_value=httpx.Response(500))
 
         with pytest.raises(httpx.HTTPError):
             await crawler.fetch_data()
@@ -144,6 +131,37 @@ class TestFranklinTempletonCrawler:
         etf_list = crawler.parse_data(data)
         assert len(etf_list) == 0
 
+    def test_parse_data_keeps_duplicate_tickers(self, crawler):
+        """여러 펀드에 같은 티커가 있으면 응답 순서대로 모두 반환하는지 테스트"""
+        data = {
+            "data": {
+                "PPSS": [
+                    {
+                        "fundid": "001",
+                        "fundname": "Franklin U.S. Core Bond ETF",
+                        "shareclass": [
+                            {"identifiers": {"ticker": "FLCB"}},
+                        ],
+                    },
+                    {
+                        "fundid": "002",
+                        "fundname": "Franklin U.S. Core Bond ETF (Duplicate)",
+                        "shareclass": [
+                            {"identifiers": {"ticker": "FLCB"}},
+                        ],
+                    },
+                ]
+            }
+        }
+
+        etf_list = crawler.parse_data(data)
+
+        assert [etf.ticker for etf in etf_list] == ["FLCB", "FLCB"]
+        assert [etf.fund_name for etf in etf_list] == [
+            "Franklin U.S. Core Bond ETF",
+            "Franklin U.S. Core Bond ETF (Duplicate)",
+        ]
+
     @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_fetch_real_data(self, crawler):
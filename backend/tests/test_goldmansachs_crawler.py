@@ -1,31 +1,35 @@
 """Goldman Sachs ETF 크롤러 테스트"""
 from datetime import date, datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
-
 import httpx
+import orjson
 import pytest
+import respx
 from app.models.etf import ETF, DistributionFrequency
 from app.services.crawlers.goldmansachs import GoldmanSachsCrawler
 
 
+@pytest.fixture(scope="module")
+def crawler():
+    """모듈 전체에서 공유하는 크롤러 인스턴스"""
+    return GoldmanSachsCrawler()
+
+
 class TestGoldmanSachsCrawlerInit:
     """초기화 테스트"""
     
-    def test_base_url(self):
+    def test_base_url(self, crawler):
         """BASE_URL이 올바르게 설정되어 있는지 확인"""
-        crawler = GoldmanSachsCrawler()
         assert crawler.BASE_URL == "https://am.gs.com/services/funds"
 
 
 class TestGoldmanSachsCrawlerFetch:
     """데이터 가져오기 테스트"""
     
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_success(self):
+    async def test_fetch_data_success(self, crawler):
         """정상적으로 GraphQL API에서 데이터를 가져오는지 테스트"""
-        crawler = GoldmanSachsCrawler()
-        
         mock_response_data = {
             "data": {
                 "fundData": {
@@ -40,37 +44,34 @@ class TestGoldmanSachsCrawlerFetch:
             }
         }
         
-        mock_response = MagicMock()
-        mock_response.json.return_value = mock_response_data
-        mock_response.raise_for_status = MagicMock()
+        route = respx.post(crawler.BASE_URL).mock(
+            return_value=httpx.Response(200, json=mock_response_data)
+        )
+        
+        result = await crawler.fetch_data()
+        assert result == mock_response_data
+        assert "data" in result
         
-        with patch("httpx.AsyncClient.post", return_value=mock_response):
-            result = await crawler.fetch_data()
-            assert result == mock_response_data
-            assert "data" in result
+        request = route.calls.last.request
+        assert orjson.loads(request.content)["operationName"] == "getFunds"
+        assert request.headers["content-type"] == "application/json"
     
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_http_error(self):
+    async def test_fetch_data_http_error(self, crawler):
         """HTTP 오류 발생 시 예외가 발생하는지 테스트"""
-        crawler = GoldmanSachsCrawler()
+        respx.post(crawler.BASE_URL).mock(return_value=httpx.Response(404))
         
-        with patch("httpx.AsyncClient.post", side_effect=httpx.HTTPStatusError(
-            "404 Not Found",
-            request=AsyncMock(),
-            response=AsyncMock(status_code=404)
-        )):
-            with pytest.raises(httpx.HTTPStatusError):
-                await crawler.fetch_data()
+        with pytest.raises(httpx.HTTPStatusError):
+            await crawler.fetch_data()
 
 
 class TestGoldmanSachsCrawlerParse:
     """GraphQL 응답 파싱 테스트"""
     
     @pytest.mark.asyncio
-    async def test_parse_data_with_mock_response(self):
+    async def test_parse_data_with_mock_response(self, crawler):
         """모의 GraphQL 응답을 파싱하는지 테스트"""
-        crawler = GoldmanSachsCrawler()
-        
         mock_data = {
             "data": {
                 "fundData": {
@@ -125,10 +126,8 @@ class TestGoldmanSachsCrawlerParse:
         assert etf.detail_page_url and "GHYB" in etf.detail_page_url
     
     @pytest.mark.asyncio
-    async def test_parse_data_filters_non_etf(self):
+    async def test_parse_data_filters_non_etf(self, crawler):
         """ETF가 아닌 펀드는 필터링하는지 테스트"""
-        crawler = GoldmanSachsCrawler()
-        
         mock_data = {
             "data": {
                 "fundData": {
@@ -162,42 +161,163 @@ class TestGoldmanSachsCrawlerParse:
         assert etfs[0].ticker == "TETF"
     
     @pytest.mark.asyncio
-    async def test_parse_data_empty_response(self):
+    async def test_parse_data_skips_null_identifiers(self, crawler):
+        """isin이나 fundName이 null인 share class는 건너뛰는지 테스트"""
+        mock_data = {
+            "data": {
+                "fundData": {
+                    "funds": [
+                        {
+                            "fundName": "Test ETF",
+                            "fundType": "ETF",
+                            "shareClasses": [
+                                {"ticker": "NULLISIN", "isin": None},
+                                {"ticker": "TETF"},
+                            ]
+                        },
+                        {
+                            "fundName": None,
+                            "fundType": "ETF",
+                            "shareClasses": [{"ticker": "NONAME"}]
+                        }
+                    ]
+                }
+            }
+        }
+
+        etfs = await crawler.parse_data(mock_data)
+
+        assert [etf.ticker for etf in etfs] == ["TETF"]
+    
+    @pytest.mark.asyncio
+    async def test_parse_data_empty_response(self, crawler):
         """빈 응답을 안전하게 처리하는지 테스트"""
-        crawler = GoldmanSachsCrawler()
-        
         empty_data = {"data": {"fundData": {"funds": []}}}
         
         etfs = await crawler.parse_data(empty_data)
         assert etfs == []
 
+    @pytest.mark.asyncio
+    async def test_iter_etfs_streams_funds(self, crawler):
+        """바이트 청크 스트림에서 펀드 단위로 ETF를 생성하는지 테스트"""
+        mock_data = {
+            "data": {
+                "fundData": {
+                    "funds": [
+                        {
+                            "fundName": "Mutual Fund",
+                            "fundType": "MUTUAL_FUND",
+                            "shareClasses": [{"ticker": "MFUND"}]
+                        },
+                        {
+                            "fundName": "Test ETF",
+                            "fundType": "ETF",
+                            "shareClasses": [
+                                {
+                                    "ticker": "TETF",
+                                    "shareClassInceptionDate": "2020-01-01",
+                                    "dailyPerformance": {
+                                        "nav": {"value": 50.25}
+                                    }
+                                }
+                            ]
+                        }
+                    ]
+                }
+            }
+        }
+        payload = orjson.dumps(mock_data)
+
+        async def chunks():
+            for i in range(0, len(payload), 16):
+                yield payload[i:i + 16]
+
+        etfs = [etf async for etf in crawler.iter_etfs(chunks())]
+
+        assert len(etfs) == 1
+        assert etfs[0].ticker == "TETF"
+        assert etfs[0].nav_amount == Decimal("50.25")
+        assert etfs[0].inception_date == date(2020, 1, 1)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_crawl_streams_same_etfs_as_parse_data(self, crawler):
+        """스트리밍 crawl()이 같은 응답에 대해 parse_data와 동일한 ETF를 반환하는지 테스트"""
+        mock_data = {
+            "data": {
+                "fundData": {
+                    "funds": [
+                        {
+                            "fundName": "Goldman Sachs ActiveBeta U.S. Large Cap Equity ETF",
+                            "fundType": "ETF",
+                            "pvNumber": "12345",
+                            "shareClasses": [
+                                {
+                                    "shareClassId": "111",
+                                    "ticker": "GSLC",
+                                    "shareClassInceptionDate": "2015-09-17",
+                                    "distributionFrequency": "QUARTERLY",
+                                    "dailyPerformance": {
+                                        "nav": {"asAtDate": "2025-11-26", "value": "120.15"}
+                                    },
+                                    "monthlyPerformance": {"annualisedReturns1yr": "12.3"}
+                                }
+                            ]
+                        },
+                        {
+                            "fundName": "Mutual Fund",
+                            "fundType": "MUTUAL_FUND",
+                            "shareClasses": [{"ticker": "MFUND"}]
+                        },
+                        {
+                            "fundName": "Goldman Sachs Access Treasury 0-1 Year ETF",
+                            "fundType": "ETF",
+                            "shareClasses": [
+                                {
+                                    "ticker": "GBIL",
+                                    "shareClassInceptionDate": "2016-09-06",
+                                    "distributionFrequency": "MONTHLY",
+                                    "dailyPerformance": {"nav": {"value": "100.02"}}
+                                }
+                            ]
+                        }
+                    ]
+                }
+            }
+        }
+
+        route = respx.post(crawler.BASE_URL).mock(
+            return_value=httpx.Response(200, content=orjson.dumps(mock_data))
+        )
+
+        streamed = await crawler.crawl()
+        parsed = await crawler.parse_data(mock_data)
+
+        assert route.called
+        assert [etf.ticker for etf in streamed] == ["GSLC", "GBIL"]
+        assert [etf.model_dump() for etf in streamed] == [etf.model_dump() for etf in parsed]
+
 
 class TestGoldmanSachsCrawlerHelpers:
     """헬퍼 메서드 테스트"""
     
-    def test_parse_date(self):
+    def test_parse_date(self, crawler):
         """날짜 파싱 테스트"""
-        crawler = GoldmanSachsCrawler()
-        
         assert crawler._parse_date("2017-09-05") == date(2017, 9, 5)
         assert crawler._parse_date("2025-11-26") == date(2025, 11, 26)
         assert crawler._parse_date("") is None
         assert crawler._parse_date(None) is None
         assert crawler._parse_date("invalid") is None
     
-    def test_parse_decimal(self):
+    def test_parse_decimal(self, crawler):
         """Decimal 파싱 테스트"""
-        crawler = GoldmanSachsCrawler()
-        
         assert crawler._parse_decimal("45.46") == Decimal("45.46")
         assert crawler._parse_decimal("8.5") == Decimal("8.5")
         assert crawler._parse_decimal(100) == Decimal("100")
         assert crawler._parse_decimal(None) is None
     
-    def test_map_distribution_frequency(self):
+    def test_map_distribution_frequency(self, crawler):
         """배당 빈도 매핑 테스트"""
-        crawler = GoldmanSachsCrawler()
-        
         assert crawler._map_distribution_frequency("MONTHLY") == DistributionFrequency.MONTHLY
         assert crawler._map_distribution_frequency("monthly") == DistributionFrequency.MONTHLY
         assert crawler._map_distribution_frequency("QUARTERLY") == DistributionFrequency.QUARTERLY
@@ -1,83 +1,40 @@
 """Invesco 크롤러 테스트"""
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
+import respx
 from app.models.etf import ETF
+from app.services.crawlers import invesco as invesco_module
 from app.services.crawlers.invesco import InvescoCrawler
 
+_DEC_ZERO_00 = Decimal("0.00")
+
+
+@pytest.fixture(scope="module")
+def sample_invesco_response(load_sample_json):
+    """Invesco API 응답 샘플 데이터 (모듈 내 테스트가 공유하므로 수정하지 말 것)"""
+    return load_sample_json("invesco_sample.json")
 
-@pytest.fixture
-def sample_invesco_response():
-    """Invesco API 응답 샘플 데이터"""
-    return {
-        "responseHeader": {
-            "zkConnected": True,
-            "status": 0,
-            "QTime": 15
-        },
-        "response": {
-            "numFound": 240,
-            "start": 0,
-            "numFoundExact": True,
-            "docs": [
-                {
-                    "url": "/content/invesco/us/en/financial-products/etfs/invesco-qqq-trust-series-1.html",
-                    "title": "Invesco QQQ Trust Series 1",
-                    "isin": "US46090E1038",
-                    "cusip": "46090E103",
-                    "uniqueIdentifier": "cusip",
-                    "accountName": "Invesco QQQ Trust Series 1",
-                    "assetClass": "Equity",
-                    "assetSubClass": "Large Cap Growth",
-                    "shareClassStatus": "open",
-                    "ticker": "QQQ",
-                    "inceptionDate": "1999-03-10",
-                    "primaryShareClassIndicator": "true",
-                    "totalExpenseRatio": "0.20",
-                    "youngFund": "false"
-                },
-                {
-                    "url": "/content/invesco/us/en/financial-products/etfs/invesco-0-5-yr-us-tips-etf.html",
-                    "title": "Invesco 0-5 Yr US TIPS ETF",
-                    "isin": "US46138E4952",
-                    "cusip": "46138E495",
-                    "uniqueIdentifier": "cusip",
-                    "accountName": "Invesco 0-5 Yr US TIPS ETF",
-                    "assetClass": "Fixed Income",
-                    "assetSubClass": "Inflation-Protected Bond",
-                    "shareClassStatus": "open",
-                    "ticker": "PBTP",
-                    "inceptionDate": "2017-09-22",
-                    "primaryShareClassIndicator": "true",
-                    "totalExpenseRatio": "0.07",
-                    "youngFund": "false"
-                },
-                {
-                    "url": "/content/invesco/us/en/financial-products/etfs/invesco-db-oil-fund.html",
-                    "title": "Invesco DB Oil Fund",
-                    "isin": "US26922A8033",
-                    "cusip": "26922A803",
-                    "accountName": "Invesco DB Oil Fund",
-                    "assetClass": "Commodity",
-                    "assetSubClass": "Energy",
-                    "shareClassStatus": "open",
-                    "ticker": "DBO",
-                    "inceptionDate": "2007-01-05",
-                    "totalExpenseRatio": "0.77"
-                }
-            ]
-        },
-        "facet_counts": {
-            "facet_fields": {
-                "assetClass": ["Equity", 120, "Fixed Income", 80, "Commodity", 40]
-            }
-        }
-    }
+
+@pytest.fixture(scope="module")
+def invesco_response_body(sample_invesco_response):
+    """모의 Invesco API 응답 본문 (모듈당 한 번만 직렬화)"""
+    return orjson.dumps(sample_invesco_response)
 
 
 @pytest.fixture
+def mocked_invesco_api(invesco_response_body):
+    """Invesco API 요청을 샘플 응답으로 대체하는 respx 라우트"""
+    with respx.mock(assert_all_called=False) as router:
+        yield router.get(InvescoCrawler.BASE_URL).mock(
+            return_value=httpx.Response(200, content=invesco_response_body)
+        )
+
+
+@pytest.fixture(scope="module")
 def crawler():
     """InvescoCrawler 인스턴스"""
     return InvescoCrawler()
@@ -100,47 +57,52 @@ class TestInvescoCrawler:
         result2 = crawler._parse_date("1999-03-10")
         assert result2 == date(1999, 3, 10)
     
+    def test_parse_date_unpadded(self, crawler):
+        """0으로 채우지 않은 날짜도 기존(strptime)과 같이 파싱하는지 테스트"""
+        assert crawler._parse_date("2017-9-5") == date(2017, 9, 5)
+        assert crawler._parse_date("2017-10-5") == date(2017, 10, 5)
+    
+    @pytest.mark.parametrize("date_str", ["2017-09-22", "1999-03-10"])
+    def test_parse_date_cached(self, crawler, date_str):
+        """같은 날짜 문자열은 캐시에서 반환되는지 테스트"""
+        first = crawler._parse_date(date_str)
+        hits = invesco_module._parse_date.cache_info().hits
+        
+        assert crawler._parse_date(date_str) is first
+        assert invesco_module._parse_date.cache_info().hits == hits + 1
+    
     def test_parse_date_invalid(self, crawler):
         """잘못된 날짜 파싱 테스트"""
         assert crawler._parse_date(None) is None
         assert crawler._parse_date("") is None
         assert crawler._parse_date("invalid") is None
+        assert crawler._parse_date("2023-02-30") is None
     
-    def test_extract_etf_data_full(self, crawler, sample_invesco_response):
-        """전체 정보가 있는 ETF 데이터 추출 테스트"""
-        doc = sample_invesco_response['response']['docs'][0]
-        etf = crawler._extract_etf_data(doc)
-        
-        assert etf is not None
-        assert etf.ticker == "QQQ"
-        assert etf.fund_name == "Invesco QQQ Trust Series 1"
-        assert etf.isin == "US46090E1038"
-        assert etf.cusip == "46090E103"
-        assert etf.inception_date == date(1999, 3, 10)
-        assert etf.expense_ratio == Decimal("0.20")
-        assert etf.asset_class == "Equity"
-        assert "invesco.com" in etf.product_page_url
-    
-    def test_extract_etf_data_fixed_income(self, crawler, sample_invesco_response):
-        """채권 ETF 데이터 추출 테스트"""
-        doc = sample_invesco_response['response']['docs'][1]
+    @pytest.mark.parametrize(
+        "doc_idx, ticker, fund_name, asset_class, expense_ratio",
+        [
+            (0, "QQQ", "Invesco QQQ Trust Series 1", "Equity", Decimal("0.20")),
+            (1, "PBTP", "Invesco 0-5 Yr US TIPS ETF", "Fixed Income", Decimal("0.07")),
+            (2, "DBO", "Invesco DB Oil Fund", "Commodity", Decimal("0.77")),
+        ],
+        ids=["equity", "fixed_income", "commodity"],
+    )
+    def test_extract_etf_data(
+        self, crawler, sample_invesco_response, doc_idx, ticker, fund_name, asset_class, expense_ratio
+    ):
+        """자산군별 ETF 데이터 추출 테스트"""
+        doc = sample_invesco_response['response']['docs'][doc_idx]
         etf = crawler._extract_etf_data(doc)
         
         assert etf is not None
-        assert etf.ticker == "PBTP"
-        assert etf.fund_name == "Invesco 0-5 Yr US TIPS ETF"
-        assert etf.asset_class == "Fixed Income"
-        assert etf.expense_ratio == Decimal("0.07")
-    
-    def test_extract_etf_data_commodity(self, crawler, sample_invesco_response):
-        """상품 ETF 데이터 추출 테스트"""
-        doc = sample_invesco_response['response']['docs'][2]
-        etf = crawler._extract_etf_data(doc)
-        
-        assert etf is not None
-        assert etf.ticker == "DBO"
-        assert etf.asset_class == "Commodity"
-        assert etf.expense_ratio == Decimal("0.77")
+        assert etf.ticker == ticker
+        assert etf.fund_name == fund_name
+        assert etf.isin == doc["isin"]
+        assert etf.cusip == doc["cusip"]
+        assert etf.inception_date == date.fromisoformat(doc["inceptionDate"])
+        assert etf.expense_ratio == expense_ratio
+        assert etf.asset_class == asset_class
+        assert etf.product_page_url.startswith("https://www.invesco.com/")
     
     def test_extract_etf_data_no_ticker(self, crawler):
         """티커 없는 문서 테스트"""
@@ -161,22 +123,16 @@ class TestInvescoCrawler:
         }
         etf = crawler._extract_etf_data(doc)
         assert etf is not None
-        assert etf.expense_ratio == Decimal("0.00")
+        assert etf.expense_ratio == _DEC_ZERO_00
     
     @pytest.mark.asyncio
-    async def test_fetch_data_mock(self, crawler, sample_invesco_response):
+    async def test_fetch_data_mock(self, crawler, sample_invesco_response, mocked_invesco_api):
         """fetch_data 메서드 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_invesco_response
-        mock_response.raise_for_status = MagicMock()
+        data = await crawler.fetch_data()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            data = await crawler.fetch_data()
-            
-            assert data == sample_invesco_response
-            assert data['response']['numFound'] == 240
+        assert data == sample_invesco_response
+        assert data['response']['numFound'] == 240
+        assert mocked_invesco_api.calls.last.request.url.params['rows'] == crawler.PARAMS['rows']
     
     @pytest.mark.asyncio
     async def test_parse_data(self, crawler, sample_invesco_response):
@@ -198,20 +154,14 @@ class TestInvescoCrawler:
         assert etf_list[2].asset_class == "Commodity"
     
     @pytest.mark.asyncio
-    async def test_crawl_integration_mock(self, crawler, sample_invesco_response):
+    async def test_crawl_integration_mock(self, crawler, mocked_invesco_api):
         """전체 크롤링 프로세스 통합 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_invesco_response
-        mock_response.raise_for_status = MagicMock()
+        etf_list = await crawler.crawl()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            etf_list = await crawler.crawl()
-            
-            assert len(etf_list) == 3
-            assert all(isinstance(etf, ETF) for etf in etf_list)
-            assert all(etf.ticker for etf in etf_list)
+        assert len(etf_list) == 3
+        for etf in etf_list:
+            assert isinstance(etf, ETF)
+            assert etf.ticker
 
 
 class TestInvescoCrawlerIntegration:
@@ -219,9 +169,9 @@ class TestInvescoCrawlerIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_fetch_real_data(self, crawler):
-        """실제 Invesco API에서 데이터 가져오기 테스트"""
-        data = await crawler.fetch_data()
+    async def test_fetch_real_data(self, invesco_real_api_data):
+        """실제 Invesco API에서 데이터 가져오기 테스트 (캐싱됨)"""
+        data = invesco_real_api_data
         
         assert isinstance(data, dict)
         assert 'response' in data
@@ -231,9 +181,9 @@ class TestInvescoCrawlerIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_full_crawl_real(self, crawler):
-        """실제 전체 크롤링 프로세스 테스트"""
-        etf_list = await crawler.crawl()
+    async def test_full_crawl_real(self, crawler, invesco_real_api_data):
+        """실제 데이터 파싱 테스트 (세션 캐시된 응답 사용)"""
+        etf_list = await crawler.parse_data(invesco_real_api_data)
         
         assert len(etf_list) > 0
         
@@ -241,21 +191,22 @@ class TestInvescoCrawlerIntegration:
         first_etf = etf_list[0]
         assert first_etf.ticker
         assert first_etf.fund_name
-        assert "Invesco" in first_etf.fund_name
-        assert first_etf.expense_ratio >= Decimal("0.00")
+        assert first_etf.fund_name.startswith("Invesco")
+        assert first_etf.expense_ratio >= _DEC_ZERO_00
         assert first_etf.product_page_url.startswith("https://")
         
-        # 모든 ETF가 올바른 형식인지 확인
+        # 모든 ETF가 올바른 형식인지 한 번의 순회로 확인
+        tickers = []
         for etf in etf_list:
             assert isinstance(etf, ETF)
             assert etf.ticker
             assert len(etf.ticker) <= 5
             assert etf.isin != "N/A" or etf.cusip != "N/A"  # 최소 하나는 있어야 함
+            tickers.append(etf.ticker)
         
         # 알려진 Invesco ETF가 포함되어 있는지 확인
-        tickers = [etf.ticker for etf in etf_list]
-        known_etfs = ["QQQ", "QQQM", "PBTP", "DBO"]
-        assert any(ticker in tickers for ticker in known_etfs)
+        known_etfs = {"QQQ", "QQQM", "PBTP", "DBO"}
+        assert not known_etfs.isdisjoint(tickers)
         
         print(f"\nTotal Invesco ETFs found: {len(etf_list)}")
         print(f"Sample tickers: {tickers[:10]}")
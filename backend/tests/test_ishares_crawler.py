@@ -4,90 +4,45 @@ from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 
+import httpx
+import orjson
 import pytest
+import respx
 from app.models.etf import ETF
 from app.services.crawlers.ishares import ISharesCrawler
 
+_DEC_ZERO = Decimal("0")
 
-@pytest.fixture
-def sample_ishares_response():
-    """iShares API 응답 샘플 데이터 (실제 구조 반영)"""
-    return {
-            "239726": {
-                "localExchangeTicker": "IVV",
-                "fundName": "iShares Core S&P 500 ETF",
-                "isin": "US4642872000",
-                "cusip": "464287200",
-                "portfolioId": 239726,
-                "inceptionDate": {"d": "May 15, 2000", "r": 20000515},
-                "navAmount": {"d": "580.50", "r": 580.50},
-                "navAmountAsOf": {"d": "Nov 28, 2025", "r": 20251128},
-                "fees": {"d": "0.03", "r": 0.03},
-                "quarterlyNavYearToDate": {"d": "17.48", "r": 17.48},
-                "quarterlyNavOneYearAnnualized": {"d": "21.49", "r": 21.49},
-                "quarterlyNavThreeYearAnnualized": {"d": "22.65", "r": 22.65},
-                "quarterlyNavFiveYearAnnualized": {"d": "17.59", "r": 17.59},
-                "quarterlyNavTenYearAnnualized": {"d": "14.60", "r": 14.60},
-                "quarterlyNavSinceInceptionAnnualized": {"d": "8.21", "r": 8.21},
-                "priceYearToDate": {"d": "17.48", "r": 17.48},
-                "priceOneYearAnnualized": {"d": "21.49", "r": 21.49},
-                "priceThreeYearAnnualized": {"d": "22.65", "r": 22.65},
-                "priceFiveYearAnnualized": {"d": "17.59", "r": 17.59},
-                "priceTenYearAnnualized": {"d": "14.60", "r": 14.60},
-                "priceSinceInceptionAnnualized": {"d": "8.21", "r": 8.21},
-                "aladdinAssetClass": "Equity",
-                "aladdinRegion": "North America",
-                "aladdinMarketType": "Developed",
-                "distributionYield": {"d": "1.35", "r": 1.35},
-                "productPageUrl": "/us/products/239726/ishares-core-sp-500-etf"
-            },
-            "239619": {
-                "localExchangeTicker": "MCHI",
-                "fundName": "iShares MSCI China ETF",
-                "isin": "US46429B6719",
-                "cusip": "46429B671",
-                "portfolioId": 239619,
-                "inceptionDate": {"d": "Mar 29, 2011", "r": 20110329},
-                "navAmount": {"d": "62.19", "r": 62.190296},
-                "navAmountAsOf": {"d": "Nov 28, 2025", "r": 20251128},
-                "fees": {"d": "0.59", "r": 0.59},
-                "quarterlyNavYearToDate": {"d": "41.16", "r": 41.16},
-                "quarterlyNavOneYearAnnualized": {"d": "32.87", "r": 32.87},
-                "quarterlyNavThreeYearAnnualized": {"d": "18.76", "r": 18.76},
-                "quarterlyNavFiveYearAnnualized": {"d": "-0.19", "r": -0.19},
-                "quarterlyNavTenYearAnnualized": {"d": "6.16", "r": 6.16},
-                "quarterlyNavSinceInceptionAnnualized": {"d": "3.95", "r": 3.95},
-                "priceYearToDate": {"d": "36.98", "r": 36.98},
-                "priceOneYearAnnualized": {"d": "32.79", "r": 32.79},
-                "priceThreeYearAnnualized": {"d": "24.70", "r": 24.7},
-                "priceFiveYearAnnualized": {"d": "-1.90", "r": -1.9},
-                "priceTenYearAnnualized": {"d": "4.93", "r": 4.93},
-                "priceSinceInceptionAnnualized": {"d": "3.68", "r": 3.68},
-                "aladdinAssetClass": "Equity",
-                "aladdinAssetClassCode": "43511",
-                "aladdinCountry": "China",
-                "aladdinRegion": "Asia Pacific",
-                "aladdinMarketType": "Emerging",
-                "productPageUrl": "/us/products/239619/ishares-msci-china-etf"
-            },
-        "invalid_etf": {
-            # 필수 필드 누락 - 스킵되어야 함
-            "fundName": "Invalid ETF"
-        }
-    }
 
+# 엣지 케이스 테스트의 기준 문서 (크롤러가 필수로 확인하는 필드만 포함, 각 케이스는 필요한 필드만 덮어씀)
+_MINIMAL_DOC = {
+    "localExchangeTicker": "TEST",
+    "fundName": "Test ETF",
+    "isin": "US1234567890",
+}
 
-@pytest.fixture
+
+def _single_doc(**overlay):
+    """기준 문서에 overlay를 덮어쓴 단일 ETF 응답"""
+    return {"1": {**_MINIMAL_DOC, **overlay}}
+
+
+@pytest.fixture(scope="module")
+def sample_ishares_response(load_sample_json):
+    """iShares API 응답 샘플 데이터 (실제 구조 반영, "invalid_etf"는 필수 필드 누락으로 스킵되어야 함)"""
+    return load_sample_json("ishares_sample.json")
+
+
+@pytest.fixture(scope="module")
 def crawler():
     """ISharesCrawler 인스턴스"""
     return ISharesCrawler()
 
 
 @pytest.fixture(scope="session")
-async def real_api_data():
+def real_api_data(all_providers_data):
     """실제 API 데이터 (세션당 한 번만 호출)"""
-    crawler = ISharesCrawler()
-    return await crawler.fetch_data()
+    return all_providers_data["ishares"]
 
 
 class TestISharesCrawler:
@@ -99,6 +54,18 @@ class TestISharesCrawler:
         assert crawler.BASE_URL == "https://www.ishares.com/us/product-screener/product-screener-v3.1.jsn"
         assert "dcrPath" in crawler.PARAMS
     
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_data_mock(self, crawler, sample_ishares_response):
+        """fetch_data 메서드 테스트 (응답 바이트를 orjson으로 디코딩)"""
+        respx.get(crawler.BASE_URL).mock(
+            return_value=httpx.Response(200, content=orjson.dumps(sample_ishares_response))
+        )
+        
+        data = await crawler.fetch_data()
+        
+        assert data == sample_ishares_response
+    
     @pytest.mark.asyncio
     async def test_parse_data_success(self, crawler, sample_ishares_response):
         """정상적인 데이터 파싱 테스트"""
@@ -106,9 +73,10 @@ class TestISharesCrawler:
         
         # 유효한 2개의 ETF만 파싱되어야 함 (invalid_etf는 제외)
         assert len(etf_list) == 2
+        by_ticker = {etf.ticker: etf for etf in etf_list}
         
         # 첫 번째 ETF (IVV) 검증
-        ivv = next(etf for etf in etf_list if etf.ticker == "IVV")
+        ivv = by_ticker["IVV"]
         assert ivv.fund_name == "iShares Core S&P 500 ETF"
         assert ivv.isin == "US4642872000"
         assert ivv.cusip == "464287200"
@@ -129,7 +97,7 @@ class TestISharesCrawler:
         assert ivv.product_page_url == "/us/products/239726/ishares-core-sp-500-etf"
         
         # 두 번째 ETF (MCHI) 검증
-        mchi = next(etf for etf in etf_list if etf.ticker == "MCHI")
+        mchi = by_ticker["MCHI"]
         assert mchi.fund_name == "iShares MSCI China ETF"
         assert mchi.isin == "US46429B6719"
         assert mchi.cusip == "46429B671"
@@ -149,95 +117,84 @@ class TestISharesCrawler:
     
     
     @pytest.mark.asyncio
-    async def test_parse_data_empty(self, crawler):
-        """빈 데이터 파싱 테스트"""
-        empty_data = {}
-        etf_list = await crawler.parse_data(empty_data)
-        assert len(etf_list) == 0
-    
-    @pytest.mark.asyncio
-    async def test_parse_data_missing_fields(self, crawler):
-        """필수 필드 누락 시 스킵 테스트"""
-        data = {
-            "1": {"fundName": "ETF 1"},  # ticker, isin 누락
-            "2": {"localExchangeTicker": "ETF2"},  # fundName, isin 누락
-            "3": {
-                "localExchangeTicker": "VALID",
-                "fundName": "Valid ETF",
-                "isin": "US1234567890",
-                "cusip": "123456789",
-                "inceptionDate": {"d": "Jan 01, 2020", "r": 20200101},
-                "navAmount": {"d": "100.00", "r": 100.00},
-                "navAmountAsOf": {"d": "Nov 28, 2025", "r": 20251128},
-                "fees": {"d": "0.05", "r": 0.05},
-                "aladdinAssetClass": "Equity",
-                "aladdinRegion": "Global",
-                "aladdinMarketType": "Developed",
-                "productPageUrl": "/us/products/valid"
-            }
-        }
-        
+    @pytest.mark.parametrize(
+        "data, expected_tickers, expected_attrs",
+        [
+            # 빈 데이터
+            pytest.param({}, [], {}, id="empty"),
+            # 필수 필드 누락 시 스킵
+            pytest.param({"1": {"fundName": "ETF 1"}}, [], {}, id="missing_ticker_isin"),
+            pytest.param({"1": {"localExchangeTicker": "ETF2"}}, [], {}, id="missing_name_isin"),
+            pytest.param(
+                {
+                    "1": {"fundName": "ETF 1"},
+                    "2": {**_MINIMAL_DOC, "localExchangeTicker": "VALID"},
+                },
+                ["VALID"],
+                {},
+                id="missing_fields_mixed",
+            ),
+            # 필수 필드만 있으면 나머지는 기본값으로 파싱
+            pytest.param(
+                _single_doc(),
+                ["TEST"],
+                {"nav_amount": _DEC_ZERO, "asset_class": "Unknown", "product_page_url": ""},
+                id="minimal_doc",
+            ),
+            # 날짜 파싱 실패 시 현재 날짜 사용
+            pytest.param(
+                _single_doc(
+                    inceptionDate={"d": "Invalid Date", "r": 20200101},
+                    navAmountAsOf={"d": "Invalid Date", "r": 20251128},
+                ),
+                ["TEST"],
+                {},
+                id="invalid_date_format",
+            ),
+            # Decimal 파싱 실패 시 None 또는 0 사용
+            pytest.param(
+                _single_doc(
+                    navAmount={"d": "invalid", "r": "not_a_number"},
+                    priceYearToDate={"d": "invalid", "r": None},
+                ),
+                ["TEST"],
+                {"nav_amount": _DEC_ZERO, "ytd_return": None},
+                id="invalid_decimal",
+            ),
+            # null 값들이 적절히 처리되어야 함 (null인 경우 기본값)
+            pytest.param(
+                _single_doc(
+                    localExchangeTicker="NULL",
+                    inceptionDate=None,
+                    navAmount=None,
+                    navAmountAsOf=None,
+                    fees=None,
+                    priceYearToDate=None,
+                    priceOneYearAnnualized=None,
+                    distributionYield=None,
+                ),
+                ["NULL"],
+                {
+                    "nav_amount": _DEC_ZERO,
+                    "expense_ratio": _DEC_ZERO,
+                    "ytd_return": None,
+                    "one_year_return": None,
+                    "distribution_yield": None,
+                },
+                id="null_values",
+            ),
+        ],
+    )
+    async def test_parse_data_edge_cases(self, crawler, data, expected_tickers, expected_attrs):
+        """비정상/누락 필드가 있는 데이터 파싱 테스트"""
         etf_list = await crawler.parse_data(data)
         
-        # 유효한 1개만 파싱되어야 함
-        assert len(etf_list) == 1
-        assert etf_list[0].ticker == "VALID"
-    
-    @pytest.mark.asyncio
-    async def test_parse_data_invalid_date_format(self, crawler):
-        """잘못된 날짜 형식 처리 테스트"""
-        data = {
-            "1": {
-                "localExchangeTicker": "TEST",
-                "fundName": "Test ETF",
-                "isin": "US1234567890",
-                "cusip": "123456789",
-                "inceptionDate": {"d": "Invalid Date", "r": 20200101},
-                "navAmount": {"d": "100.00", "r": 100.00},
-                "navAmountAsOf": {"d": "Invalid Date", "r": 20251128},
-                "fees": {"d": "0.05", "r": 0.05},
-                "aladdinAssetClass": "Equity",
-                "aladdinRegion": "Global",
-                "aladdinMarketType": "Developed",
-                "productPageUrl": "/test"
-            }
-        }
-        
-        etf_list = await crawler.parse_data(data)
-        
-        # 날짜 파싱 실패 시 현재 날짜 사용
-        assert len(etf_list) == 1
-        assert etf_list[0].ticker == "TEST"
-        assert etf_list[0].inception_date is not None
-        assert etf_list[0].nav_as_of is not None
-    
-    @pytest.mark.asyncio
-    async def test_parse_data_invalid_decimal(self, crawler):
-        """잘못된 Decimal 값 처리 테스트"""
-        data = {
-            "1": {
-                "localExchangeTicker": "TEST",
-                "fundName": "Test ETF",
-                "isin": "US1234567890",
-                "cusip": "123456789",
-                "inceptionDate": {"d": "Jan 01, 2020", "r": 20200101},
-                "navAmount": {"d": "invalid", "r": "not_a_number"},
-                "navAmountAsOf": {"d": "Nov 28, 2025", "r": 20251128},
-                "fees": {"d": "0.05", "r": 0.05},
-                "priceYearToDate": {"d": "invalid", "r": None},
-                "aladdinAssetClass": "Equity",
-                "aladdinRegion": "Global",
-                "aladdinMarketType": "Developed",
-                "productPageUrl": "/test"
-            }
-        }
-        
-        etf_list = await crawler.parse_data(data)
-        
-        # Decimal 파싱 실패 시 None 또는 0 사용
-        assert len(etf_list) == 1
-        assert etf_list[0].ticker == "TEST"
-        assert etf_list[0].ytd_return is None
+        assert [etf.ticker for etf in etf_list] == expected_tickers
+        for etf in etf_list:
+            assert etf.inception_date is not None
+            assert etf.nav_as_of is not None
+            for attr, expected in expected_attrs.items():
+                assert getattr(etf, attr) == expected
     
     @pytest.mark.asyncio
     async def test_crawl_integration(self, crawler, monkeypatch, sample_ishares_response):
@@ -254,44 +211,11 @@ class TestISharesCrawler:
         
         # 결과 검증
         assert len(etf_list) == 2
-        assert all(isinstance(etf, ETF) for etf in etf_list)
-        assert any(etf.ticker == "IVV" for etf in etf_list)
-        assert any(etf.ticker == "MCHI" for etf in etf_list)
-    
-    @pytest.mark.asyncio
-    async def test_parse_data_with_null_values(self, crawler):
-        """null 값 처리 테스트"""
-        data = {
-            "1": {
-                "localExchangeTicker": "NULL",
-                "fundName": "Null Test ETF",
-                "isin": "US1234567890",
-                "cusip": "123456789",
-                "inceptionDate": None,
-                "navAmount": None,
-                "navAmountAsOf": None,
-                "fees": None,
-                "priceYearToDate": None,
-                "priceOneYearAnnualized": None,
-                "distributionYield": None,
-                "aladdinAssetClass": "Equity",
-                "aladdinRegion": "Global",
-                "aladdinMarketType": "Developed",
-                "productPageUrl": "/null"
-            }
-        }
-        
-        etf_list = await crawler.parse_data(data)
-        
-        # null 값들이 적절히 처리되어야 함
-        assert len(etf_list) == 1
-        etf = etf_list[0]
-        assert etf.ticker == "NULL"
-        assert etf.nav_amount == Decimal("0")  # null인 경우 기본값
-        assert etf.expense_ratio == Decimal("0")
-        assert etf.ytd_return is None
-        assert etf.one_year_return is None
-        assert etf.distribution_yield is None
+        tickers = set()
+        for etf in etf_list:
+            assert isinstance(etf, ETF)
+            tickers.add(etf.ticker)
+        assert tickers == {"IVV", "MCHI"}
 
 
 @pytest.mark.integration
@@ -1,89 +1,52 @@
 """JPMorgan 크롤러 테스트"""
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
+import respx
 from app.models.etf import ETF
 from app.services.crawlers.jpmorgan import JPMorganCrawler
 
+# 단언에 반복 사용하는 기대값 (Decimal 파싱을 모듈 로드 시 한 번만 수행)
+_D528 = Decimal("5.28")
+_D527 = Decimal("5.27")
+_D1033 = Decimal("10.33")
+_D1093 = Decimal("10.93")
+_D1147 = Decimal("11.47")
+_D5788329363 = Decimal("57.88329363")
+_D5048 = Decimal("50.48")
+_D436 = Decimal("4.36")
+_D2645 = Decimal("26.45")
+_D3287 = Decimal("32.87")
+_DEC_ZERO_00 = Decimal("0.00")
 
-@pytest.fixture
-def sample_jpmorgan_response():
-    """JPMorgan API 응답 샘플 데이터"""
-    return [
-        {
-            "name": "JPMorgan Equity Premium Income ETF",
-            "displayName": "Equity Premium Income ETF",
-            "displayId": "JEPI",
-            "ticker": "JEPI",
-            "identifier": "46641Q332",
-            "assetClass": "U.S. Equity",
-            "fundInceptionDate": "2020-05-20",
-            "shareClassInceptionDate": "2020-05-20",
-            "nav": 57.88329363,
-            "navDate": "2025-11-28",
-            "secYield": 0.0724,
-            "secYieldEffectiveDate": "2025-10-31",
-            "atNavPerformanceReturn": {
-                "ytd": 0.0528,
-                "mt1": 0.0021,
-                "mt3": 0.0266,
-                "mt6": 0.0692,
-                "yr1": 0.0527,
-                "yr2": None,
-                "yr3": 0.1033,
-                "yr5": 0.1093,
-                "yr10": None,
-                "inception": 0.1147
-            },
-            "currencyCode": "USD"
-        },
-        {
-            "name": "JPMorgan Ultra-Short Income ETF",
-            "displayName": "Ultra-Short Income ETF",
-            "displayId": "JPST",
-            "ticker": "JPST",
-            "identifier": "46641Q878",
-            "assetClass": "Taxable Bond",
-            "fundInceptionDate": "2017-05-17",
-            "shareClassInceptionDate": "2017-05-17",
-            "nav": 50.48,
-            "navDate": "2025-11-28",
-            "secYield": 0.0467,
-            "atNavPerformanceReturn": {
-                "ytd": 0.0436,
-                "yr1": 0.0477,
-                "yr3": 0.0273,
-                "yr5": 0.0233,
-                "inception": 0.0241
-            },
-            "currencyCode": "USD"
-        },
-        {
-            "name": "JPMorgan BetaBuilders U.S. Equity ETF",
-            "displayName": "BetaBuilders U.S. Equity ETF",
-            "displayId": "BBUS",
-            "ticker": "BBUS",
-            "identifier": "46641Q761",
-            "assetClass": "U.S. Equity",
-            "nav": 108.52,
-            "navDate": "2025-11-28",
-            "atNavPerformanceReturn": {
-                "ytd": 0.2645,
-                "yr1": 0.3287,
-                "yr3": 0.1019,
-                "yr5": 0.1687,
-                "inception": 0.1448
-            },
-            "currencyCode": "USD"
-        }
-    ]
+
+@pytest.fixture(scope="module")
+def sample_jpmorgan_response(load_sample_json):
+    """JPMorgan API 응답 샘플 데이터 (모듈 내 테스트가 공유하므로 수정하지 말 것)"""
+    return load_sample_json("jpmorgan_sample.json")
+
+
+@pytest.fixture(scope="module")
+def jpmorgan_response_body(sample_jpmorgan_response):
+    """모의 JPMorgan API 응답 본문 (모듈당 한 번만 직렬화)"""
+    return orjson.dumps(sample_jpmorgan_response)
 
 
 @pytest.fixture
+def mocked_jpmorgan_api(jpmorgan_response_body):
+    """JPMorgan API 요청을 샘플 응답으로 대체하는 respx 라우트"""
+    with respx.mock(assert_all_called=False) as router:
+        yield router.get(JPMorganCrawler.BASE_URL).mock(
+            return_value=httpx.Response(200, content=jpmorgan_response_body)
+        )
+
+
+@pytest.fixture(scope="module")
 def crawler():
-    """JPMorganCrawler 인스턴스"""
+    """JPMorganCrawler 인스턴스 (상태가 없으므로 모듈 내에서 공유)"""
     return JPMorganCrawler()
 
 
@@ -116,9 +79,9 @@ class TestJPMorganCrawler:
         performance = {"ytd": 0.0528, "yr1": 0.0527, "yr3": 0.1033}
         
         # 0.0528 -> 5.28%
-        assert crawler._extract_return_value(performance, 'ytd') == Decimal("5.28")
-        assert crawler._extract_return_value(performance, 'yr1') == Decimal("5.27")
-        assert crawler._extract_return_value(performance, 'yr3') == Decimal("10.33")
+        assert crawler._extract_return_value(performance, 'ytd') == _D528
+        assert crawler._extract_return_value(performance, 'yr1') == _D527
+        assert crawler._extract_return_value(performance, 'yr3') == _D1033
         
         # None 값
         assert crawler._extract_return_value(performance, 'yr10') is None
@@ -135,14 +98,14 @@ class TestJPMorganCrawler:
         assert etf.cusip == "46641Q332"
         assert etf.isin == "N/A"  # API에서 제공 안 함
         assert etf.inception_date == date(2020, 5, 20)
-        assert etf.nav_amount == Decimal("57.88329363")
+        assert etf.nav_amount == _D5788329363
         assert etf.nav_as_of == date(2025, 11, 28)
         assert etf.asset_class == "U.S. Equity"
-        assert etf.ytd_return == Decimal("5.28")
-        assert etf.one_year_return == Decimal("5.27")
-        assert etf.three_year_return == Decimal("10.33")
-        assert etf.five_year_return == Decimal("10.93")
-        assert etf.since_inception_return == Decimal("11.47")
+        assert etf.ytd_return == _D528
+        assert etf.one_year_return == _D527
+        assert etf.three_year_return == _D1033
+        assert etf.five_year_return == _D1093
+        assert etf.since_inception_return == _D1147
         assert "jpmorgan.com" in etf.product_page_url
     
     def test_extract_etf_data_bond(self, crawler, sample_jpmorgan_response):
@@ -154,8 +117,8 @@ class TestJPMorganCrawler:
         assert etf.ticker == "JPST"
         assert etf.fund_name == "JPMorgan Ultra-Short Income ETF"
         assert etf.asset_class == "Taxable Bond"
-        assert etf.nav_amount == Decimal("50.48")
-        assert etf.ytd_return == Decimal("4.36")
+        assert etf.nav_amount == _D5048
+        assert etf.ytd_return == _D436
     
     def test_extract_etf_data_minimal(self, crawler, sample_jpmorgan_response):
         """최소 정보 ETF 데이터 추출 테스트"""
@@ -166,8 +129,8 @@ class TestJPMorganCrawler:
         assert etf.ticker == "BBUS"
         assert etf.fund_name == "JPMorgan BetaBuilders U.S. Equity ETF"
         assert etf.inception_date is None  # fundInceptionDate 없음
-        assert etf.ytd_return == Decimal("26.45")
-        assert etf.one_year_return == Decimal("32.87")
+        assert etf.ytd_return == _D2645
+        assert etf.one_year_return == _D3287
     
     def test_extract_etf_data_no_ticker(self, crawler):
         """티커 없는 펀드 테스트"""
@@ -188,7 +151,7 @@ class TestJPMorganCrawler:
         }
         etf = crawler._extract_etf_data(fund)
         assert etf is not None
-        assert etf.nav_amount == Decimal("0.00")
+        assert etf.nav_amount == _DEC_ZERO_00
     
     def test_extract_etf_data_null_returns(self, crawler):
         """null 수익률 처리 테스트"""
@@ -212,19 +175,16 @@ class TestJPMorganCrawler:
         assert etf.three_year_return is None
     
     @pytest.mark.asyncio
-    async def test_fetch_data_mock(self, crawler, sample_jpmorgan_response):
+    async def test_fetch_data_mock(self, crawler, sample_jpmorgan_response, mocked_jpmorgan_api):
         """fetch_data 메서드 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_jpmorgan_response
-        mock_response.raise_for_status = MagicMock()
+        data = await crawler.fetch_data()
+        
+        assert data == sample_jpmorgan_response
+        assert len(data) == 3
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            data = await crawler.fetch_data()
-            
-            assert data == sample_jpmorgan_response
-            assert len(data) == 3
+        request = mocked_jpmorgan_api.calls.last.request
+        assert request.url.params['country'] == 'us'
+        assert request.url.params['fundType'] == 'etf'
     
     @pytest.mark.asyncio
     async def test_parse_data(self, crawler, sample_jpmorgan_response):
@@ -243,7 +203,7 @@ class TestJPMorganCrawler:
         
         # 세 번째 ETF 검증
         assert etf_list[2].ticker == "BBUS"
-        assert etf_list[2].ytd_return == Decimal("26.45")
+        assert etf_list[2].ytd_return == _D2645
     
     @pytest.mark.asyncio
     async def test_parse_data_invalid_input(self, crawler):
@@ -255,20 +215,13 @@ class TestJPMorganCrawler:
         assert len(etf_list2) == 0
     
     @pytest.mark.asyncio
-    async def test_crawl_integration_mock(self, crawler, sample_jpmorgan_response):
+    async def test_crawl_integration_mock(self, crawler, mocked_jpmorgan_api):
         """전체 크롤링 프로세스 통합 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_jpmorgan_response
-        mock_response.raise_for_status = MagicMock()
+        etf_list = await crawler.crawl()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            etf_list = await crawler.crawl()
-            
-            assert len(etf_list) == 3
-            assert all(isinstance(etf, ETF) for etf in etf_list)
-            assert all(etf.ticker for etf in etf_list)
+        assert len(etf_list) == 3
+        assert all(isinstance(etf, ETF) for etf in etf_list)
+        assert all(etf.ticker for etf in etf_list)
 
 
 class TestJPMorganCrawlerIntegration:
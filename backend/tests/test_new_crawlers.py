@@ -1,62 +1,129 @@
 """Tests for Fidelity, VanEck, and WisdomTree ETF crawlers"""
-from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, patch
+from typing import Any, NamedTuple
 
+import httpx
 import pytest
+import respx
 
 from backend.app.services.crawlers.fidelity import FidelityCrawler
 from backend.app.services.crawlers.vaneck import VanEckCrawler
 from backend.app.services.crawlers.wisdomtree import WisdomTreeCrawler
 
-
-class TestFidelityCrawler:
-    @pytest.fixture
-    def crawler(self):
-        return FidelityCrawler()
-
-    def test_initialization(self, crawler):
+SAMPLE_HTML = "<html><body>Test</body></html>"
+
+
+class ProviderCase(NamedTuple):
+    """Per-provider inputs for the shared crawler tests"""
+
+    crawler_cls: type
+    provider: str
+    domain: str
+    url_attr: str
+    fetched: Any
+    empty_input: Any
+    decimals: list
+
+
+PROVIDER_CASES = [
+    pytest.param(
+        ProviderCase(
+            FidelityCrawler,
+            "Fidelity",
+            "fidelity.com",
+            "etf_list_url",
+            SAMPLE_HTML,
+            "",
+            [("123.45", Decimal("123.45")), ("$123.45", Decimal("123.45")), ("12.5%", Decimal("12.5"))],
+        ),
+        id="fidelity",
+    ),
+    pytest.param(
+        ProviderCase(
+            VanEckCrawler,
+            "VanEck",
+            "vaneck.com",
+            "api_url",
+            {"html": SAMPLE_HTML},
+            None,
+            [("100.50", Decimal("100.50")), ("$50.25", Decimal("50.25"))],
+        ),
+        id="vaneck",
+    ),
+    pytest.param(
+        ProviderCase(
+            WisdomTreeCrawler,
+            "WisdomTree",
+            "wisdomtree.com",
+            "etf_list_url",
+            SAMPLE_HTML,
+            "",
+            [("75.25", Decimal("75.25")), ("$25.50", Decimal("25.50"))],
+        ),
+        id="wisdomtree",
+    ),
+]
+
+
+@pytest.fixture(scope="module", params=PROVIDER_CASES)
+def case(request):
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def crawler(case):
+    return case.crawler_cls()
+
+
+class TestHtmlPageCrawler:
+    """Shared tests for crawlers that scrape a single listing page"""
+
+    def test_initialization(self, crawler, case):
         """Test crawler initialization"""
-        assert crawler.provider_name == "Fidelity"
-        assert "fidelity.com" in crawler.base_url
+        assert crawler.provider_name == case.provider
+        assert case.domain in crawler.base_url
 
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_success(self, crawler):
+    async def test_fetch_data_success(self, crawler, case):
         """Test successful data fetching"""
-        mock_response = AsyncMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.raise_for_status = AsyncMock()
+        respx.get(getattr(crawler, case.url_attr)).mock(
+            return_value=httpx.Response(200, text=SAMPLE_HTML)
+        )
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            result = await crawler.fetch_data()
+        result = await crawler.fetch_data()
 
-        assert result == "<html><body>Test</body></html>"
+        assert result == case.fetched
 
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_error(self, crawler):
+    async def test_fetch_data_error(self, crawler, case):
         """Test data fetching with error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_get = AsyncMock(side_effect=Exception("Network error"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            result = await crawler.fetch_data()
+        respx.get(getattr(crawler, case.url_attr)).mock(
+            side_effect=httpx.ConnectError("Network error")
+        )
+
+        result = await crawler.fetch_data()
 
         assert result is None
 
-    def test_parse_data_empty(self, crawler):
+    def test_parse_data_empty(self, crawler, case):
         """Test parsing empty data"""
-        result = crawler.parse_data("")
+        result = crawler.parse_data(case.empty_input)
         assert result == []
 
-    def test_parse_decimal(self, crawler):
+    def test_parse_decimal(self, crawler, case):
         """Test decimal parsing"""
-        assert crawler._parse_decimal("123.45") == Decimal("123.45")
-        assert crawler._parse_decimal("$123.45") == Decimal("123.45")
-        assert crawler._parse_decimal("12.5%") == Decimal("12.5")
+        for raw, expected in case.decimals:
+            assert crawler._parse_decimal(raw) == expected
         assert crawler._parse_decimal(None) is None
 
+
+class TestFidelityCrawler:
+    @pytest.fixture
+    def crawler(self):
+        return FidelityCrawler()
+
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_fetch_real_data(self, crawler):
@@ -71,48 +138,6 @@ class TestVanEckCrawler:
     def crawler(self):
         return VanEckCrawler()
 
-    def test_initialization(self, crawler):
-        """Test crawler initialization"""
-        assert crawler.provider_name == "VanEck"
-        assert "vaneck.com" in crawler.base_url
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_success(self, crawler):
-        """Test successful data fetching"""
-        mock_response = AsyncMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.raise_for_status = AsyncMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            result = await crawler.fetch_data()
-
-        assert result is not None
-        assert "html" in result
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_error(self, crawler):
-        """Test data fetching with error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_get = AsyncMock(side_effect=Exception("Network error"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            result = await crawler.fetch_data()
-
-        assert result is None
-
-    def test_parse_data_empty(self, crawler):
-        """Test parsing empty data"""
-        result = crawler.parse_data(None)
-        assert result == []
-
-    def test_parse_decimal(self, crawler):
-        """Test decimal parsing"""
-        assert crawler._parse_decimal("100.50") == Decimal("100.50")
-        assert crawler._parse_decimal("$50.25") == Decimal("50.25")
-        assert crawler._parse_decimal(None) is None
-
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_fetch_real_data(self, crawler):
@@ -126,47 +151,6 @@ class TestWisdomTreeCrawler:
     def crawler(self):
         return WisdomTreeCrawler()
 
-    def test_initialization(self, crawler):
-        """Test crawler initialization"""
-        assert crawler.provider_name == "WisdomTree"
-        assert "wisdomtree.com" in crawler.base_url
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_success(self, crawler):
-        """Test successful data fetching"""
-        mock_response = AsyncMock()
-        mock_response.text = "<html><body>Test</body></html>"
-        mock_response.raise_for_status = AsyncMock()
-
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(
-                return_value=mock_response
-            )
-            result = await crawler.fetch_data()
-
-        assert result == "<html><body>Test</body></html>"
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_error(self, crawler):
-        """Test data fetching with error"""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_get = AsyncMock(side_effect=Exception("Network error"))
-            mock_client.return_value.__aenter__.return_value.get = mock_get
-            result = await crawler.fetch_data()
-
-        assert result is None
-
-    def test_parse_data_empty(self, crawler):
-        """Test parsing empty data"""
-        result = crawler.parse_data("")
-        assert result == []
-
-    def test_parse_decimal(self, crawler):
-        """Test decimal parsing"""
-        assert crawler._parse_decimal("75.25") == Decimal("75.25")
-        assert crawler._parse_decimal("$25.50") == Decimal("25.50")
-        assert crawler._parse_decimal(None) is None
-
     @pytest.mark.integration
     @pytest.mark.asyncio
     async def test_fetch_real_data(self, crawler):
@@ -1,72 +1,110 @@
 """GraniteShares, Alpha Architect, Pacer Advisors ETF 크롤러 테스트"""
 
-from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from typing import NamedTuple
 
+import httpx
 import pytest
+import respx
 
 from backend.app.services.crawlers.alphaarchitect import AlphaArchitectCrawler
 from backend.app.services.crawlers.graniteshares import GraniteSharesCrawler
 from backend.app.services.crawlers.pacer import PacerCrawler
 
-
-class TestGraniteSharesCrawler:
-    """GraniteShares 크롤러 테스트"""
-
-    @pytest.fixture
-    def crawler(self):
-        """크롤러 인스턴스 생성"""
-        return GraniteSharesCrawler()
-
-    @pytest.fixture
-    def sample_html(self):
-        """샘플 HTML 데이터"""
-        return """
-        <html>
-            <body>
-                <a href="/etf/BAR">GraniteShares Gold Trust</a>
-                <a href="/etf/BBAR/">GraniteShares Gold Trust BAR</a>
-                <a href="/etf/URA">GraniteShares Uranium Trust</a>
-            </body>
-        </html>
-        """
-
-    def test_initialization(self, crawler):
+# 운용사별 샘플 HTML 템플릿: 크롤러 클래스 → ([(상품 링크, 펀드명)], parse_data가 반환할 티커 순서)
+_TEMPLATES = {
+    GraniteSharesCrawler: (
+        [
+            ("/etf/BAR", "GraniteShares Gold Trust"),
+            ("/etf/BBAR/", "GraniteShares Gold Trust BAR"),
+            ("/etf/URA", "GraniteShares Uranium Trust"),
+        ],
+        ["BAR", "BBAR", "URA"],
+    ),
+    AlphaArchitectCrawler: (
+        [
+            ("/fund/QVAL", "Alpha Architect U.S. Quantitative Value ETF"),
+            ("/fund/IVAL/", "Alpha Architect International Quantitative Value ETF"),
+            ("/etf/QMOM", "Alpha Architect U.S. Quantitative Momentum ETF"),
+        ],
+        ["QVAL", "IVAL", "QMOM"],
+    ),
+    PacerCrawler: (
+        [
+            ("/products/COWZ", "Pacer US Cash Cows 100 ETF"),
+            ("/products/TPSC/", "Pacer Trendpilot US Small Cap ETF"),
+            ("/products/VAMO", "Pacer Valkyrie Global Asset Management ETF"),
+        ],
+        ["COWZ", "TPSC", "VAMO"],
+    ),
+}
+
+
+def _make_html(links: list) -> str:
+    """상품 링크를 담은 샘플 HTML 생성"""
+    anchors = "".join(f'<a href="{href}">{name}</a>' for href, name in links)
+    return f"<html><body>{anchors}</body></html>"
+
+
+class ProviderCase(NamedTuple):
+    """운용사별 테스트 입력"""
+
+    crawler_cls: type
+    provider: str
+    sample_html: str
+    expected_tickers: list
+
+
+PROVIDER_CASES = [
+    pytest.param(
+        ProviderCase(
+            crawler_cls,
+            provider,
+            _make_html(_TEMPLATES[crawler_cls][0]),
+            _TEMPLATES[crawler_cls][1],
+        ),
+        id=case_id,
+    )
+    for crawler_cls, provider, case_id in (
+        (GraniteSharesCrawler, "GraniteShares", "graniteshares"),
+        (AlphaArchitectCrawler, "Alpha Architect", "alphaarchitect"),
+        (PacerCrawler, "Pacer Advisors", "pacer"),
+    )
+]
+
+
+@pytest.fixture(scope="module", params=PROVIDER_CASES)
+def case(request):
+    """운용사별 테스트 입력"""
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def crawler(case):
+    """크롤러 인스턴스 생성 (운용사별로 모듈 내에서 공유)"""
+    return case.crawler_cls()
+
+
+class TestSimpleHtmlCrawler:
+    """링크 기반 HTML 크롤러 공통 테스트 (운용사별 파라미터화)"""
+
+    def test_initialization(self, crawler, case):
         """크롤러 초기화 테스트"""
-        assert crawler.provider_name == "GraniteShares"
+        assert crawler.provider_name == case.provider
 
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_success(self, crawler, sample_html, monkeypatch):
+    async def test_fetch_data_success(self, crawler, case):
         """데이터 가져오기 성공 테스트"""
-        mock_response = MagicMock()
-        mock_response.text = sample_html
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
+        respx.get(crawler.url).mock(return_value=httpx.Response(200, text=case.sample_html))
 
         result = await crawler.fetch_data()
-        assert result == sample_html
+        assert result == case.sample_html
 
+    @respx.mock
     @pytest.mark.asyncio
-    async def test_fetch_data_error(self, crawler, monkeypatch):
+    async def test_fetch_data_error(self, crawler):
         """데이터 가져오기 실패 테스트"""
-        import httpx
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.get = AsyncMock(
-            side_effect=httpx.HTTPError("Network error")
-        )
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
+        respx.get(crawler.url).mock(side_effect=httpx.ConnectError("Network error"))
 
         with pytest.raises(httpx.HTTPError):
             await crawler.fetch_data()
@@ -76,98 +114,11 @@ class TestGraniteSharesCrawler:
         result = crawler.parse_data("")
         assert result == []
 
-    def test_parse_data_success(self, crawler, sample_html):
+    def test_parse_data_success(self, crawler, case):
         """데이터 파싱 성공 테스트"""
-        etf_list = crawler.parse_data(sample_html)
+        etf_list = crawler.parse_data(case.sample_html)
 
-        assert len(etf_list) == 3
-        assert etf_list[0].ticker == "BAR"
-        assert etf_list[1].ticker == "BBAR"
-        assert etf_list[2].ticker == "URA"
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_fetch_real_data(self, crawler):
-        """실제 API 연동 테스트"""
-        html = await crawler.fetch_data()
-        assert html
-        assert isinstance(html, str)
-
-
-class TestAlphaArchitectCrawler:
-    """Alpha Architect 크롤러 테스트"""
-
-    @pytest.fixture
-    def crawler(self):
-        """크롤러 인스턴스 생성"""
-        return AlphaArchitectCrawler()
-
-    @pytest.fixture
-    def sample_html(self):
-        """샘플 HTML 데이터"""
-        return """
-        <html>
-            <body>
-                <a href="/fund/QVAL">Alpha Architect U.S. Quantitative Value ETF</a>
-                <a href="/fund/IVAL/">Alpha Architect International Quantitative Value ETF</a>
-                <a href="/etf/QMOM">Alpha Architect U.S. Quantitative Momentum ETF</a>
-            </body>
-        </html>
-        """
-
-    def test_initialization(self, crawler):
-        """크롤러 초기화 테스트"""
-        assert crawler.provider_name == "Alpha Architect"
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_success(self, crawler, sample_html, monkeypatch):
-        """데이터 가져오기 성공 테스트"""
-        mock_response = MagicMock()
-        mock_response.text = sample_html
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
-
-        result = await crawler.fetch_data()
-        assert result == sample_html
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_error(self, crawler, monkeypatch):
-        """데이터 가져오기 실패 테스트"""
-        import httpx
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.get = AsyncMock(
-            side_effect=httpx.HTTPError("Network error")
-        )
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
-
-        with pytest.raises(httpx.HTTPError):
-            await crawler.fetch_data()
-
-    def test_parse_data_empty(self, crawler):
-        """빈 데이터 파싱 테스트"""
-        result = crawler.parse_data("")
-        assert result == []
-
-    def test_parse_data_success(self, crawler, sample_html):
-        """데이터 파싱 성공 테스트"""
-        etf_list = crawler.parse_data(sample_html)
-
-        assert len(etf_list) == 3
-        assert etf_list[0].ticker == "QVAL"
-        assert etf_list[1].ticker == "IVAL"
-        assert etf_list[2].ticker == "QMOM"
+        assert [etf.ticker for etf in etf_list] == case.expected_tickers
 
     @pytest.mark.asyncio
     @pytest.mark.integration
@@ -186,81 +137,6 @@ class TestPacerCrawler:
         """크롤러 인스턴스 생성"""
         return PacerCrawler()
 
-    @pytest.fixture
-    def sample_html(self):
-        """샘플 HTML 데이터"""
-        return """
-        <html>
-            <body>
-                <a href="/products/COWZ">Pacer US Cash Cows 100 ETF</a>
-                <a href="/products/TPSC/">Pacer Trendpilot US Small Cap ETF</a>
-                <a href="/products/VAMO">Pacer Valkyrie Global Asset Management ETF</a>
-            </body>
-        </html>
-        """
-
-    def test_initialization(self, crawler):
-        """크롤러 초기화 테스트"""
-        assert crawler.provider_name == "Pacer Advisors"
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_success(self, crawler, sample_html, monkeypatch):
-        """데이터 가져오기 성공 테스트"""
-        mock_response = MagicMock()
-        mock_response.text = sample_html
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
-
-        result = await crawler.fetch_data()
-        assert result == sample_html
-
-    @pytest.mark.asyncio
-    async def test_fetch_data_error(self, crawler, monkeypatch):
-        """데이터 가져오기 실패 테스트"""
-        import httpx
-
-        mock_client = AsyncMock()
-        mock_client.__aenter__.return_value.get = AsyncMock(
-            side_effect=httpx.HTTPError("Network error")
-        )
-
-        def mock_async_client(*args, **kwargs):
-            return mock_client
-
-        monkeypatch.setattr("httpx.AsyncClient", mock_async_client)
-
-        with pytest.raises(httpx.HTTPError):
-            await crawler.fetch_data()
-
-    def test_parse_data_empty(self, crawler):
-        """빈 데이터 파싱 테스트"""
-        result = crawler.parse_data("")
-        assert result == []
-
-    def test_parse_data_success(self, crawler, sample_html):
-        """데이터 파싱 성공 테스트"""
-        etf_list = crawler.parse_data(sample_html)
-
-        assert len(etf_list) == 3
-        assert etf_list[0].ticker == "COWZ"
-        assert etf_list[1].ticker == "TPSC"
-        assert etf_list[2].ticker == "VAMO"
-
-    @pytest.mark.asyncio
-    @pytest.mark.integration
-    async def test_fetch_real_data(self, crawler):
-        """실제 API 연동 테스트"""
-        html = await crawler.fetch_data()
-        assert html
-        assert isinstance(html, str)
-
     @pytest.mark.asyncio
     @pytest.mark.integration
     async def test_parse_real_data(self, crawler):
@@ -275,4 +151,3 @@ class TestPacerCrawler:
             assert len(etf.ticker) <= 5
             assert etf.ticker.isalpha()
             assert etf.ticker.isupper()
-
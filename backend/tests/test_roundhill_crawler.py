@@ -1,16 +1,20 @@
 """Roundhill 크롤러 테스트"""
+import asyncio
+import threading
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
+import respx
 from app.models.etf import ETF
 from app.services.crawlers.roundhill import RoundhillCrawler
+from backend.tests._mock_httpx import FakeAsyncClient, FakeResponse, fake_async_client
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_etf_list_html():
     """Roundhill ETF 리스트 페이지 샘플 HTML"""
     return """
@@ -28,7 +32,7 @@ def sample_etf_list_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_etf_detail_html():
     """Roundhill ETF 상세 페이지 샘플 HTML (METV)"""
     return """
@@ -47,9 +51,33 @@ def sample_etf_detail_html():
     """
 
 
+@pytest.fixture(scope="module")
+def parsed_list_tree(sample_etf_list_html):
+    """리스트 페이지 샘플의 파싱 결과 (읽기 전용으로 모듈 내에서 공유)"""
+    return LexborHTMLParser(sample_etf_list_html)
+
+
+@pytest.fixture(scope="module")
+def roundhill_router(sample_etf_list_html, sample_etf_detail_html):
+    """Roundhill 리스트/상세 페이지를 샘플 HTML로 응답하는 respx 라우터 (모듈당 한 번 구성)"""
+    router = respx.mock(base_url="https://www.roundhillinvestments.com", assert_all_called=False)
+    router.get("/etf").mock(return_value=httpx.Response(200, text=sample_etf_list_html))
+    router.get(path__regex=r"^/etf/\w+/$").mock(
+        return_value=httpx.Response(200, text=sample_etf_detail_html)
+    )
+    return router
+
+
 @pytest.fixture
+def mocked_roundhill(roundhill_router):
+    """테스트 동안에만 Roundhill 요청을 respx 라우터로 가로챔"""
+    with roundhill_router:
+        yield roundhill_router
+
+
+@pytest.fixture(scope="module")
 def crawler():
-    """RoundhillCrawler 인스턴스"""
+    """RoundhillCrawler 인스턴스 (상태가 없으므로 모듈 내에서 공유)"""
     return RoundhillCrawler()
 
 
@@ -62,10 +90,9 @@ class TestRoundhillCrawler:
         assert crawler.BASE_URL == "https://www.roundhillinvestments.com/etf"
         assert "roundhillinvestments.com" in crawler.DETAIL_URL_TEMPLATE
     
-    def test_extract_tickers(self, crawler, sample_etf_list_html):
+    def test_extract_tickers(self, crawler, parsed_list_tree):
         """티커 추출 테스트"""
-        soup = BeautifulSoup(sample_etf_list_html, 'html.parser')
-        tickers = crawler._extract_tickers(soup)
+        tickers = crawler._extract_tickers(parsed_list_tree)
         
         assert len(tickers) == 5
         assert "METV" in tickers
@@ -86,38 +113,36 @@ class TestRoundhillCrawler:
             </body>
         </html>
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        tickers = crawler._extract_tickers(soup)
+        tickers = crawler._extract_tickers(LexborHTMLParser(html))
         
         assert len(tickers) == 1
         assert "METV" in tickers
     
+    def test_extract_tickers_bs4_equivalence(self, crawler, sample_etf_list_html, parsed_list_tree):
+        """selectolax 기반 티커 추출 결과가 기존 BS4 방식과 동일한지 테스트"""
+        soup = BeautifulSoup(sample_etf_list_html, 'lxml')
+        expected = {
+            a.text.strip().upper()
+            for a in soup.find_all('a', href=True)
+            if a['href'].startswith('../etf/')
+        }
+        
+        assert crawler._extract_tickers(parsed_list_tree) == expected
+    
     @pytest.mark.asyncio
-    async def test_fetch_data_mock(self, crawler, sample_etf_list_html):
+    async def test_fetch_data_mock(self, crawler, mocked_roundhill):
         """fetch_data 메서드 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.text = sample_etf_list_html
-        mock_response.raise_for_status = MagicMock()
+        tickers = await crawler.fetch_data()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            tickers = await crawler.fetch_data()
-            
-            assert len(tickers) == 5
-            assert "METV" in tickers
+        assert len(tickers) == 5
+        assert "METV" in tickers
     
     @pytest.mark.asyncio
-    async def test_fetch_etf_details_mock(self, crawler, sample_etf_detail_html):
-        """개별 ETF 상세 정보 가져오기 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.text = sample_etf_detail_html
-        mock_response.raise_for_status = MagicMock()
-        
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
+    async def test_parse_etf_page(self, crawler, sample_etf_detail_html):
+        """개별 ETF 상세 페이지 파싱 테스트"""
+        url = crawler.DETAIL_URL_TEMPLATE.format(ticker="metv")
         
-        etf = await crawler._fetch_etf_details(mock_client, "METV")
+        etf = await crawler._parse_etf_page("METV", url, sample_etf_detail_html)
         
         assert etf is not None
         assert etf.ticker == "METV"
@@ -127,83 +152,88 @@ class TestRoundhillCrawler:
         assert etf.cusip == "N/A"
     
     @pytest.mark.asyncio
-    async def test_fetch_etf_details_no_h1(self, crawler):
+    async def test_parse_etf_page_no_h1(self, crawler):
         """H1 태그 없는 경우 테스트"""
         html = "<html><body><p>No H1 here</p></body></html>"
         
-        mock_response = MagicMock()
-        mock_response.text = html
-        mock_response.raise_for_status = MagicMock()
-        
-        mock_client = MagicMock()
-        mock_client.get = AsyncMock(return_value=mock_response)
-        
-        etf = await crawler._fetch_etf_details(mock_client, "TEST")
+        etf = await crawler._parse_etf_page("TEST", crawler.DETAIL_URL_TEMPLATE.format(ticker="test"), html)
         
         assert etf is None
     
     @pytest.mark.asyncio
-    async def test_fetch_etf_details_http_error(self, crawler):
-        """HTTP 에러 처리 테스트"""
-        mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.get = AsyncMock(side_effect=httpx.HTTPStatusError(
-            "Not Found", 
-            request=MagicMock(), 
-            response=mock_response
+    async def test_parse_data_http_error(self, crawler):
+        """상세 페이지 HTTP 에러 처리 테스트"""
+        request = httpx.Request("GET", f"{crawler.BASE_URL}/INVALID")
+        mock_client = fake_async_client(exc=httpx.HTTPStatusError(
+            "Not Found",
+            request=request,
+            response=httpx.Response(404, request=request)
         ))
         
-        etf = await crawler._fetch_etf_details(mock_client, "INVALID")
+        etf_list = await crawler.parse_data({"INVALID"}, client=mock_client)
         
-        assert etf is None
+        assert etf_list == []
     
     @pytest.mark.asyncio
-    async def test_parse_data_mock(self, crawler, sample_etf_detail_html):
+    async def test_parse_data_mock(self, crawler, mocked_roundhill):
         """parse_data 메서드 테스트 (Mock)"""
         tickers = {"METV", "BETZ"}
         
-        mock_response = MagicMock()
-        mock_response.text = sample_etf_detail_html
-        mock_response.raise_for_status = MagicMock()
+        etf_list = await crawler.parse_data(tickers)
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            etf_list = await crawler.parse_data(tickers)
-            
-            assert len(etf_list) == 2
-            assert all(isinstance(etf, ETF) for etf in etf_list)
+        assert len(etf_list) == 2
+        assert all(isinstance(etf, ETF) for etf in etf_list)
     
     @pytest.mark.asyncio
-    async def test_crawl_integration_mock(self, crawler, sample_etf_list_html, sample_etf_detail_html):
-        """전체 크롤링 프로세스 통합 테스트 (Mock)"""
-        # 리스트 페이지 mock
-        mock_list_response = MagicMock()
-        mock_list_response.text = sample_etf_list_html
-        mock_list_response.raise_for_status = MagicMock()
-        
-        # 상세 페이지 mock
-        mock_detail_response = MagicMock()
-        mock_detail_response.text = sample_etf_detail_html
-        mock_detail_response.raise_for_status = MagicMock()
+    async def test_parse_data_concurrent(self, crawler, sample_etf_detail_html):
+        """상세 페이지를 동시에 요청하는지 테스트"""
+        in_flight = 0
+        max_in_flight = 0
         
         async def mock_get(url, **kwargs):
-            if '/etf/' in url and url.count('/') > 3:
-                # 상세 페이지
-                return mock_detail_response
-            else:
-                # 리스트 페이지
-                return mock_list_response
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return FakeResponse(text=sample_etf_detail_html)
+        
+        mock_client = FakeAsyncClient(mock_get)
+        
+        etf_list = await crawler.parse_data({"METV", "BETZ", "NERD"}, client=mock_client)
+        
+        assert len(etf_list) == 3
+        assert 2 <= max_in_flight <= crawler.MAX_CONCURRENCY
+    
+    @pytest.mark.asyncio
+    async def test_parse_etf_page_enriches_off_event_loop(
+        self, crawler, sample_etf_detail_html, monkeypatch
+    ):
+        """yfinance 보강(동기 호출)이 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        loop_thread = threading.get_ident()
+        enrich_threads = []
+        
+        def fake_enrich(ticker, nav_amount, expense_ratio, inception_date):
+            enrich_threads.append(threading.get_ident())
+            return Decimal("25.30"), expense_ratio, inception_date
+        
+        monkeypatch.setattr(
+            "app.services.crawlers.roundhill.enrich_etf_with_yfinance", fake_enrich
+        )
+        
+        etf = await crawler._parse_etf_page("METV", crawler.BASE_URL, sample_etf_detail_html)
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(side_effect=mock_get)
-            
-            etf_list = await crawler.crawl()
-            
-            assert len(etf_list) > 0
-            assert all(isinstance(etf, ETF) for etf in etf_list)
-            assert all(etf.ticker for etf in etf_list)
+        assert etf.nav_amount == Decimal("25.30")
+        assert enrich_threads and loop_thread not in enrich_threads
+    
+    @pytest.mark.asyncio
+    async def test_crawl_integration_mock(self, crawler, mocked_roundhill):
+        """전체 크롤링 프로세스 통합 테스트 (Mock)"""
+        etf_list = await crawler.crawl()
+        
+        assert len(etf_list) > 0
+        assert all(isinstance(etf, ETF) for etf in etf_list)
+        assert all(etf.ticker for etf in etf_list)
 
 
 class TestRoundhillCrawlerIntegration:
@@ -211,9 +241,9 @@ class TestRoundhillCrawlerIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_fetch_real_data(self, crawler):
+    async def test_fetch_real_data(self, crawler, http_client):
         """실제 Roundhill API에서 데이터 가져오기 테스트"""
-        tickers = await crawler.fetch_data()
+        tickers = await crawler.fetch_data(client=http_client)
         
         assert isinstance(tickers, set)
         assert len(tickers) > 0
@@ -223,20 +253,16 @@ class TestRoundhillCrawlerIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_fetch_real_etf_detail(self, crawler):
+    async def test_fetch_real_etf_detail(self, crawler, http_client):
         """실제 개별 ETF 상세 정보 가져오기 테스트"""
-        async with httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        ) as client:
-            etf = await crawler._fetch_etf_details(client, "METV")
-            
-            assert etf is not None
-            assert etf.ticker == "METV"
-            assert etf.fund_name
-            assert etf.expense_ratio >= Decimal("0.00")
-            assert "roundhillinvestments.com" in etf.product_page_url
+        etf_list = await crawler.parse_data({"METV"}, client=http_client)
+        
+        assert len(etf_list) == 1
+        etf = etf_list[0]
+        assert etf.ticker == "METV"
+        assert etf.fund_name
+        assert etf.expense_ratio >= Decimal("0.00")
+        assert "roundhillinvestments.com" in etf.product_page_url
     
     @pytest.mark.asyncio
     @pytest.mark.integration
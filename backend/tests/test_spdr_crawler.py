@@ -1,84 +1,110 @@
 """SPDR 크롤러 테스트"""
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
+import respx
 from app.models.etf import ETF
 from app.services.crawlers.spdr import SPDRCrawler
 
 
-@pytest.fixture
+# 샘플 펀드의 NAV 기준일
+AS_OF = date(2025, 11, 26)
+
+
+def _date_pair(value: date) -> list:
+    """SPDR API 형식의 [표시 문자열, ISO 날짜] 리스트"""
+    return [value.strftime("%b %d %Y"), value.isoformat()]
+
+
+def _pct_pair(value: float) -> list:
+    """SPDR API 형식의 [표시 문자열, 숫자] 퍼센트 리스트"""
+    return [f"{value:.2f}%", value]
+
+
+def _fund(ticker, name, slug, *, ter, nav, inception, aum=None, **returns):
+    """
+    SPDR API 응답의 펀드 레코드 하나를 생성합니다.
+
+    Args:
+        ticker: 펀드 티커
+        name: 펀드 이름
+        slug: fundUri 경로 (티커 제외)
+        ter: 총보수 (%)
+        nav: NAV
+        inception: 설정일
+        aum: 순자산 (백만 달러, 없으면 필드 생략)
+        **returns: 수익률 필드 (ytd, yr1, yr3, yr5, yr10, sinceInception)
+    """
+    fund = {
+        "domicile": "US",
+        "fundName": name,
+        "fundTicker": ticker,
+        "fundUri": f"/us/en/intermediary/etfs/{slug}-{ticker.lower()}",
+        "ter": _pct_pair(ter),
+        "nav": [f"${nav:,.2f}", nav],
+        "asOfDate": _date_pair(AS_OF),
+        "inceptionDate": _date_pair(inception),
+    }
+    if aum is not None:
+        fund["aum"] = [f"${aum:,.2f} M", aum]
+    fund.update({key: _pct_pair(value) for key, value in returns.items()})
+    return fund
+
+
+# 테스트 간에 공유하는 펀드 레코드 (수정하지 말 것)
+SPY = _fund(
+    "SPY", "SPDR® S&P 500® ETF Trust", "spdr-sp-500-etf-trust",
+    ter=0.09, nav=585.25, inception=date(1993, 1, 22), aum=575000.0,
+    ytd=25.50, yr1=30.25, yr3=18.50, yr5=16.75, yr10=14.25, sinceInception=10.50,
+)
+EBND = _fund(
+    "EBND", "SPDR® Bloomberg Emerging Markets Local Bond ETF",
+    "spdr-bloomberg-emerging-markets-local-bond-etf",
+    ter=0.30, nav=21.27, inception=date(2011, 2, 23), aum=2218.02,
+    ytd=13.05, yr1=10.94, yr3=9.94, yr5=0.67, yr10=2.06, sinceInception=0.96,
+)
+# 수익률/AUM이 없는 최소 레코드
+SPLG = _fund(
+    "SPLG", "SPDR® Portfolio S&P 500 ETF", "spdr-portfolio-sp-500-etf",
+    ter=0.02, nav=71.50, inception=date(2005, 11, 8),
+)
+
+
+@pytest.fixture(scope="session")
 def sample_spdr_response():
-    """SPDR API 응답 샘플 데이터"""
+    """SPDR API 응답 샘플 데이터 (세션 동안 공유하므로 수정하지 말 것)"""
+    funds = [SPY, EBND, SPLG]
     return {
         "data": {
-            "fundType": [
-                {
-                    "key": "etfs",
-                    "name": "ETFs",
-                    "size": 176
-                }
-            ],
-            "funds": {
-                "etfs": {
-                    "datas": [
-                        {
-                            "domicile": "US",
-                            "fundName": "SPDR® S&P 500® ETF Trust",
-                            "fundTicker": "SPY",
-                            "fundUri": "/us/en/intermediary/etfs/spdr-sp-500-etf-trust-spy",
-                            "ter": ["0.09%", 0.09],
-                            "nav": ["$585.25", 585.25],
-                            "aum": ["$575,000.00 M", 575000.0],
-                            "asOfDate": ["Nov 26 2025", "2025-11-26"],
-                            "ytd": ["25.50%", 25.50],
-                            "yr1": ["30.25%", 30.25],
-                            "yr3": ["18.50%", 18.50],
-                            "yr5": ["16.75%", 16.75],
-                            "yr10": ["14.25%", 14.25],
-                            "sinceInception": ["10.50%", 10.50],
-                            "inceptionDate": ["Jan 22 1993", "1993-01-22"]
-                        },
-                        {
-                            "domicile": "US",
-                            "fundName": "SPDR® Bloomberg Emerging Markets Local Bond ETF",
-                            "fundTicker": "EBND",
-                            "fundUri": "/us/en/intermediary/etfs/spdr-bloomberg-emerging-markets-local-bond-etf-ebnd",
-                            "ter": ["0.30%", 0.30],
-                            "nav": ["$21.27", 21.27],
-                            "aum": ["$2,218.02 M", 2218.02],
-                            "asOfDate": ["Nov 26 2025", "2025-11-26"],
-                            "ytd": ["13.05%", 13.05],
-                            "yr1": ["10.94%", 10.94],
-                            "yr3": ["9.94%", 9.94],
-                            "yr5": ["0.67%", 0.67],
-                            "yr10": ["2.06%", 2.06],
-                            "sinceInception": ["0.96%", 0.96],
-                            "inceptionDate": ["Feb 23 2011", "2011-02-23"]
-                        },
-                        {
-                            "domicile": "US",
-                            "fundName": "SPDR® Portfolio S&P 500 ETF",
-                            "fundTicker": "SPLG",
-                            "fundUri": "/us/en/intermediary/etfs/spdr-portfolio-sp-500-etf-splg",
-                            "ter": ["0.02%", 0.02],
-                            "nav": ["$71.50", 71.50],
-                            "asOfDate": ["Nov 26 2025", "2025-11-26"],
-                            "inceptionDate": ["Nov 08 2005", "2005-11-08"]
-                        }
-                    ]
-                }
-            }
+            "fundType": [{"key": "etfs", "name": "ETFs", "size": len(funds)}],
+            "funds": {"etfs": {"datas": funds}},
         },
         "msg": "success",
-        "status": 200
+        "status": 200,
     }
 
 
+@pytest.fixture(scope="session")
+def spdr_response_bytes(sample_spdr_response):
+    """모의 SPDR API 응답 본문 (세션당 한 번만 직렬화)"""
+    return orjson.dumps(sample_spdr_response)
+
+
 @pytest.fixture
+def mocked_spdr_api(spdr_response_bytes):
+    """SPDR API 요청을 샘플 응답으로 대체하는 respx 라우트"""
+    with respx.mock(assert_all_called=False) as router:
+        yield router.get(SPDRCrawler.BASE_URL).mock(
+            return_value=httpx.Response(200, content=spdr_response_bytes)
+        )
+
+
+@pytest.fixture(scope="session")
 def crawler():
-    """SPDRCrawler 인스턴스"""
+    """SPDRCrawler 인스턴스 (상태가 없으므로 세션 동안 공유)"""
     return SPDRCrawler()
 
 
@@ -91,50 +117,44 @@ class TestSPDRCrawler:
         assert "ssga.com" in crawler.BASE_URL
         assert crawler.PARAMS['country'] == 'us'
     
-    def test_parse_date_iso_format(self, crawler):
-        """ISO 형식 날짜 파싱 테스트"""
-        result = crawler._parse_date("2011-02-23")
-        assert result == date(2011, 2, 23)
-    
-    def test_parse_date_text_format(self, crawler):
-        """텍스트 형식 날짜 파싱 테스트"""
-        result = crawler._parse_date("Feb 23 2011")
-        assert result == date(2011, 2, 23)
-        
-        result2 = crawler._parse_date("Jan 22 1993")
-        assert result2 == date(1993, 1, 22)
-    
-    def test_parse_date_invalid(self, crawler):
-        """잘못된 날짜 파싱 테스트"""
-        assert crawler._parse_date(None) is None
-        assert crawler._parse_date("") is None
-        assert crawler._parse_date("invalid") is None
-    
-    def test_extract_value_from_list(self, crawler):
-        """리스트에서 값 추출 테스트"""
-        result = crawler._extract_value(["$585.25", 585.25])
-        assert result == Decimal("585.25")
-        
-        result2 = crawler._extract_value(["0.09%", 0.09])
-        assert result2 == Decimal("0.09")
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            ("2011-02-23", date(2011, 2, 23)),  # ISO 형식
+            ("Feb 23 2011", date(2011, 2, 23)),  # 텍스트 형식
+            ("Jan 22 1993", date(1993, 1, 22)),
+            (None, None),
+            ("", None),
+            ("invalid", None),
+        ],
+    )
+    def test_parse_date(self, crawler, date_str, expected):
+        """날짜 파싱 테스트"""
+        assert crawler._parse_date(date_str) == expected
     
-    def test_extract_value_from_single(self, crawler):
-        """단일 값 추출 테스트"""
-        result = crawler._extract_value(100.5)
-        assert result == Decimal("100.5")
-        
-        result2 = crawler._extract_value("50.25")
-        assert result2 == Decimal("50.25")
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (["$585.25", 585.25], Decimal("585.25")),  # [표시 문자열, 숫자] 리스트
+            (["0.09%", 0.09], Decimal("0.09")),
+            (100.5, Decimal("100.5")),  # 단일 값
+            ("50.25", Decimal("50.25")),
+            (None, None),
+            ([], None),
+        ],
+    )
+    def test_extract_value(self, crawler, value, expected):
+        """값 추출 테스트"""
+        assert crawler._extract_value(value) == expected
     
-    def test_extract_value_none(self, crawler):
-        """None 값 처리 테스트"""
-        assert crawler._extract_value(None) is None
-        assert crawler._extract_value([]) is None
+    def test_extract_value_uses_numeric_index(self, crawler):
+        """표시 문자열이 아닌 숫자 값(두 번째 요소)을 사용하는지 테스트"""
+        assert crawler._extract_value(["$999.99", 585.25]) == Decimal("585.25")
+        assert crawler._extract_value(["1.00%", 0.09]) == Decimal("0.09")
     
-    def test_extract_etf_data_full(self, crawler, sample_spdr_response):
+    def test_extract_etf_data_full(self, crawler):
         """전체 정보가 있는 ETF 데이터 추출 테스트"""
-        fund_data = sample_spdr_response['data']['funds']['etfs']['datas'][0]
-        etf = crawler._extract_etf_data(fund_data)
+        etf = crawler._extract_etf_data(SPY)
         
         assert etf is not None
         assert etf.ticker == "SPY"
@@ -149,10 +169,9 @@ class TestSPDRCrawler:
         assert etf.ten_year_return == Decimal("14.25")
         assert "ssga.com" in etf.product_page_url
     
-    def test_extract_etf_data_minimal(self, crawler, sample_spdr_response):
+    def test_extract_etf_data_minimal(self, crawler):
         """최소 정보만 있는 ETF 데이터 추출 테스트"""
-        fund_data = sample_spdr_response['data']['funds']['etfs']['datas'][2]
-        etf = crawler._extract_etf_data(fund_data)
+        etf = crawler._extract_etf_data(SPLG)
         
         assert etf is not None
         assert etf.ticker == "SPLG"
@@ -170,24 +189,17 @@ class TestSPDRCrawler:
         assert etf is None
     
     @pytest.mark.asyncio
-    async def test_fetch_data_mock(self, crawler, sample_spdr_response):
+    async def test_fetch_data_mock(self, crawler, sample_spdr_response, mocked_spdr_api):
         """fetch_data 메서드 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_spdr_response
-        mock_response.raise_for_status = MagicMock()
+        data = await crawler.fetch_data()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            data = await crawler.fetch_data()
-            
-            assert data == sample_spdr_response
-            assert data['status'] == 200
+        assert data == sample_spdr_response
+        assert data['status'] == 200
     
     @pytest.mark.asyncio
-    async def test_parse_data(self, crawler, sample_spdr_response):
-        """parse_data 메서드 테스트"""
-        etf_list = await crawler.parse_data(sample_spdr_response)
+    async def test_parse_data(self, crawler, spdr_response_bytes):
+        """parse_data 메서드 테스트 (fetch_data와 동일하게 orjson으로 디코딩한 응답 사용)"""
+        etf_list = await crawler.parse_data(orjson.loads(spdr_response_bytes))
         
         assert len(etf_list) == 3
         
@@ -203,20 +215,13 @@ class TestSPDRCrawler:
         assert etf_list[2].ticker == "SPLG"
     
     @pytest.mark.asyncio
-    async def test_crawl_integration_mock(self, crawler, sample_spdr_response):
+    async def test_crawl_integration_mock(self, crawler, mocked_spdr_api):
         """전체 크롤링 프로세스 통합 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_spdr_response
-        mock_response.raise_for_status = MagicMock()
+        etf_list = await crawler.crawl()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            etf_list = await crawler.crawl()
-            
-            assert len(etf_list) == 3
-            assert all(isinstance(etf, ETF) for etf in etf_list)
-            assert all(etf.ticker for etf in etf_list)
+        assert len(etf_list) == 3
+        assert all(isinstance(etf, ETF) for etf in etf_list)
+        assert all(etf.ticker for etf in etf_list)
 
 
 class TestSPDRCrawlerIntegration:
@@ -224,9 +229,9 @@ class TestSPDRCrawlerIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.integration
-    async def test_fetch_real_data(self, crawler):
+    async def test_fetch_real_data(self, crawler, http_client):
         """실제 SPDR API에서 데이터 가져오기 테스트"""
-        data = await crawler.fetch_data()
+        data = await crawler.fetch_data(client=http_client)
         
         assert isinstance(data, dict)
         assert 'data' in data
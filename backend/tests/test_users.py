@@ -1,27 +1,32 @@
 """Smoke tests for the user endpoints."""
 
-import json
+import orjson
+import pytest
 
-from app.main import app
-from app.services.user_service import _data_file
-from fastapi.testclient import TestClient
 
-client = TestClient(app)
+@pytest.fixture(scope="module", autouse=True)
+def _seed_users(tmp_path_factory):
+    """Point the user store at a per-worker temp file seeded with one user."""
+    path = tmp_path_factory.mktemp("users") / "users.json"
+    path.write_bytes(orjson.dumps([{"id": "1", "name": "Tester", "email": "test@example.com"}]))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.services.user_service._data_file", lambda: path)
+        yield path
 
 
-def setup_module():
-    path = _data_file()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps([{"id": "1", "name": "Tester", "email": "test@example.com"}]), encoding="utf-8")
+@pytest.fixture(scope="session", autouse=True)
+async def _warmup(client):
+    """Build the OpenAPI schema once so its lazy model setup isn't billed to the first test."""
+    await client.get("/openapi.json")
 
 
-def test_read_users():
-    response = client.get("/api/v1/users/")
+async def test_read_users(client):
+    response = await client.get("/api/v1/users/")
     assert response.status_code == 200
     assert response.json()[0]["name"] == "Tester"
 
 
-def test_read_user_detail():
-    response = client.get("/api/v1/users/1")
+async def test_read_user_detail(client):
+    response = await client.get("/api/v1/users/1")
     assert response.status_code == 200
     assert response.json()["email"] == "test@example.com"
@@ -1,16 +1,18 @@
 """Vanguard 크롤러 테스트"""
 from datetime import date, datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
+import respx
 from app.models.etf import ETF
 from app.services.crawlers.vanguard import VanguardCrawler
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_vanguard_response():
-    """Vanguard API 응답 샘플 데이터"""
+    """Vanguard API 응답 샘플 데이터 (모듈 내에서 공유하므로 수정하지 말 것)"""
     return {
         "size": 369,
         "self": {
@@ -100,9 +102,24 @@ def sample_vanguard_response():
     }
 
 
+@pytest.fixture(scope="module")
+def vanguard_response_bytes(sample_vanguard_response):
+    """모의 Vanguard API 응답 본문 (모듈당 한 번만 직렬화)"""
+    return orjson.dumps(sample_vanguard_response)
+
+
 @pytest.fixture
+def mocked_vanguard_api(vanguard_response_bytes):
+    """Vanguard API 요청을 샘플 응답으로 대체하는 respx 라우트"""
+    with respx.mock(assert_all_called=False) as router:
+        yield router.get(VanguardCrawler.BASE_URL).mock(
+            return_value=httpx.Response(200, content=vanguard_response_bytes)
+        )
+
+
+@pytest.fixture(scope="module")
 def crawler():
-    """VanguardCrawler 인스턴스"""
+    """VanguardCrawler 인스턴스 (상태가 없으므로 모듈 내에서 공유)"""
     return VanguardCrawler()
 
 
@@ -129,6 +146,26 @@ class TestVanguardCrawler:
         
         # 잘못된 형식
         assert crawler._parse_date("invalid") is None
+        
+        # 형식은 맞지만 존재하지 않는 날짜
+        assert crawler._parse_date("2025-02-30T00:00:00-05:00") is None
+    
+    @pytest.mark.parametrize(
+        "date_str, expected",
+        [
+            ("2025-11-28", date(2025, 11, 28)),
+            ("2025-11-28T00:00:00Z", date(2025, 11, 28)),
+            ("2025-11-28T09:30", date(2025, 11, 28)),
+            ("2025-11-28garbage", None),  # 날짜 뒤의 임의 문자열
+            ("2025-11-28T25:00:00", None),  # 잘못된 시각
+            ("+025-11-28", None),  # int()는 허용하지만 ISO 형식이 아닌 부호/공백/밑줄
+            (" 025-11-28", None),
+            ("2_25-11-28", None),
+        ],
+    )
+    def test_parse_date_strict(self, crawler, date_str, expected):
+        """빠른 경로가 fromisoformat보다 넓은 입력을 허용하지 않는지 테스트"""
+        assert crawler._parse_date(date_str) == expected
     
     def test_extract_etf_data_valid(self, crawler, sample_vanguard_response):
         """유효한 ETF 데이터 추출 테스트"""
@@ -175,19 +212,12 @@ class TestVanguardCrawler:
         assert etf is None
     
     @pytest.mark.asyncio
-    async def test_fetch_data_mock(self, crawler, sample_vanguard_response):
+    async def test_fetch_data_mock(self, crawler, sample_vanguard_response, mocked_vanguard_api):
         """fetch_data 메서드 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_vanguard_response
-        mock_response.raise_for_status = MagicMock()
+        data = await crawler.fetch_data()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            data = await crawler.fetch_data()
-            
-            assert data == sample_vanguard_response
-            assert data['size'] == 369
+        assert data == sample_vanguard_response
+        assert data['size'] == 369
     
     @pytest.mark.asyncio
     async def test_parse_data(self, crawler, sample_vanguard_response):
@@ -206,20 +236,13 @@ class TestVanguardCrawler:
         assert etf_list[1].fund_name == "Vanguard S&P 500 ETF"
     
     @pytest.mark.asyncio
-    async def test_crawl_integration_mock(self, crawler, sample_vanguard_response):
+    async def test_crawl_integration_mock(self, crawler, mocked_vanguard_api):
         """전체 크롤링 프로세스 통합 테스트 (Mock)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = sample_vanguard_response
-        mock_response.raise_for_status = MagicMock()
+        etf_list = await crawler.crawl()
         
-        with patch('httpx.AsyncClient') as mock_client:
-            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
-            
-            etf_list = await crawler.crawl()
-            
-            assert len(etf_list) == 2
-            assert all(isinstance(etf, ETF) for etf in etf_list)
-            assert all(etf.ticker for etf in etf_list)
+        assert len(etf_list) == 2
+        assert all(isinstance(etf, ETF) for etf in etf_list)
+        assert all(etf.ticker for etf in etf_list)
 
 
 class TestVanguardCrawlerIntegration:
@@ -1,20 +1,25 @@
 """Yieldmax 크롤러 테스트"""
 from datetime import datetime
 from decimal import Decimal
-from unittest.mock import AsyncMock, patch
 
 import httpx
 import pytest
+import respx
 from app.models.etf import ETF, DistributionFrequency
 from app.services.crawlers.yieldmax import YieldmaxCrawler
 
 
+@pytest.fixture(scope="module")
+def crawler():
+    """YieldmaxCrawler 인스턴스 (상태가 없으므로 모듈 내에서 공유)"""
+    return YieldmaxCrawler()
+
+
 class TestYieldmaxCrawlerInit:
     """크롤러 초기화 테스트"""
     
-    def test_base_url(self):
+    def test_base_url(self, crawler):
         """BASE_URL이 올바르게 설정되어 있는지 확인"""
-        crawler = YieldmaxCrawler()
         assert crawler.BASE_URL == "https://yieldmaxetfs.com/our-etfs/"
 
 
@@ -22,10 +27,8 @@ class TestYieldmaxCrawlerFetch:
     """데이터 가져오기 테스트"""
     
     @pytest.mark.asyncio
-    async def test_fetch_data_success(self):
+    async def test_fetch_data_success(self, crawler):
         """정상적으로 HTML을 가져오는지 테스트"""
-        crawler = YieldmaxCrawler()
-        
         mock_html = """
         <html>
             <div id="fundsTableWrap">
@@ -37,24 +40,18 @@ class TestYieldmaxCrawlerFetch:
         </html>
         """
         
-        mock_response = AsyncMock()
-        mock_response.text = mock_html
-        mock_response.raise_for_status = AsyncMock()
-        
-        with patch("httpx.AsyncClient.get", return_value=mock_response):
+        with respx.mock:
+            respx.get(crawler.BASE_URL).mock(return_value=httpx.Response(200, text=mock_html))
             html = await crawler.fetch_data()
-            assert "fundsTableWrap" in html
+        
+        assert "fundsTableWrap" in html
     
     @pytest.mark.asyncio
-    async def test_fetch_data_http_error(self):
+    async def test_fetch_data_http_error(self, crawler):
         """HTTP 오류 발생 시 예외가 발생하는지 테스트"""
-        crawler = YieldmaxCrawler()
-        
-        with patch("httpx.AsyncClient.get", side_effect=httpx.HTTPStatusError(
-            "404 Not Found",
-            request=AsyncMock(),
-            response=AsyncMock(status_code=404)
-        )):
+        with respx.mock:
+            respx.get(crawler.BASE_URL).mock(return_value=httpx.Response(404))
+            
             with pytest.raises(httpx.HTTPStatusError):
                 await crawler.fetch_data()
 
@@ -63,10 +60,8 @@ class TestYieldmaxCrawlerParse:
     """HTML 파싱 테스트"""
     
     @pytest.mark.asyncio
-    async def test_parse_data_with_mock_table(self):
+    async def test_parse_data_with_mock_table(self, crawler):
         """모의 테이블 데이터를 파싱하는지 테스트"""
-        crawler = YieldmaxCrawler()
-        
         mock_html = """
         <html>
             <div id="fundsTableWrap">
@@ -119,10 +114,8 @@ class TestYieldmaxCrawlerParse:
         assert etfs[1].detail_page_url == "https://yieldmaxetfs.com/etfs/msty"
     
     @pytest.mark.asyncio
-    async def test_parse_data_empty_table(self):
+    async def test_parse_data_empty_table(self, crawler):
         """빈 테이블을 안전하게 처리하는지 테스트"""
-        crawler = YieldmaxCrawler()
-        
         mock_html = """
         <html>
             <div id="fundsTableWrap">
@@ -138,10 +131,8 @@ class TestYieldmaxCrawlerParse:
         assert etfs == []
     
     @pytest.mark.asyncio
-    async def test_parse_data_no_table(self):
+    async def test_parse_data_no_table(self, crawler):
         """테이블이 없는 HTML을 안전하게 처리하는지 테스트"""
-        crawler = YieldmaxCrawler()
-        
         mock_html = "<html><body>No table here</body></html>"
         
         etfs = await crawler.parse_data(mock_html)
@@ -151,20 +142,16 @@ class TestYieldmaxCrawlerParse:
 class TestYieldmaxCrawlerHelpers:
     """헬퍼 메서드 테스트"""
     
-    def test_parse_expense_ratio(self):
+    def test_parse_expense_ratio(self, crawler):
         """Expense ratio 파싱 테스트"""
-        crawler = YieldmaxCrawler()
-        
         assert crawler._parse_expense_ratio("0.99%") == 0.99
         assert crawler._parse_expense_ratio("1.15%") == 1.15
         assert crawler._parse_expense_ratio("0.5%") == 0.5
         assert crawler._parse_expense_ratio("") is None
         assert crawler._parse_expense_ratio("N/A") is None
     
-    def test_parse_aum(self):
+    def test_parse_aum(self, crawler):
         """AUM 파싱 테스트"""
-        crawler = YieldmaxCrawler()
-        
         # Billions
         assert crawler._parse_aum("$1.5B") == 1500.0
         assert crawler._parse_aum("$2B") == 2000.0
@@ -180,10 +167,8 @@ class TestYieldmaxCrawlerHelpers:
         assert crawler._parse_aum("") is None
         assert crawler._parse_aum("N/A") is None
     
-    def test_parse_inception_date(self):
+    def test_parse_inception_date(self, crawler):
         """Inception date 파싱 테스트"""
-        crawler = YieldmaxCrawler()
-        
         # MM/DD/YYYY 형식
         date1 = crawler._parse_inception_date("11/01/2022")
         assert date1 == datetime(2022, 11, 1)
@@ -199,6 +184,7 @@ class TestYieldmaxCrawlerHelpers:
         # Edge cases
         assert crawler._parse_inception_date("") is None
         assert crawler._parse_inception_date("Invalid") is None
+        assert crawler._parse_inception_date("02/30/2023") is None
 
 
 @pytest.mark.integration
@@ -207,15 +193,13 @@ class TestYieldmaxCrawlerIntegration:
     
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="JavaScript 렌더링 필요 - Playwright/Selenium 구현 후 활성화")
-    async def test_fetch_and_parse_real_data(self):
+    async def test_fetch_and_parse_real_data(self, crawler):
         """
         실제 Yieldmax API에서 데이터를 가져와 파싱하는 통합 테스트
         
         Note: 현재는 JavaScript 렌더링이 필요하므로 skip 처리
         Playwright/Selenium 구현 후 활성화 필요
         """
-        crawler = YieldmaxCrawler()
-        
         html = await crawler.fetch_data()
         etfs = await crawler.parse_data(html)
         
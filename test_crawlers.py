@@ -5,6 +5,7 @@ import sys
 sys.path.insert(0, 'backend')
 
 from app.services.crawlers.alphaarchitect import AlphaArchitectCrawler
+from app.services.crawlers.base import BaseCrawler
 from app.services.crawlers.direxion import DirexionCrawler
 from app.services.crawlers.firsttrust import FirstTrustCrawler
 from app.services.crawlers.franklintempleton import FranklinTempletonCrawler
@@ -13,25 +14,38 @@ from app.services.crawlers.invesco import InvescoCrawler
 from app.services.crawlers.pimco import PIMCOCrawler
 from app.services.crawlers.roundhill import RoundhillCrawler
 
+# Max crawlers running at once (keeps load on provider sites bounded)
+MAX_CONCURRENT_CRAWLERS = 4
 
-async def test_crawler(name, crawler_class):
+
+async def test_crawler(name, crawler_class, sem):
     """Test a single crawler"""
+    try:
+        crawler = crawler_class()
+        async with sem:
+            etfs = await crawler.crawl()
+    except Exception as e:
+        etfs = e
+    
+    # Crawlers run concurrently, so print each report only once its crawl is done
     print(f"\n{'='*80}")
     print(f"Testing {name} Crawler")
     print('='*80)
     
     try:
-        crawler = crawler_class()
-        etfs = await crawler.crawl()
+        if isinstance(etfs, Exception):
+            raise etfs
         
         if not etfs:
             print(f"⚠️  No ETFs collected")
             return None
         
-        # Calculate statistics
+        # Calculate statistics in a single pass (None and Decimal zero are both falsy)
         total = len(etfs)
-        with_nav = sum(1 for etf in etfs if etf.nav_amount and etf.nav_amount != 0)
-        with_expense = sum(1 for etf in etfs if etf.expense_ratio and etf.expense_ratio != 0)
+        with_nav = with_expense = 0
+        for etf in etfs:
+            with_nav += bool(etf.nav_amount)
+            with_expense += bool(etf.expense_ratio)
         
         nav_percent = with_nav / total * 100 if total > 0 else 0
         expense_percent = with_expense / total * 100 if total > 0 else 0
@@ -74,35 +88,45 @@ async def main():
         ('Direxion', DirexionCrawler),
     ]
     
-    results = []
-    for name, crawler_class in crawlers:
-        result = await test_crawler(name, crawler_class)
-        if result:
-            results.append(result)
+    sem = asyncio.Semaphore(MAX_CONCURRENT_CRAWLERS)
+    try:
+        outcomes = await asyncio.gather(
+            *(test_crawler(name, crawler_class, sem) for name, crawler_class in crawlers),
+            return_exceptions=True,
+        )
+    finally:
+        # Close the HTTP client the crawlers share (pooled connections / TLS sessions)
+        await BaseCrawler.close_client()
+    results = [result for result in outcomes if result and not isinstance(result, BaseException)]
     
-    # Print summary
-    print(f"\n\n{'='*80}")
-    print("SUMMARY - NAV Enrichment Results")
-    print('='*80)
-    print(f"{'Provider':<20} {'Total':>8} {'With NAV':>10} {'NAV %':>10} {'Expense %':>12}")
-    print('-'*80)
+    # Build the summary table and write it with a single print
+    lines = [
+        f"\n\n{'='*80}",
+        "SUMMARY - NAV Enrichment Results",
+        '='*80,
+        f"{'Provider':<20} {'Total':>8} {'With NAV':>10} {'NAV %':>10} {'Expense %':>12}",
+        '-'*80,
+    ]
     
     total_all = 0
     total_nav = 0
     total_expense = 0
     
     for result in results:
-        print(f"{result['name']:<20} {result['total']:>8} {result['with_nav']:>10} "
-              f"{result['nav_percent']:>9.1f}% {result['expense_percent']:>11.1f}%")
+        lines.append(f"{result['name']:<20} {result['total']:>8} {result['with_nav']:>10} "
+                     f"{result['nav_percent']:>9.1f}% {result['expense_percent']:>11.1f}%")
         total_all += result['total']
         total_nav += result['with_nav']
         total_expense += result['with_expense']
     
-    print('='*80)
     overall_nav = total_nav / total_all * 100 if total_all > 0 else 0
     overall_expense = total_expense / total_all * 100 if total_all > 0 else 0
-    print(f"{'TOTAL':<20} {total_all:>8} {total_nav:>10} {overall_nav:>9.1f}% {overall_expense:>11.1f}%")
-    print('='*80)
+    lines += [
+        '='*80,
+        f"{'TOTAL':<20} {total_all:>8} {total_nav:>10} {overall_nav:>9.1f}% {overall_expense:>11.1f}%",
+        '='*80,
+    ]
+    print("\n".join(lines))
 
 
 if __name__ == '__main__':